@@ -114,9 +114,11 @@ class RelayProjectConfigsEndpoint(Endpoint):
 
         proj_configs = {}
         pending = []
+        cached_configs = projectconfig_cache.backend.get_many(public_keys)
         for key in public_keys:
-            computed = self._get_cached_or_schedule(key)
+            computed = cached_configs.get(key)
             if not computed:
+                schedule_build_project_config(public_key=key)
                 pending.append(key)
             else:
                 proj_configs[key] = computed
@@ -129,20 +131,6 @@ class RelayProjectConfigsEndpoint(Endpoint):
         metrics.incr("relay.project_configs.post_v3.fetched", amount=len(proj_configs))
         return {"configs": proj_configs, "pending": pending}
 
-    def _get_cached_or_schedule(self, public_key) -> dict | None:
-        """
-        Returns the config of a project if it's in the cache; else, schedules a
-        task to compute and write it into the cache.
-
-        Debouncing of the project happens after the task has been scheduled.
-        """
-        cached_config = projectconfig_cache.backend.get(public_key)
-        if cached_config:
-            return cached_config
-
-        schedule_build_project_config(public_key=public_key)
-        return None
-
     def _post_by_key(self, request: Request) -> MutableMapping[str, ProjectConfig]:
         public_keys = request.relay_request_data.get("publicKeys")
         public_keys = set(public_keys or ())
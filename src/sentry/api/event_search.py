@@ -5,7 +5,7 @@ from collections import namedtuple
 from collections.abc import Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from functools import reduce
+from functools import lru_cache, reduce
 from typing import Any, Literal, NamedTuple, Union
 
 from django.utils.functional import cached_property
@@ -1232,6 +1232,20 @@ QueryOp = Literal["AND", "OR"]
 QueryToken = Union[SearchFilter, QueryOp, ParenExpression]
 
 
+#: Number of parse trees kept by `parse_search_query`.
+PARSE_TREE_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=PARSE_TREE_CACHE_SIZE)
+def _parse_tree(query: str) -> Node:
+    """
+    The parse tree of a query. Trees only depend on the query and aren't modified by visitors, so
+    the trees of repeated queries are shared. Their visited results aren't, as they also depend on
+    the config, params and builder and relative dates on the current time.
+    """
+    return event_search_grammar.parse(query)
+
+
 def parse_search_query(
     query, config=None, params=None, builder=None, config_overrides=None
 ) -> list[
@@ -1241,7 +1255,7 @@ def parse_search_query(
         config = default_config
 
     try:
-        tree = event_search_grammar.parse(query)
+        tree = _parse_tree(query)
     except IncompleteParseError as e:
         idx = e.column()
         prefix = query[max(0, idx - 5) : idx]
@@ -20,6 +20,7 @@ from sentry import analytics, features, options
 from sentry.api.serializers import serialize
 from sentry.api.serializers.models.actor import ActorSerializer, ActorSerializerResponse
 from sentry.db.models.query import create_or_update
+from sentry.grouping.ingest.grouphash_cache import invalidate_grouphash_cache
 from sentry.hybridcloud.rpc import coerce_id_from
 from sentry.integrations.tasks.kick_off_status_syncs import kick_off_status_syncs
 from sentry.issues.grouptype import GroupCategory
@@ -96,6 +97,7 @@ def handle_discard(
                 GroupHash.objects.filter(group=group).update(
                     group=None, group_tombstone_id=tombstone.id
                 )
+                invalidate_grouphash_cache([group.project_id])
 
     for project in projects:
         delete_group_list(
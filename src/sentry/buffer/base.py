@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Any
 
-from django.db.models import Expression, F
+from django.db.models import F
 
 from sentry.db import models
 from sentry.signals import buffer_incr_complete
@@ -148,26 +148,14 @@ class Buffer(Service):
         extra: dict[str, Any] | None = None,
         signal_only: bool | None = None,
     ) -> None:
-        from sentry.event_manager import ScoreClause
         from sentry.models.group import Group
 
         created = False
 
         if not signal_only:
-            update_kwargs: dict[str, Expression] = {c: F(c) + v for c, v in columns.items()}
-
-            if extra:
-                update_kwargs.update(extra)
+            update_kwargs = self._get_update_kwargs(model, columns, extra)
 
-            # HACK(dcramer): this is gross, but we don't have a good hook to compute this property today
-            # XXX(dcramer): remove once we can replace 'priority' with something reasonable via Snuba
             if model is Group:
-                if "last_seen" in update_kwargs and "times_seen" in update_kwargs:
-                    update_kwargs["score"] = ScoreClause(
-                        group=None,
-                        times_seen=update_kwargs["times_seen"],
-                        last_seen=update_kwargs["last_seen"],
-                    )
                 # XXX: create_or_update doesn't fire `post_save` signals, and so this update never
                 # ends up in the cache. This causes issues when handling issue alerts, and likely
                 # elsewhere. Use `update` here since we're already special casing, and we know that
@@ -192,3 +180,29 @@ class Buffer(Service):
             created=created,
             sender=model,
         )
+
+    def _get_update_kwargs(
+        self,
+        model: type[models.Model],
+        columns: dict[str, int],
+        extra: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        from sentry.event_manager import ScoreClause
+        from sentry.models.group import Group
+
+        update_kwargs: dict[str, Any] = {c: F(c) + v for c, v in columns.items()}
+
+        if extra:
+            update_kwargs.update(extra)
+
+        # HACK(dcramer): this is gross, but we don't have a good hook to compute this property today
+        # XXX(dcramer): remove once we can replace 'priority' with something reasonable via Snuba
+        if model is Group:
+            if "last_seen" in update_kwargs and "times_seen" in update_kwargs:
+                update_kwargs["score"] = ScoreClause(
+                    group=None,
+                    times_seen=update_kwargs["times_seen"],
+                    last_seen=update_kwargs["last_seen"],
+                )
+
+        return update_kwargs
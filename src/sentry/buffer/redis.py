@@ -2,19 +2,24 @@ from __future__ import annotations
 
 import logging
 import pickle
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from time import time
 from typing import Any, TypeVar
 
 import rb
+from django.db import connections
 from django.utils.encoding import force_bytes, force_str
 from rediscluster import RedisCluster
 
+from sentry import options
 from sentry.buffer.base import Buffer
 from sentry.db import models
+from sentry.signals import buffer_incr_complete
 from sentry.tasks.process_buffer import process_incr
 from sentry.utils import json, metrics
 from sentry.utils.hashlib import md5_text
@@ -36,6 +41,12 @@ _last_validation_log: float | None = None
 Pipeline = Any
 # TODO type Pipeline instead of using Any here
 
+# Leading character of values written with the compact encoding, doubling as its version. It can't
+# be confused with the legacy formats, which are JSON (`[` or `{`) or pickle (`\x80` or a printable
+# protocol 0 opcode).
+COMPACT_ENCODING_V1 = "\x01"
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
 
 def _get_model_key(model: type[models.Model]) -> str:
     return str(model._meta)
@@ -94,6 +105,35 @@ class PendingBufferValue:
     generate_queue: ChooseQueueFunction | None
 
 
+@dataclass
+class BufferedIncr:
+    """
+    The decoded contents of a single buffered `incr` key, ready to be flushed to the database.
+    """
+
+    key: str
+    model: type[models.Model]
+    columns: dict[str, int]
+    filters: dict[str, Any]
+    extra: dict[str, Any]
+    signal_only: bool | None
+
+    @property
+    def group_id(self) -> int | None:
+        """
+        The id of the group being updated, if this is a plain counter update of a single `Group`
+        row, in which case it can be flushed together with other groups.
+        """
+        from sentry.models.group import Group
+
+        if self.model is not Group or self.signal_only or len(self.filters) != 1:
+            return None
+        ((column, value),) = self.filters.items()
+        if column not in ("id", "pk") or not isinstance(value, int):
+            return None
+        return value
+
+
 class PendingBufferRouter:
     def __init__(self, incr_batch_size: int) -> None:
         self.incr_batch_size = incr_batch_size
@@ -323,6 +363,105 @@ class RedisBuffer(Buffer):
         else:
             raise TypeError(f"invalid type: {type_}")
 
+    @classmethod
+    def _is_compact(cls, value: str | bytes) -> bool:
+        return value[:1] in (b"\x01", COMPACT_ENCODING_V1)
+
+    @classmethod
+    def _is_compact_encodable(cls, value: Any) -> bool:
+        return isinstance(value, (str, datetime, date, int, float))
+
+    def _dump_legacy_values(self, values: dict[str, Any]) -> str | bytes:
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            return json.dumps(self._dump_values(values))
+        return pickle.dumps(values)
+
+    def _dump_legacy_value(self, value: Any) -> str | bytes:
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            return json.dumps(self._dump_value(value))
+        return pickle.dumps(value)
+
+    @classmethod
+    def _dump_compact_values(cls, values: dict[str, Any]) -> str:
+        """
+        Encodes a flat dict as `<version>m` followed by length-prefixed keys and compact values.
+        """
+        parts = [COMPACT_ENCODING_V1, "m"]
+        for k, v in values.items():
+            value = cls._dump_compact_value(v)
+            parts.append(f"{len(k)}:{k}{len(value)}:{value}")
+        return "".join(parts)
+
+    @classmethod
+    def _dump_compact_value(cls, value: str | datetime | date | int | float) -> str:
+        """
+        Encodes a value as `<version><type><payload>`. Unlike `_dump_value` there's no JSON around
+        the payload, and datetimes and dates are stored as integers. The result is still valid
+        UTF-8, as the Redis Cluster client decodes responses.
+
+        Only scalars are supported, see `_is_compact_encodable`. Anything else, such as
+        `Group.data`, has to be written with the legacy encoding.
+        """
+        if isinstance(value, str):
+            type_, payload = "s", value
+        elif isinstance(value, bool):
+            type_, payload = "b", "1" if value else "0"
+        elif isinstance(value, datetime):
+            if value.tzinfo is None:
+                # Interpret naive datetimes in local time, as `_dump_value` does
+                value = value.astimezone()
+            type_, payload = "t", str((value - _EPOCH) // timedelta(microseconds=1))
+        elif isinstance(value, date):
+            type_, payload = "d", str(value.toordinal())
+        elif isinstance(value, int):
+            type_, payload = "i", str(value)
+        elif isinstance(value, float):
+            type_, payload = "f", repr(value)
+        else:
+            raise TypeError(type(value))
+        return f"{COMPACT_ENCODING_V1}{type_}{payload}"
+
+    @classmethod
+    def _load_compact_values(cls, payload: str | bytes) -> dict[str, Any]:
+        payload = force_str(payload)
+        if payload[:2] != f"{COMPACT_ENCODING_V1}m":
+            raise TypeError(f"invalid compact mapping: {payload[:2]!r}")
+
+        result = {}
+        pos = 2
+        while pos < len(payload):
+            sep = payload.index(":", pos)
+            end = sep + 1 + int(payload[pos:sep])
+            key = payload[sep + 1 : end]
+            sep = payload.index(":", end)
+            pos = sep + 1 + int(payload[end:sep])
+            result[key] = cls._load_compact_value(payload[sep + 1 : pos])
+        return result
+
+    @classmethod
+    def _load_compact_value(
+        cls, payload: str | bytes
+    ) -> str | datetime | date | bool | int | float:
+        payload = force_str(payload)
+        if payload[:1] != COMPACT_ENCODING_V1:
+            raise TypeError(f"invalid compact encoding version: {payload[:1]!r}")
+
+        type_, value = payload[1:2], payload[2:]
+        if type_ == "s":
+            return value
+        elif type_ == "t":
+            return _EPOCH + timedelta(microseconds=int(value))
+        elif type_ == "d":
+            return date.fromordinal(int(value))
+        elif type_ == "b":
+            return value == "1"
+        elif type_ == "i":
+            return int(value)
+        elif type_ == "f":
+            return float(value)
+        else:
+            raise TypeError(f"invalid type: {type_}")
+
     def get(
         self,
         model: type[models.Model],
@@ -470,12 +609,16 @@ class RedisBuffer(Buffer):
         # keys (one per Redis partition)
         pipe = self.get_redis_connection(key)
         pipe.hsetnx(key, "m", f"{model.__module__}.{model.__name__}")
-        _validate_json_roundtrip(filters, model)
 
-        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-            pipe.hsetnx(key, "f", json.dumps(self._dump_values(filters)))
+        # Readers understand both encodings, so this can be flipped either way at any time
+        compact_encoding = options.get("buffer.compact-encoding")
+
+        # Values the compact encoding can't represent fall back to the legacy one, value by value
+        if compact_encoding and all(map(self._is_compact_encodable, filters.values())):
+            pipe.hsetnx(key, "f", self._dump_compact_values(filters))
         else:
-            pipe.hsetnx(key, "f", pickle.dumps(filters))
+            _validate_json_roundtrip(filters, model)
+            pipe.hsetnx(key, "f", self._dump_legacy_values(filters))
 
         for column, amount in columns.items():
             pipe.hincrby(key, "i+" + column, amount)
@@ -484,18 +627,25 @@ class RedisBuffer(Buffer):
             # Group tries to serialize 'score', so we'd need some kind of processing
             # hook here
             # e.g. "update score if last_seen or times_seen is changed"
-            _validate_json_roundtrip(extra, model)
+            legacy_extra = {
+                column: value
+                for column, value in extra.items()
+                if not compact_encoding or not self._is_compact_encodable(value)
+            }
+            if legacy_extra:
+                _validate_json_roundtrip(legacy_extra, model)
             for column, value in extra.items():
-                if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-                    pipe.hset(key, "e+" + column, json.dumps(self._dump_value(value)))
+                if column in legacy_extra:
+                    pipe.hset(key, "e+" + column, self._dump_legacy_value(value))
                 else:
-                    pipe.hset(key, "e+" + column, pickle.dumps(value))
+                    pipe.hset(key, "e+" + column, self._dump_compact_value(value))
 
         if signal_only is True:
             pipe.hset(key, "s", "1")
 
         pipe.expire(key, self.key_expire)
-        pipe.zadd(self.pending_key, {key: time()})
+        # Keep the score of keys which are already pending, so it's the time they first became pending
+        pipe.zadd(self.pending_key, {key: time()}, nx=True)
         pipe.execute()
 
         metrics.incr(
@@ -538,9 +688,17 @@ class RedisBuffer(Buffer):
 
         try:
             keycount = 0
+            # `incr` scores pending keys with the time they first became pending, so the lowest
+            # score tells us how far behind flushing is
+            oldest_score: float | None = None
             if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-                keys: list[str] = self.cluster.zrange(self.pending_key, 0, -1)
+                keys_with_scores: list[tuple[str, float]] = self.cluster.zrange(
+                    self.pending_key, 0, -1, withscores=True
+                )
+                keys = [key for key, _ in keys_with_scores]
                 keycount += len(keys)
+                if keys_with_scores:
+                    oldest_score = keys_with_scores[0][1]
 
                 for key in keys:
                     model_key = self._extract_model_from_key(key=key)
@@ -557,13 +715,17 @@ class RedisBuffer(Buffer):
                 self.cluster.zrem(self.pending_key, *keys)
             elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
                 with self.cluster.all() as conn:
-                    results = conn.zrange(self.pending_key, 0, -1)
+                    results = conn.zrange(self.pending_key, 0, -1, withscores=True)
 
                 with self.cluster.all() as conn:
-                    for host_id, keysb in results.value.items():
-                        if not keysb:
+                    for host_id, keysb_with_scores in results.value.items():
+                        if not keysb_with_scores:
                             continue
+                        keysb = [keyb for keyb, _ in keysb_with_scores]
                         keycount += len(keysb)
+                        host_oldest_score = keysb_with_scores[0][1]
+                        if oldest_score is None or host_oldest_score < oldest_score:
+                            oldest_score = host_oldest_score
                         for keyb in keysb:
                             key = keyb.decode("utf-8")
                             model_key = self._extract_model_from_key(key=key)
@@ -598,6 +760,8 @@ class RedisBuffer(Buffer):
                     )
 
             metrics.distribution("buffer.pending-size", keycount)
+            if oldest_score is not None:
+                metrics.timing("buffer.pending-age", max(time() - oldest_score, 0))
         finally:
             client.delete(lock_key)
 
@@ -609,8 +773,11 @@ class RedisBuffer(Buffer):
             batch_keys = [key]
 
         if batch_keys is not None:
-            for key in batch_keys:
-                self._process_single_incr(key)
+            if len(batch_keys) > 1:
+                self._process_batch(batch_keys)
+            else:
+                for key in batch_keys:
+                    self._process_single_incr(key)
 
     def _process(
         self,
@@ -637,39 +804,213 @@ class RedisBuffer(Buffer):
             pipe.delete(key)
             values = pipe.execute()[0]
 
-            # XXX(python3): In python2 this isn't as important since redis will
-            # return string tyes (be it, byte strings), but in py3 we get bytes
-            # back, and really we just want to deal with keys as strings.
-            values = {force_str(k): v for k, v in values.items()}
+            incr = self._load_incr(key, values)
+            if incr is not None:
+                self._process(incr.model, incr.columns, incr.filters, incr.extra, incr.signal_only)
+        finally:
+            client.delete(lock_key)
+
+    def _load_incr(self, key: str, values: dict[Any, Any]) -> BufferedIncr | None:
+        """
+        Decodes the hash written by `incr` for the given key.
+        """
+        # XXX(python3): In python2 this isn't as important since redis will
+        # return string tyes (be it, byte strings), but in py3 we get bytes
+        # back, and really we just want to deal with keys as strings.
+        values = {force_str(k): v for k, v in values.items()}
+
+        if not values:
+            metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
+            logger.debug("buffer.revoked.empty", extra={"redis_key": key})
+            return None
+
+        model = import_string(force_str(values.pop("m")))
+
+        if self._is_compact(values["f"]):
+            filters = self._load_compact_values(values.pop("f"))
+        elif values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
+            filters = self._load_values(json.loads(force_str(values.pop("f"))))
+        else:
+            # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+            filters = pickle.loads(force_bytes(values.pop("f")))
+
+        incr_values = {}
+        extra_values = {}
+        signal_only = None
+        for k, v in values.items():
+            if k.startswith("i+"):
+                incr_values[k[2:]] = int(v)
+            elif k.startswith("e+"):
+                if self._is_compact(v):
+                    extra_values[k[2:]] = self._load_compact_value(v)
+                elif v.startswith(b"[" if not self.is_redis_cluster else "["):
+                    extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
+                else:
+                    # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+                    extra_values[k[2:]] = pickle.loads(force_bytes(v))
+            elif k == "s":
+                signal_only = bool(int(v))  # Should be 1 if set
+
+        return BufferedIncr(
+            key=key,
+            model=model,
+            columns=incr_values,
+            filters=filters,
+            extra=extra_values,
+            signal_only=signal_only,
+        )
+
+    def _execute_per_key(
+        self, keys: Sequence[str], commands: Callable[[Pipeline, str], None]
+    ) -> dict[str, list[Any]]:
+        """
+        Issues `commands` for every key using one non-transactional pipeline per Redis host (or a
+        single one for Redis Cluster), so that a batch of keys costs one round-trip per host rather
+        than several per key. Returns the results of the commands issued for each key.
+
+        `commands` must issue the same number of commands for every key, and only for that key or
+        for keys which live on the same host (such as the pending set).
+        """
+        pipelines: list[tuple[Pipeline, list[str]]] = []
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            pipelines.append((self.cluster.pipeline(transaction=False), list(keys)))
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            router = self.cluster.get_router()
+            keys_by_host: dict[int, list[str]] = defaultdict(list)
+            for key in keys:
+                keys_by_host[router.get_host_for_key(key)].append(key)
+            for host_id, host_keys in keys_by_host.items():
+                client = self.cluster.get_local_client(host_id)
+                pipelines.append((client.pipeline(transaction=False), host_keys))
+        else:
+            raise AssertionError("unreachable")
+
+        results: dict[str, list[Any]] = {}
+        for pipe, pipe_keys in pipelines:
+            for key in pipe_keys:
+                commands(pipe, key)
+            pipe_results = pipe.execute()
+            per_key = len(pipe_results) // len(pipe_keys)
+            for i, key in enumerate(pipe_keys):
+                results[key] = pipe_results[i * per_key : (i + 1) * per_key]
+        return results
+
+    def _shard_incrs(
+        self, incrs: Sequence[BufferedIncr], num_shards: int
+    ) -> list[list[BufferedIncr]]:
+        """
+        Splits the given updates by model and by range of the key's hash, so that flush workers
+        never contend for the same rows.
+        """
+        shards: dict[tuple[str, int], list[BufferedIncr]] = defaultdict(list)
+        for incr in incrs:
+            hash_range = (int(md5_text(incr.key).hexdigest()[:8], 16) * num_shards) >> 32
+            shards[(_get_model_key(incr.model), hash_range)].append(incr)
+        return list(shards.values())
+
+    def _process_batch(self, batch_keys: Sequence[str]) -> None:
+        """
+        Flushes a batch of keys at once. Locking, reading and deleting the keys is pipelined, the
+        decoded updates are sharded by model and key hash range, and the shards are flushed by up to
+        `buffer.flush-workers` threads. See `_process_shard` for how each shard is written.
+        """
+        metrics.distribution("buffer.flush.batch-size", len(batch_keys))
 
-            if not values:
-                metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
-                logger.debug("buffer.revoked.empty", extra={"redis_key": key})
-                return
+        lock_results = self._execute_per_key(
+            batch_keys,
+            lambda pipe, key: pipe.set(self._make_lock_key(key), "1", nx=True, ex=10),
+        )
+        locked_keys = []
+        for key in batch_keys:
+            if lock_results[key][0]:
+                locked_keys.append(key)
+            else:
+                metrics.incr("buffer.revoked", tags={"reason": "locked"}, skip_internal=False)
+                logger.debug("buffer.revoked.locked", extra={"redis_key": key})
 
-            model = import_string(force_str(values.pop("m")))
+        if not locked_keys:
+            return
 
-            if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
-                filters = self._load_values(json.loads(force_str(values.pop("f"))))
+        def _read_and_delete(pipe: Pipeline, key: str) -> None:
+            pipe.hgetall(key)
+            pipe.zrem(self.pending_key, key)
+            pipe.delete(key)
+
+        try:
+            values_by_key = self._execute_per_key(locked_keys, _read_and_delete)
+            incrs = []
+            for key in locked_keys:
+                incr = self._load_incr(key, values_by_key[key][0])
+                if incr is not None:
+                    incrs.append(incr)
+
+            num_workers = max(options.get("buffer.flush-workers"), 1)
+            shards = self._shard_incrs(incrs, num_workers)
+            metrics.distribution("buffer.flush.shards", len(shards))
+
+            if num_workers == 1 or len(shards) == 1:
+                for shard in shards:
+                    self._process_shard(shard)
             else:
-                # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                filters = pickle.loads(force_bytes(values.pop("f")))
-
-            incr_values = {}
-            extra_values = {}
-            signal_only = None
-            for k, v in values.items():
-                if k.startswith("i+"):
-                    incr_values[k[2:]] = int(v)
-                elif k.startswith("e+"):
-                    if v.startswith(b"[" if not self.is_redis_cluster else "["):
-                        extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
-                    else:
-                        # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                        extra_values[k[2:]] = pickle.loads(force_bytes(v))
-                elif k == "s":
-                    signal_only = bool(int(v))  # Should be 1 if set
-
-            self._process(model, incr_values, filters, extra_values, signal_only)
+                with ThreadPoolExecutor(max_workers=min(num_workers, len(shards))) as executor:
+                    # Surface the first exception, as the serial path would
+                    for _ in executor.map(self._process_shard_in_thread, shards):
+                        pass
         finally:
-            client.delete(lock_key)
+            self._execute_per_key(
+                locked_keys, lambda pipe, key: pipe.delete(self._make_lock_key(key))
+            )
+
+    def _process_shard_in_thread(self, incrs: list[BufferedIncr]) -> None:
+        try:
+            self._process_shard(incrs)
+        finally:
+            # Database connections are per thread, don't leak the ones opened by this worker
+            connections.close_all()
+
+    def _process_shard(self, incrs: list[BufferedIncr]) -> None:
+        """
+        Writes one shard of buffered updates. Plain `Group` counter updates are loaded with a single
+        query, merged per row and applied in primary key order, which keeps the `post_save` signal
+        (and with it the group cache) intact while avoiding a SELECT per key. Everything else goes
+        through the regular per-key `process`.
+        """
+        from sentry.models.group import Group
+
+        group_incrs: dict[int, list[BufferedIncr]] = defaultdict(list)
+        for incr in incrs:
+            group_id = incr.group_id
+            if group_id is None:
+                self._process(incr.model, incr.columns, incr.filters, incr.extra, incr.signal_only)
+            else:
+                group_incrs[group_id].append(incr)
+
+        if not group_incrs:
+            return
+
+        metrics.distribution("buffer.flush.groups", len(group_incrs))
+        with metrics.timer("buffer.flush.groups.duration"):
+            groups = Group.objects.in_bulk(list(group_incrs))
+            for group_id in sorted(group_incrs):
+                row_incrs = group_incrs[group_id]
+                group = groups.get(group_id)
+                # If the group was deleted by the time we flush buffers we don't care, but the
+                # signal is still sent, as `process` would
+                if group is not None:
+                    columns: dict[str, int] = defaultdict(int)
+                    extra: dict[str, Any] = {}
+                    for incr in row_incrs:
+                        for column, amount in incr.columns.items():
+                            columns[column] += amount
+                        extra.update(incr.extra)
+                    group.update(using=None, **self._get_update_kwargs(Group, columns, extra))
+
+                for incr in row_incrs:
+                    buffer_incr_complete.send_robust(
+                        model=Group,
+                        columns=incr.columns,
+                        filters=incr.filters,
+                        extra=incr.extra,
+                        created=False,
+                        sender=Group,
+                    )
@@ -5,6 +5,7 @@ MAX_BATCH_SIZE = 8 * 1024 * 1024
 MAX_FRAGMENTS_PER_BATCH = 10
 EXPORTED_ROWS_LIMIT = 10000000
 SNUBA_MAX_RESULTS = 10000
+MAX_CONCURRENT_FRAGMENTS = 8
 DEFAULT_EXPIRATION = timedelta(weeks=4)
 
 
@@ -20,6 +21,15 @@ class ExportStatus(str, Enum):
     Expired = "EXPIRED"  # The download has been deleted
 
 
+class ExportFormat(str, Enum):
+    CSV = "csv"  # Comma separated values, the default
+    NDJSON_GZIP = "ndjson.gz"  # Gzip compressed newline delimited JSON
+
+    @property
+    def content_type(self) -> str:
+        return "application/gzip" if self == ExportFormat.NDJSON_GZIP else "text/csv"
+
+
 class ExportQueryType:
     ISSUES_BY_TAG = 0
     DISCOVER = 1
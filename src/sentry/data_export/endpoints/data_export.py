@@ -20,7 +20,7 @@ from sentry.snuba.dataset import Dataset
 from sentry.utils import metrics
 from sentry.utils.snuba import MAX_FIELDS
 
-from ..base import ExportQueryType
+from ..base import ExportFormat, ExportQueryType
 from ..models import ExportedData
 from ..processors.discover import DiscoverProcessor
 from ..tasks import assemble_download
@@ -37,11 +37,21 @@ SUPPORTED_DATASETS = {
 class DataExportQuerySerializer(serializers.Serializer):
     query_type = serializers.ChoiceField(choices=ExportQueryType.as_str_choices(), required=True)
     query_info = serializers.JSONField(required=True)
+    format = serializers.ChoiceField(
+        choices=[export_format.value for export_format in ExportFormat], required=False
+    )
 
     def validate(self, data):
         organization = self.context["organization"]
         query_info = data["query_info"]
 
+        # The format is part of the query info, as exports of the same query in different
+        # formats are different exports
+        export_format = data.get("format", ExportFormat.CSV)
+        query_info.pop("format", None)
+        if export_format != ExportFormat.CSV:
+            query_info["format"] = export_format
+
         # Validate the project field, if provided
         # A PermissionDenied error will be raised in `get_projects_by_id` if the request is invalid
         project_query = query_info.get("project")
@@ -55,7 +55,8 @@ class DataExportDetailsEndpoint(OrganizationEndpoint):
         file = data_export._get_file()
         raw_file = file.getfile()
         response = StreamingHttpResponse(
-            iter(lambda: raw_file.read(4096), b""), content_type="text/csv"
+            iter(lambda: raw_file.read(4096), b""),
+            content_type=data_export.export_format.content_type,
         )
         response["Content-Length"] = file.size
         response["Content-Disposition"] = f'attachment; filename="{file.name}"'
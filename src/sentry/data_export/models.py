@@ -22,7 +22,7 @@ from sentry.db.models import (
 from sentry.db.models.fields.hybrid_cloud_foreign_key import HybridCloudForeignKey
 from sentry.users.services.user.service import user_service
 
-from .base import DEFAULT_EXPIRATION, ExportQueryType, ExportStatus
+from .base import DEFAULT_EXPIRATION, ExportFormat, ExportQueryType, ExportStatus
 
 logger = logging.getLogger(__name__)
 
@@ -59,12 +59,16 @@ class ExportedData(Model):
         payload["export_type"] = ExportQueryType.as_str(self.query_type)
         return payload
 
+    @property
+    def export_format(self) -> ExportFormat:
+        return ExportFormat(self.query_info.get("format", ExportFormat.CSV))
+
     @property
     def file_name(self) -> str:
         date = self.date_added.strftime("%Y-%B-%d")
         export_type = ExportQueryType.as_str(self.query_type)
         # Example: Discover_2020-July-21_27.csv
-        return f"{export_type}_{date}_{self.id}.csv"
+        return f"{export_type}_{date}_{self.id}.{self.export_format.value}"
 
     @staticmethod
     def format_date(date) -> str | None:
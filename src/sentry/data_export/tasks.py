@@ -1,16 +1,21 @@
-import codecs
-import csv
+import contextvars
+import itertools
 import logging
+import math
 import tempfile
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from hashlib import sha1
 
 import sentry_sdk
 from celery import current_task
 from celery.exceptions import MaxRetriesExceededError
 from django.core.files.base import ContentFile
-from django.db import IntegrityError, router
+from django.db import IntegrityError, connections, router
 from django.utils import timezone
 
+from sentry import options
 from sentry.models.files.file import File
 from sentry.models.files.fileblob import FileBlob
 from sentry.models.files.fileblobindex import FileBlobIndex
@@ -24,6 +29,7 @@ from sentry.utils.sdk import capture_exception
 from .base import (
     EXPORTED_ROWS_LIMIT,
     MAX_BATCH_SIZE,
+    MAX_CONCURRENT_FRAGMENTS,
     MAX_FRAGMENTS_PER_BATCH,
     SNUBA_MAX_RESULTS,
     ExportError,
@@ -33,9 +39,14 @@ from .models import ExportedData, ExportedDataBlob
 from .processors.discover import DiscoverProcessor
 from .processors.issues_by_tag import IssuesByTagProcessor
 from .utils import handle_snuba_errors
+from .writers import write_fragment
 
 logger = logging.getLogger(__name__)
 
+_fragment_pool = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_FRAGMENTS, thread_name_prefix="data_export_fragment"
+)
+
 
 @instrumented_task(
     name="sentry.data_export.tasks.assemble_download",
@@ -77,6 +88,10 @@ def assemble_download(
         _set_data_on_scope(data_export)
 
         base_bytes_written = bytes_written
+        # the absolute row offset from the beginning of the export, which together with
+        # `bytes_written` is the checkpoint retries resume from
+        next_offset = offset
+        start_time = time.monotonic()
 
         try:
             # ensure that the export limit is set and capped at EXPORTED_ROWS_LIMIT
@@ -87,54 +102,39 @@ def assemble_download(
 
             processor = get_processor(data_export, environment_id)
 
-            with tempfile.TemporaryFile(mode="w+b") as tf:
-                # XXX(python3):
-                #
-                # In python3 we write unicode strings (which is all the csv
-                # module is able to do, it will NOT write bytes like in py2).
-                # Because of this we use the codec getwriter to transform our
-                # file handle to a stream writer that will encode to utf8.
-                tfw = codecs.getwriter("utf-8")(tf)
-
-                writer = csv.DictWriter(
-                    tfw, processor.header_fields, escapechar="\\", extrasaction="ignore"
-                )
-                if first_page:
-                    writer.writeheader()
-
-                # the position in the file at the end of the headers
-                starting_pos = tf.tell()
-
-                # the row offset relative to the start of the current task
-                # this offset tells you the number of rows written during this batch fragment
-                fragment_offset = 0
-
-                # the absolute row offset from the beginning of the export
-                next_offset = offset + fragment_offset
-
-                rows = []
-
-                for _ in range(MAX_FRAGMENTS_PER_BATCH):
-                    # the number of rows to export in the next batch fragment
-                    fragment_row_count = min(batch_size, max(export_limit - next_offset, 1))
-
-                    rows = process_rows(processor, data_export, fragment_row_count, next_offset)
-                    writer.writerows(rows)
+            rows = []
+            new_bytes_written = 0
 
-                    fragment_offset += len(rows)
-                    next_offset = offset + fragment_offset
-
-                    if (
-                        not rows
-                        or len(rows) < batch_size
-                        # the batch may exceed MAX_BATCH_SIZE but immediately stops
-                        or tf.tell() - starting_pos >= MAX_BATCH_SIZE
-                    ):
-                        break
+            fragments = iter_batch_fragments(
+                processor, data_export, batch_size, offset, export_limit
+            )
+            for rows in fragments:
+                # Every fragment is stored right away, so a failure doesn't lose the fragments
+                # before it
+                with tempfile.TemporaryFile(mode="w+b") as tf:
+                    write_fragment(
+                        data_export.export_format,
+                        tf,
+                        processor.header_fields,
+                        rows,
+                        include_header=next_offset == 0 and bytes_written == 0,
+                    )
+                    tf.seek(0)
+                    new_bytes_written = store_export_chunk_as_blob(data_export, bytes_written, tf)
+
+                if not new_bytes_written:
+                    break
 
-                tf.seek(0)
-                new_bytes_written = store_export_chunk_as_blob(data_export, bytes_written, tf)
                 bytes_written += new_bytes_written
+                next_offset += len(rows)
+
+                if (
+                    not rows
+                    or len(rows) < batch_size
+                    # the batch may exceed MAX_BATCH_SIZE but immediately stops
+                    or bytes_written - base_bytes_written >= MAX_BATCH_SIZE
+                ):
+                    break
         except ExportError as error:
             if error.recoverable and export_retries > 0:
                 assemble_download.apply_async(
@@ -142,8 +142,8 @@ def assemble_download(
                     kwargs={
                         "export_limit": export_limit,
                         "batch_size": batch_size // 2,
-                        "offset": offset,
-                        "bytes_written": base_bytes_written,
+                        "offset": next_offset,
+                        "bytes_written": bytes_written,
                         "environment_id": environment_id,
                         "export_retries": export_retries - 1,
                     },
@@ -161,7 +161,17 @@ def assemble_download(
             capture_exception(error)
 
             try:
-                current_task.retry()
+                current_task.retry(
+                    args=[data_export_id],
+                    kwargs={
+                        "export_limit": export_limit,
+                        "batch_size": batch_size,
+                        "offset": next_offset,
+                        "bytes_written": bytes_written,
+                        "environment_id": environment_id,
+                        "export_retries": export_retries,
+                    },
+                )
             except MaxRetriesExceededError:
                 metrics.incr(
                     "dataexport.end",
@@ -170,6 +180,12 @@ def assemble_download(
                 )
                 return data_export.email_failure(message="Internal processing failure")
         else:
+            _record_throughput(
+                data_export,
+                next_offset - offset,
+                bytes_written - base_bytes_written,
+                time.monotonic() - start_time,
+            )
             if (
                 rows
                 and len(rows) >= batch_size
@@ -196,6 +212,72 @@ def assemble_download(
                 merge_export_blobs.delay(data_export_id)
 
 
+def _record_throughput(data_export, row_count, byte_count, duration):
+    if duration <= 0:
+        return
+
+    tags = {
+        "query_type": ExportQueryType.as_str(data_export.query_type),
+        "format": data_export.export_format.value,
+    }
+    metrics.distribution("dataexport.rows_per_second", row_count / duration, tags=tags)
+    metrics.distribution(
+        "dataexport.bytes_per_second", byte_count / duration, tags=tags, unit="byte"
+    )
+
+
+def iter_batch_fragments(processor, data_export, batch_size, offset, export_limit):
+    """
+    Yields the rows of the batch fragments starting at the offset, up to MAX_FRAGMENTS_PER_BATCH
+    of them. The offsets of Discover fragments are known upfront, so several are fetched ahead
+    concurrently if enabled. The caller stops at the first fragment which isn't full, dropping
+    the fragments fetched past it.
+    """
+    remaining_rows = max(export_limit - offset, 1)
+    fragment_count = min(MAX_FRAGMENTS_PER_BATCH, math.ceil(remaining_rows / max(batch_size, 1)))
+
+    def fetch(fragment):
+        fragment_offset = offset + fragment * batch_size
+        # the number of rows to export in the batch fragment
+        fragment_row_count = min(batch_size, max(export_limit - fragment_offset, 1))
+        return process_rows(processor, data_export, fragment_row_count, fragment_offset)
+
+    concurrency = min(options.get("data-export.concurrent-fragments"), MAX_CONCURRENT_FRAGMENTS)
+    if concurrency <= 1 or data_export.query_type != ExportQueryType.DISCOVER:
+        for fragment in range(fragment_count):
+            yield fetch(fragment)
+        return
+
+    fragments = iter(range(fragment_count))
+    pending: deque[Future] = deque()
+
+    def submit_next(count):
+        for fragment in itertools.islice(fragments, count):
+            pending.append(
+                _fragment_pool.submit(
+                    contextvars.copy_context().run, _fetch_fragment_in_thread, fetch, fragment
+                )
+            )
+
+    try:
+        submit_next(concurrency)
+        while pending:
+            rows = pending.popleft().result()
+            submit_next(1)
+            yield rows
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _fetch_fragment_in_thread(fetch, fragment):
+    try:
+        return fetch(fragment)
+    finally:
+        # Database connections are per thread, don't leak the ones opened by this worker
+        connections.close_all()
+
+
 def get_processor(data_export, environment_id):
     try:
         if data_export.query_type == ExportQueryType.ISSUES_BY_TAG:
@@ -310,10 +392,11 @@ def merge_export_blobs(data_export_id, **kwargs):
                     router.db_for_write(FileBlobIndex),
                 )
             ):
+                export_format = data_export.export_format
                 file = File.objects.create(
                     name=data_export.file_name,
-                    type="export.csv",
-                    headers={"Content-Type": "text/csv"},
+                    type=f"export.{export_format.value}",
+                    headers={"Content-Type": export_format.content_type},
                 )
                 size = 0
                 file_checksum = sha1(b"")
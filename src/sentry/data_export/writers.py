@@ -0,0 +1,45 @@
+import codecs
+import csv
+import gzip
+from collections.abc import Mapping, Sequence
+from typing import IO, Any
+
+import orjson
+
+from .base import ExportFormat
+
+
+def write_fragment(
+    export_format: ExportFormat,
+    fileobj: IO[bytes],
+    header_fields: Sequence[str],
+    rows: Sequence[Mapping[str, Any]],
+    include_header: bool,
+) -> None:
+    """
+    Write the rows of a batch fragment. Fragments are stored as they are, and the export file is
+    their concatenation, so each fragment has to be valid on its own when appended to the previous.
+    """
+    if export_format == ExportFormat.NDJSON_GZIP:
+        # Concatenated gzip members are a valid gzip file. Without a timestamp in the header,
+        # rewriting a fragment on retry produces the same blob.
+        with gzip.GzipFile(fileobj=fileobj, mode="wb", mtime=0) as f:
+            for row in rows:
+                f.write(orjson.dumps({field: row.get(field) for field in header_fields}) + b"\n")
+        return
+
+    # XXX(python3):
+    #
+    # In python3 we write unicode strings (which is all the csv
+    # module is able to do, it will NOT write bytes like in py2).
+    # Because of this we use the codec getwriter to transform our
+    # file handle to a stream writer that will encode to utf8.
+    writer = csv.DictWriter(
+        codecs.getwriter("utf-8")(fileobj),
+        header_fields,
+        escapechar="\\",
+        extrasaction="ignore",
+    )
+    if include_header:
+        writer.writeheader()
+    writer.writerows(rows)
@@ -62,6 +62,7 @@ from sentry.grouping.ingest.hashing import (
     find_existing_grouphash,
     get_hash_values,
     get_or_create_grouphashes,
+    get_or_create_grouphashes_bulk,
     maybe_run_background_grouping,
     maybe_run_secondary_grouping,
     run_primary_grouping,
@@ -950,10 +951,16 @@ def _get_group_processing_kwargs(job: Job) -> dict[str, Any]:
 
 @sentry_sdk.tracing.trace
 def _get_or_create_environment_many(jobs: Sequence[Job], projects: ProjectsMapping) -> None:
+    # Jobs from a single batch tend to share a handful of environments, so
+    # only resolve each (project, name) pair once.
+    environments: dict[tuple[int, str | None], Environment] = {}
     for job in jobs:
-        job["environment"] = Environment.get_or_create(
-            project=projects[job["project_id"]], name=job["environment"]
-        )
+        key = (job["project_id"], job["environment"])
+        if key not in environments:
+            environments[key] = Environment.get_or_create(
+                project=projects[job["project_id"]], name=job["environment"]
+            )
+        job["environment"] = environments[key]
 
 
 @sentry_sdk.tracing.trace
@@ -1123,17 +1130,34 @@ def _tsdb_record_all_metrics(jobs: Sequence[Job]) -> None:
 
 def _nodestore_save_many(jobs: Sequence[Job], app_feature: str) -> None:
     inserted_time = datetime.now(timezone.utc).timestamp()
+
+    # We only care about `unprocessed` for error events. Fetch them for the
+    # whole batch at once rather than doing one round-trip per event.
+    unprocessed_keys = {
+        id(job): cache_key_for_event(
+            {"project": job["event"].project_id, "event_id": job["event"].event_id}
+        )
+        for job in jobs
+        if job["event"].get_event_type() not in ("transaction", "generic") and job["groups"]
+    }
+    if len(unprocessed_keys) > 1:
+        unprocessed_payloads = event_processing_store.get_many(
+            list(unprocessed_keys.values()), unprocessed=True
+        )
+    else:
+        unprocessed_payloads = {
+            key: payload
+            for key in unprocessed_keys.values()
+            if (payload := event_processing_store.get(key, unprocessed=True)) is not None
+        }
+
     for job in jobs:
         # Write the event to Nodestore
         subkeys = {}
 
-        event = job["event"]
-        # We only care about `unprocessed` for error events
-        if event.get_event_type() not in ("transaction", "generic") and job["groups"]:
-            unprocessed = event_processing_store.get(
-                cache_key_for_event({"project": event.project_id, "event_id": event.event_id}),
-                unprocessed=True,
-            )
+        unprocessed_key = unprocessed_keys.get(id(job))
+        if unprocessed_key is not None:
+            unprocessed = unprocessed_payloads.get(unprocessed_key)
             if unprocessed is not None:
                 subkeys["unprocessed"] = unprocessed
 
@@ -1369,7 +1393,7 @@ def _save_aggregate(
 
     group_creation_kwargs = _get_group_creation_kwargs(job)
 
-    grouphashes = get_or_create_grouphashes(project, hashes)
+    grouphashes = get_or_create_grouphashes(project, hashes, job.get("prefetched_grouphashes"))
 
     existing_grouphash = find_existing_grouphash(grouphashes)
 
@@ -1672,7 +1696,7 @@ def get_hashes_and_grouphashes(
     grouping_config, hashes = hash_calculation_function(project, job, metric_tags)
 
     if hashes:
-        grouphashes = get_or_create_grouphashes(project, hashes)
+        grouphashes = get_or_create_grouphashes(project, hashes, job.get("prefetched_grouphashes"))
 
         existing_grouphash = find_existing_grouphash(grouphashes)
 
@@ -2972,3 +2996,172 @@ def save_generic_events(jobs: Sequence[Job], projects: ProjectsMapping) -> Seque
     _nodestore_save_many(jobs=jobs, app_feature="issue_platform")
 
     return jobs
+
+
+@sentry_sdk.tracing.trace
+def save_error_events_many(
+    datas: Sequence[MutableMapping[str, Any]],
+    project_id: int,
+    start_time: float | None = None,
+    raw: bool = False,
+) -> list[Event]:
+    """
+    Batched variant of `EventManager.save` for normalized error events of a
+    single project.
+
+    Release, environment and project key lookups, the nodestore writes and
+    the eventstream inserts are shared across the batch, so a burst of errors
+    costs a handful of round-trips instead of a handful per event. Primary
+    hashes are calculated for the whole batch before grouping so that their
+    grouphashes are resolved together; group assignment itself still runs
+    per event. Events with attachments must go through
+    `EventManager.save` since attachments are neither loaded nor persisted
+    here.
+
+    Events whose hash has been discarded are refunded and dropped from the
+    batch instead of raising `HashDiscarded`. Returns the saved events.
+    """
+    project = Project.objects.get_from_cache(id=project_id)
+    project.set_cached_field_value(
+        "organization", Organization.objects.get_from_cache(id=project.organization_id)
+    )
+    projects = {project.id: project}
+
+    jobs: list[Job] = [
+        {"data": data, "project_id": project.id, "raw": raw, "start_time": start_time}
+        for data in datas
+    ]
+    if not jobs:
+        return []
+
+    set_measurement(measurement_name="jobs", value=len(jobs))
+
+    _pull_out_data(jobs, projects)
+
+    optimized_grouping = project_uses_optimized_grouping(project)
+    in_grouping_transition = is_in_transition(project)
+
+    _get_or_create_release_many(jobs, projects)
+    _get_event_user_many(jobs, projects)
+
+    key_ids = {job["key_id"] for job in jobs if job["key_id"] is not None}
+    project_keys = {key.id: key for key in ProjectKey.objects.get_many_from_cache(key_ids)}
+    for job in jobs:
+        job["project_key"] = project_keys.get(job["key_id"])
+
+    _derive_plugin_tags_many(jobs, projects)
+    _derive_interface_tags_many(jobs)
+
+    job_metric_tags: list[MutableTags] = []
+    for job in jobs:
+        job["optimized_grouping"] = optimized_grouping
+        job["in_grouping_transition"] = in_grouping_transition
+        job_metric_tags.append(
+            {
+                "platform": job["event"].platform or "unknown",
+                "sdk": normalized_sdk_tag_from_event(job["event"].data),
+                "using_transition_optimization": optimized_grouping,
+                "in_transition": in_grouping_transition,
+            }
+        )
+
+    # Calculate the primary hashes of the whole batch first so that their grouphashes can be
+    # resolved together. Secondary grouping runs on a copy of the event taken before the primary
+    # calculation modifies it, so projects in a grouping config transition keep the per-event order.
+    if not in_grouping_transition:
+        for job, metric_tags in zip(jobs, job_metric_tags):
+            job["primary_grouping"] = run_primary_grouping(project, job, metric_tags)
+
+        grouphashes_by_hash = get_or_create_grouphashes_bulk(
+            project,
+            (hash_value for job in jobs for hash_value in job["primary_grouping"][1]),
+        )
+        prefetched_grouphashes = {
+            hash_value: grouphash
+            for hash_value, grouphash in grouphashes_by_hash.items()
+            if grouphash.group_id is not None
+        }
+        for job in jobs:
+            job["prefetched_grouphashes"] = prefetched_grouphashes
+
+    grouped_jobs: list[Job] = []
+    for job, metric_tags in zip(jobs, job_metric_tags):
+        try:
+            group_info = assign_event_to_group(event=job["event"], job=job, metric_tags=metric_tags)
+        except HashDiscarded:
+            discard_event(job, [])
+            continue
+
+        if not group_info:
+            continue
+
+        job["event"].data.bind_ref(job["event"])
+        grouped_jobs.append(job)
+
+    metrics.distribution("event_manager.save_error_events_many.batch_size", len(jobs))
+    metrics.distribution("event_manager.save_error_events_many.grouped", len(grouped_jobs))
+
+    jobs = grouped_jobs
+    if not jobs:
+        return []
+
+    _get_or_create_environment_many(jobs, projects)
+    _get_or_create_group_environment_many(jobs)
+    _get_or_create_release_associated_models(jobs, projects)
+    _increment_release_associated_counts_many(jobs, projects)
+    _get_or_create_group_release_many(jobs)
+    _tsdb_record_all_metrics(jobs)
+
+    # XXX: DO NOT MUTATE THE EVENT PAYLOAD AFTER THIS POINT
+    _materialize_event_metrics(jobs)
+    _nodestore_save_many(jobs=jobs, app_feature="errors")
+
+    if not raw:
+        if not project.first_event:
+            first_job = min(jobs, key=lambda job: job["event"].datetime)
+            project.update(first_event=first_job["event"].datetime)
+            first_event_received.send_robust(
+                project=project, event=first_job["event"], sender=Project
+            )
+
+        if not project.flags.has_minified_stack_trace:
+            for job in jobs:
+                if has_event_minified_stack_trace(job["event"]):
+                    first_event_with_minified_stack_trace_received.send_robust(
+                        project=project, event=job["event"], sender=Project
+                    )
+                    break
+
+    for job in jobs:
+        if is_reprocessed_event(job["data"]):
+            safe_execute(
+                reprocessing2.buffered_delete_old_primary_hash,
+                project_id=job["event"].project_id,
+                group_id=reprocessing2.get_original_group_id(job["event"]),
+                event_id=job["event"].event_id,
+                datetime=job["event"].datetime,
+                old_primary_hash=reprocessing2.get_original_primary_hash(job["event"]),
+                current_primary_hash=job["event"].get_primary_hash(),
+            )
+
+    _eventstream_insert_many(jobs)
+
+    for job in jobs:
+        metric_tags = {"from_relay": str("_relay_processed" in job["data"])}
+        metrics.timing(
+            "events.latency",
+            job["received_timestamp"] - job["recorded_timestamp"],
+            tags=metric_tags,
+        )
+        metrics.distribution(
+            "events.size.data.post_save", job["event"].size, tags=metric_tags, unit="byte"
+        )
+        metrics.incr(
+            "events.post_save.normalize.errors",
+            amount=len(job["data"].get("errors") or ()),
+            tags=metric_tags,
+        )
+
+    _track_outcome_accepted_many(jobs)
+
+    return [job["event"] for job in jobs]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import MutableMapping, Sequence
 from datetime import timedelta
 from typing import Any
 
@@ -50,6 +50,19 @@ class EventProcessingStore(Service):
             key = self.__get_unprocessed_key(key)
         return self.inner.get(key)
 
+    def get_many(
+        self, keys: Sequence[str], unprocessed: bool = False
+    ) -> dict[str, MutableMapping[str, Any]]:
+        """
+        Fetch multiple payloads at once. Keys that are missing from the store
+        are omitted from the result.
+        """
+        if not unprocessed:
+            return dict(self.inner.get_many(keys))
+
+        inner_keys = {self.__get_unprocessed_key(key): key for key in keys}
+        return {inner_keys[key]: value for key, value in self.inner.get_many(list(inner_keys))}
+
     def delete_by_key(self, key: str) -> None:
         self.inner.delete(key)
         self.inner.delete(self.__get_unprocessed_key(key))
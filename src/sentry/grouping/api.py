@@ -14,6 +14,7 @@ from sentry.grouping.enhancer.exceptions import InvalidEnhancerConfig
 from sentry.grouping.strategies.base import DEFAULT_GROUPING_ENHANCEMENTS_BASE, GroupingContext
 from sentry.grouping.strategies.configurations import CONFIGURATIONS
 from sentry.grouping.utils import (
+    ParsedConfigCache,
     expand_title_template,
     hash_from_values,
     is_default_fingerprint_var,
@@ -39,6 +40,11 @@ if TYPE_CHECKING:
 
 HASH_RE = re.compile(r"^[0-9a-f]{32}$")
 
+# Parsed custom fingerprinting rules, keyed by a hash of the rules and the bases they're merged with
+FINGERPRINTING_RULES_CACHE: ParsedConfigCache[FingerprintingRules] = ParsedConfigCache(
+    "fingerprinting_rules", 1_000
+)
+
 
 @dataclass
 class GroupHashInfo:
@@ -210,17 +216,29 @@ def get_fingerprinting_config_for_project(
     Merges the project's custom fingerprinting rules (if any) with the default built-in rules.
     """
 
-    from sentry.grouping.fingerprinting import FingerprintingRules, InvalidFingerprintingConfig
+    from sentry.grouping.fingerprinting import FingerprintingRules
 
     bases = get_projects_default_fingerprinting_bases(project, config_id=config_id)
     rules = project.get_option("sentry:fingerprinting_rules")
     if not rules:
         return FingerprintingRules([], bases=bases)
 
+    from sentry.utils.hashlib import hash_values, md5_text
+
+    rules_hash = md5_text(rules).hexdigest()
+    return FINGERPRINTING_RULES_CACHE.get_or_load(
+        hash_values([rules_hash, list(bases or ())]),
+        lambda: _load_fingerprinting_rules(rules, rules_hash, bases),
+    )
+
+
+def _load_fingerprinting_rules(
+    rules: str, rules_hash: str, bases: Sequence[str] | None
+) -> FingerprintingRules:
+    from sentry.grouping.fingerprinting import FingerprintingRules, InvalidFingerprintingConfig
     from sentry.utils.cache import cache
-    from sentry.utils.hashlib import md5_text
 
-    cache_key = "fingerprinting-rules:" + md5_text(rules).hexdigest()
+    cache_key = "fingerprinting-rules:" + rules_hash
     rv = cache.get(cache_key)
     if rv is not None:
         return FingerprintingRules.from_json(rv, bases=bases)
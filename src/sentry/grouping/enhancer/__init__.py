@@ -16,7 +16,9 @@ from sentry_ophio.enhancers import Enhancements as RustEnhancements
 
 from sentry import projectoptions
 from sentry.grouping.component import GroupingComponent
+from sentry.grouping.utils import ParsedConfigCache
 from sentry.stacktraces.functions import set_in_app
+from sentry.utils.hashlib import hash_values, md5_text
 from sentry.utils.safe import get_path, set_path
 
 from .exceptions import InvalidEnhancerConfig
@@ -33,6 +35,9 @@ RUST_CACHE = RustCache(1_000)
 VERSIONS = [2]
 LATEST_VERSION = VERSIONS[-1]
 
+# Parsed `Enhancements`, keyed by a hash of the serialized or textual config they were loaded from
+ENHANCEMENTS_CACHE: ParsedConfigCache[Enhancements] = ParsedConfigCache("enhancements", 1_000)
+
 
 def merge_rust_enhancements(
     bases: list[str], rust_enhancements: RustEnhancements
@@ -195,8 +200,18 @@ class Enhancements:
 
     @classmethod
     def loads(cls, data) -> Enhancements:
+        """
+        Load enhancements from their serialized form (see `dumps`). Results are cached per process,
+        as the same few configs get loaded for every event.
+        """
         if isinstance(data, str):
             data = data.encode("ascii", "ignore")
+        return ENHANCEMENTS_CACHE.get_or_load(
+            f"loads:{md5_text(data).hexdigest()}", lambda: cls._loads(data)
+        )
+
+    @classmethod
+    def _loads(cls, data: bytes) -> Enhancements:
         padded = data + b"=" * (4 - (len(data) % 4))
         try:
             compressed = base64.urlsafe_b64decode(padded)
@@ -215,6 +230,13 @@ class Enhancements:
     @classmethod
     @sentry_sdk.tracing.trace
     def from_config_string(self, s, bases=None, id=None) -> Enhancements:
+        cache_key = "from_config_string:" + hash_values([s, list(bases or ()), id])
+        return ENHANCEMENTS_CACHE.get_or_load(
+            cache_key, lambda: Enhancements._from_config_string(s, bases=bases, id=id)
+        )
+
+    @staticmethod
+    def _from_config_string(s, bases=None, id=None) -> Enhancements:
         rust_enhancements = parse_rust_enhancements("config_string", s)
 
         rules = parse_enhancements(s)
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import inspect
 import logging
+import threading
 from collections.abc import Generator, Mapping, Sequence
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NotRequired, Self, TypedDict, TypeVar
 
+from cachetools import LRUCache
 from django.conf import settings
 from parsimonious.exceptions import ParseError
 from parsimonious.grammar import Grammar
@@ -16,6 +19,7 @@ from sentry.stacktraces.functions import get_function_name_for_frame
 from sentry.stacktraces.platform import get_behavior_family_for_platform
 from sentry.utils.event_frames import find_stack_frames
 from sentry.utils.glob import glob_match
+from sentry.utils.hashlib import hash_values
 from sentry.utils.safe import get_path
 from sentry.utils.strings import unescape_string
 from sentry.utils.tag_normalization import normalized_sdk_tag_from_event
@@ -232,6 +236,15 @@ class FingerprintingRules:
                 yield from base_rules
 
     def get_fingerprint_values_for_event(self, event: dict[str, object]) -> None | object:
+        if not (self.bases or self.rules):
+            return None
+        return self.get_matcher().get_fingerprint_values_for_event_access(EventAccess(event))
+
+    def _get_fingerprint_values_for_event_linear(self, event: dict[str, object]) -> None | object:
+        """
+        Reference implementation of `get_fingerprint_values_for_event`, which checks every rule in
+        turn. Only kept around to verify and benchmark the compiled matcher against.
+        """
         if not (self.bases or self.rules):
             return None
         access = EventAccess(event)
@@ -241,6 +254,30 @@ class FingerprintingRules:
                 return (rule,) + new_values
         return None
 
+    @cached_property
+    def config_hash(self) -> str:
+        return hash_values(
+            [self._to_config_structure(include_builtin=False), list(self.bases)],
+            seed="fingerprinting",
+        )
+
+    def get_matcher(self) -> FingerprintingMatcher:
+        """
+        Get the compiled matcher for these rules. Matchers are shared between all
+        `FingerprintingRules` with the same config hash, so they only get built once per process
+        rather than once per event.
+        """
+        config_hash = self.config_hash
+        with _matcher_cache_lock:
+            matcher = _matcher_cache.get(config_hash)
+        if matcher is not None:
+            return matcher
+
+        matcher = FingerprintingMatcher(self.iter_rules())
+        with _matcher_cache_lock:
+            _matcher_cache[config_hash] = matcher
+        return matcher
+
     @classmethod
     def _from_config_structure(
         cls, data: dict[str, Any], bases: Sequence[str] | None = None
@@ -337,6 +374,22 @@ MATCHERS = {
 }
 
 
+# Characters which have a special meaning in glob patterns. Everything before the first of these is
+# a literal prefix which any matching value has to start with.
+GLOB_SPECIAL_CHARS = frozenset("*?[]{}\\")
+
+
+def _get_literal_prefix(pattern: str) -> tuple[str, bool]:
+    """
+    Split off the literal prefix of a glob pattern. Also returns whether the pattern is entirely
+    literal, in which case matching it is a plain string comparison.
+    """
+    for i, char in enumerate(pattern):
+        if char in GLOB_SPECIAL_CHARS:
+            return pattern[:i], False
+    return pattern, True
+
+
 class Match:
     def __init__(self, key: str, pattern: str, negated: bool = False) -> None:
         if key.startswith("tags."):
@@ -348,6 +401,38 @@ class Match:
                 raise InvalidFingerprintingConfig("Unknown matcher '%s'" % key)
         self.pattern = pattern
         self.negated = negated
+        self._literal_prefix, self._is_literal = _get_literal_prefix(pattern)
+        self._literal_prefix_lower = (
+            self._literal_prefix.lower() if self._literal_prefix.isascii() else None
+        )
+
+    @property
+    def literal_value(self) -> str | None:
+        """
+        The single value this matcher can match, if it is a positive, case-sensitive matcher with a
+        pattern containing no wildcards. Used to index rules by the values they require.
+        """
+        if self.negated or self.key not in LITERAL_INDEX_KEYS:
+            return None
+        if self.key in ("sdk", "family"):
+            flags = self.pattern.split(",")
+            return None if "all" in flags or len(flags) != 1 else flags[0]
+        return self.pattern if self._is_literal else None
+
+    def _glob_match(self, value: str, ignorecase: bool = False) -> bool:
+        # Rule out values not starting with the pattern's literal prefix before paying for a full
+        # glob match. Case-insensitive comparisons are only done for ASCII, where lowercasing is
+        # guaranteed to agree with the glob implementation.
+        if not ignorecase:
+            if self._is_literal:
+                return value == self.pattern
+            if not value.startswith(self._literal_prefix):
+                return False
+        elif self._literal_prefix_lower is not None:
+            value_prefix = value[: len(self._literal_prefix_lower)]
+            if value_prefix.isascii() and value_prefix.lower() != self._literal_prefix_lower:
+                return False
+        return glob_match(value, self.pattern, ignorecase=ignorecase)
 
     @property
     def match_group(self) -> str:
@@ -400,7 +485,7 @@ class Match:
         if self.key == "message":
             for key in ("message", "value"):
                 value = values.get(key)
-                if value is not None and glob_match(value, self.pattern, ignorecase=True):
+                if value is not None and self._glob_match(value, ignorecase=True):
                     return True
             return False
 
@@ -425,7 +510,7 @@ class Match:
             ref_val = get_rule_bool(self.pattern)
             if ref_val is not None and ref_val == value:
                 return True
-        elif glob_match(value, self.pattern, ignorecase=self.key in ("level", "value")):
+        elif self._glob_match(value, ignorecase=self.key in ("level", "value")):
             return True
         return False
 
@@ -467,14 +552,21 @@ class Rule:
         self.attributes = attributes
         self.is_builtin = is_builtin
 
-    def get_fingerprint_values_for_event_access(
-        self, event_access: EventAccess
-    ) -> None | tuple[list[str], dict[str, Any]]:
+    @cached_property
+    def matchers_by_match_group(self) -> list[tuple[str, list[Match]]]:
+        """
+        The rule's matchers grouped by match group, cheapest groups first so that a mismatch is
+        found before frames have to be looked at.
+        """
         by_match_group: dict[str, list[Match]] = {}
         for matcher in self.matchers:
             by_match_group.setdefault(matcher.match_group, []).append(matcher)
+        return sorted(by_match_group.items(), key=lambda item: MATCH_GROUP_COSTS[item[0]])
 
-        for match_group, matchers in by_match_group.items():
+    def get_fingerprint_values_for_event_access(
+        self, event_access: EventAccess
+    ) -> None | tuple[list[str], dict[str, Any]]:
+        for match_group, matchers in self.matchers_by_match_group:
             for values in event_access.get_values(match_group):
                 if all(x.matches(values) for x in matchers):
                     break
@@ -523,6 +615,91 @@ class Rule:
         ).rstrip()
 
 
+# Relative cost of evaluating matchers of each match group, used to order a rule's checks
+MATCH_GROUP_COSTS = {
+    "sdk": 0,
+    "family": 1,
+    "release": 2,
+    "log_info": 3,
+    "tags": 4,
+    "toplevel": 5,
+    "exceptions": 6,
+    "frames": 7,
+}
+
+# Keys of matchers which are compared case-sensitively against a single field, and can therefore be
+# used to index rules by literal value. Listed from most to least selective.
+LITERAL_INDEX_KEYS = ("type", "function", "module", "logger", "sdk", "family")
+
+
+class FingerprintingMatcher:
+    """
+    Compiled form of a list of fingerprinting rules.
+
+    Rules which have a positive matcher with a literal pattern (e.g. `type:ZeroDivisionError`) are
+    indexed by that value, so for any given event only the rules which could possibly match need to
+    be checked. All other rules are always checked. As with the plain list of rules, the first
+    matching rule (in rule order) wins.
+    """
+
+    def __init__(self, rules: Sequence[Rule] | Generator[Rule]) -> None:
+        self.rules = list(rules)
+        self.unindexed: list[int] = []
+        self.index: dict[str, dict[str, list[int]]] = {}
+
+        for position, rule in enumerate(self.rules):
+            index_matcher = self._get_index_matcher(rule)
+            literal_value = index_matcher.literal_value if index_matcher is not None else None
+            if index_matcher is None or literal_value is None:
+                self.unindexed.append(position)
+            else:
+                self.index.setdefault(index_matcher.key, {}).setdefault(literal_value, []).append(
+                    position
+                )
+
+    @staticmethod
+    def _get_index_matcher(rule: Rule) -> Match | None:
+        candidates = [matcher for matcher in rule.matchers if matcher.literal_value is not None]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda matcher: LITERAL_INDEX_KEYS.index(matcher.key))
+
+    @staticmethod
+    def _get_event_values(event_access: EventAccess, key: str) -> set[str]:
+        if key == "type":
+            return {exc["type"] for exc in event_access.get_exceptions() if exc["type"]}
+        if key == "function":
+            return {frame["function"] for frame in event_access.get_frames()}
+        if key == "module":
+            return {frame["module"] for frame in event_access.get_frames() if frame["module"]}
+        if key == "logger":
+            return {info["logger"] for info in event_access.get_log_info() if "logger" in info}
+        if key == "sdk":
+            return {info["sdk"] for info in event_access.get_sdk()}
+        if key == "family":
+            return {info["family"] for info in event_access.get_family()}
+        return set()
+
+    def get_candidate_rules(self, event_access: EventAccess) -> list[Rule]:
+        positions = set(self.unindexed)
+        for key, rules_by_value in self.index.items():
+            for value in self._get_event_values(event_access, key):
+                positions.update(rules_by_value.get(value, ()))
+        return [self.rules[position] for position in sorted(positions)]
+
+    def get_fingerprint_values_for_event_access(self, event_access: EventAccess) -> None | object:
+        for rule in self.get_candidate_rules(event_access):
+            new_values = rule.get_fingerprint_values_for_event_access(event_access)
+            if new_values is not None:
+                return (rule,) + new_values
+        return None
+
+
+# Compiled matchers, keyed by `FingerprintingRules.config_hash`
+_matcher_cache: LRUCache[str, FingerprintingMatcher] = LRUCache(maxsize=1000)
+_matcher_cache_lock = threading.Lock()
+
+
 class FingerprintingVisitor(NodeVisitorBase):
     visit_empty = lambda *a: None
     unwrapped_exceptions = (InvalidFingerprintingConfig,)
@@ -0,0 +1,150 @@
+"""
+Two-tier cache of hash -> group assignments, used to resolve grouphashes at ingest time without
+querying Postgres for every event of a hot issue. The first tier lives in-process, the second is
+Django's default cache (`sentry.utils.cache`'s backend, memcached in most deployments), which is
+shared by all processes.
+
+Only grouphashes which are attached to a group, aren't tombstoned and aren't locked for an unmerge
+are cached, since those are the only ones whose resolution is stable. Every entry is tagged with the
+project's cache generation, and bumping the generation (on merge, unmerge and delete) invalidates
+all entries for the project at once, in both tiers, without having to know which hashes moved. The
+generation is read in the same round-trip as the shared entries, so a lookup costs a single cache
+request however many hashes it covers.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Sequence
+
+from cachetools import TTLCache
+from django.core.cache import cache
+
+from sentry import options
+from sentry.models.grouphash import GroupHash
+from sentry.utils import metrics
+
+# How long entries in the shared cache live. Invalidation happens through the generation, so this
+# only bounds how long entries for cold issues take up space.
+CACHE_TTL = 60 * 60
+# Must outlive `CACHE_TTL`, so that an evicted generation can never resurrect stale entries
+GENERATION_TTL = 24 * 60 * 60
+
+LOCAL_CACHE_MAXSIZE = 10_000
+LOCAL_CACHE_TTL = 60
+
+# (project_id, hash) -> (generation, grouphash_id, group_id)
+CachedValue = tuple[str, int, int]
+
+_local_cache: TTLCache[tuple[int, str], CachedValue] = TTLCache(
+    maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL
+)
+
+
+def _generation_key(project_id: int) -> str:
+    return f"grouphash-cache:gen:{project_id}"
+
+
+def _entry_key(project_id: int, hash_value: str) -> str:
+    return f"grouphash-cache:{project_id}:{hash_value}"
+
+
+def is_grouphash_cache_enabled() -> bool:
+    return options.get("grouping.grouphash_cache.enabled")
+
+
+def _init_generation(project_id: int) -> str:
+    key = _generation_key(project_id)
+    generation = uuid.uuid4().hex
+    if not cache.add(key, generation, GENERATION_TTL):
+        # Somebody else initialized it concurrently, use theirs
+        generation = cache.get(key) or generation
+    return generation
+
+
+def _to_grouphash(project_id: int, hash_value: str, value: CachedValue) -> GroupHash:
+    _, grouphash_id, group_id = value
+    return GroupHash(id=grouphash_id, project_id=project_id, hash=hash_value, group_id=group_id)
+
+
+def get_cached_grouphashes(
+    project_id: int, hashes: Sequence[str]
+) -> tuple[str, dict[str, GroupHash]]:
+    """
+    Look up the given hashes, first in the local tier and then in the shared cache. Returns the
+    project's current cache generation (to be passed back to `cache_grouphashes` for anything which
+    had to be fetched from the database) along with the grouphashes which were found.
+    """
+    local_values: dict[str, CachedValue] = {}
+    shared_keys: dict[str, str] = {}
+    for hash_value in hashes:
+        local_value = _local_cache.get((project_id, hash_value))
+        if local_value is not None:
+            local_values[hash_value] = local_value
+        else:
+            shared_keys[_entry_key(project_id, hash_value)] = hash_value
+
+    generation_key = _generation_key(project_id)
+    shared_values = cache.get_many([generation_key, *shared_keys])
+    generation = shared_values.pop(generation_key, None)
+    if generation is None:
+        # Entries can only have been written under an existing generation
+        return _init_generation(project_id), {}
+
+    found: dict[str, GroupHash] = {}
+    for hash_value, local_value in local_values.items():
+        if local_value[0] == generation:
+            found[hash_value] = _to_grouphash(project_id, hash_value, local_value)
+
+    local_hits = len(found)
+    for key, shared_value in shared_values.items():
+        if shared_value is None or shared_value[0] != generation:
+            continue
+        hash_value = shared_keys[key]
+        _local_cache[(project_id, hash_value)] = shared_value
+        found[hash_value] = _to_grouphash(project_id, hash_value, shared_value)
+    shared_hits = len(found) - local_hits
+
+    metrics.incr("grouping.grouphash_cache.lookup", amount=local_hits, tags={"result": "local"})
+    metrics.incr("grouping.grouphash_cache.lookup", amount=shared_hits, tags={"result": "shared"})
+    metrics.incr(
+        "grouping.grouphash_cache.lookup",
+        amount=len(hashes) - local_hits - shared_hits,
+        tags={"result": "miss"},
+    )
+
+    return generation, found
+
+
+def cache_grouphashes(project_id: int, generation: str, grouphashes: Iterable[GroupHash]) -> None:
+    """
+    Store the given grouphashes in both tiers, skipping any which aren't safe to cache. The
+    generation must be the one returned by `get_cached_grouphashes` *before* the grouphashes were
+    read from the database, so that entries raced by an invalidation are born stale.
+    """
+    to_store = {}
+    for grouphash in grouphashes:
+        if (
+            grouphash.group_id is None
+            or grouphash.group_tombstone_id is not None
+            or grouphash.state is not None
+        ):
+            continue
+
+        value = (generation, grouphash.id, grouphash.group_id)
+        _local_cache[(project_id, grouphash.hash)] = value
+        to_store[_entry_key(project_id, grouphash.hash)] = value
+
+    if to_store:
+        cache.set_many(to_store, CACHE_TTL)
+
+
+def invalidate_grouphash_cache(project_ids: Iterable[int]) -> None:
+    """
+    Invalidate all cached grouphashes for the given projects. Must be called whenever grouphashes
+    are moved to a different group, tombstoned or deleted.
+    """
+    cache.set_many(
+        {_generation_key(project_id): uuid.uuid4().hex for project_id in set(project_ids)},
+        GENERATION_TTL,
+    )
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import copy
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from typing import TYPE_CHECKING
 
 import sentry_sdk
@@ -22,6 +22,11 @@ from sentry.grouping.api import (
     load_grouping_config,
 )
 from sentry.grouping.ingest.config import is_in_transition
+from sentry.grouping.ingest.grouphash_cache import (
+    cache_grouphashes,
+    get_cached_grouphashes,
+    is_grouphash_cache_enabled,
+)
 from sentry.grouping.ingest.metrics import record_hash_calculation_metrics
 from sentry.models.grouphash import GroupHash
 from sentry.models.grouphashmetadata import GroupHashMetadata
@@ -165,6 +170,10 @@ def run_primary_grouping(
     """
     Get the primary grouping config and primary hashes for the event.
     """
+    # Batched saves calculate the primary hashes of all their events before grouping any of them
+    if "primary_grouping" in job:
+        return job.pop("primary_grouping")
+
     with metrics.timer("event_manager.load_grouping_config"):
         grouping_config = get_grouping_config_dict_for_project(project)
         job["data"]["grouping_config"] = grouping_config
@@ -238,10 +247,52 @@ def get_hash_values(
     return (primary_hashes, secondary_hashes)
 
 
-def get_or_create_grouphashes(project: Project, hashes: Sequence[str]) -> list[GroupHash]:
-    grouphashes = []
+def get_or_create_grouphashes(
+    project: Project,
+    hashes: Sequence[str],
+    prefetched: Mapping[str, GroupHash] | None = None,
+) -> list[GroupHash]:
+    # Batched saves resolve the grouphashes of the whole batch up front. Only grouphashes already
+    # linked to a group are passed along, since a new group created by an earlier event of the batch
+    # wouldn't be reflected in an unlinked one.
+    if prefetched and all(hash_value in prefetched for hash_value in hashes):
+        return [prefetched[hash_value] for hash_value in hashes]
+
+    grouphashes_by_hash = get_or_create_grouphashes_bulk(project, hashes)
+
+    return [grouphashes_by_hash[hash_value] for hash_value in hashes]
+
+
+def get_or_create_grouphashes_bulk(project: Project, hashes: Iterable[str]) -> dict[str, GroupHash]:
+    """
+    Resolve many hashes at once, for example the hashes of all jobs in a batch, and return a
+    mapping of hash to `GroupHash`.
+
+    Hashes already linked to a group are served from the grouphash cache if it's enabled. Everything
+    else is fetched in a single query, and only hashes which don't exist at all yet are created one
+    by one.
+    """
+    unique_hashes = list(dict.fromkeys(hashes))
+    grouphashes_by_hash: dict[str, GroupHash] = {}
+
+    use_cache = is_grouphash_cache_enabled()
+    if use_cache:
+        generation, grouphashes_by_hash = get_cached_grouphashes(project.id, unique_hashes)
+
+    uncached_hashes = [h for h in unique_hashes if h not in grouphashes_by_hash]
+    if not uncached_hashes:
+        return grouphashes_by_hash
+
+    existing_grouphashes = list(GroupHash.objects.filter(project=project, hash__in=uncached_hashes))
+    if use_cache:
+        cache_grouphashes(project.id, generation, existing_grouphashes)
+    grouphashes_by_hash.update((grouphash.hash, grouphash) for grouphash in existing_grouphashes)
+
+    for hash_value in uncached_hashes:
+        if hash_value in grouphashes_by_hash:
+            continue
 
-    for hash_value in hashes:
+        # Another process may have created it since we looked, in which case we'll pick theirs up
         grouphash, created = GroupHash.objects.get_or_create(project=project, hash=hash_value)
 
         # TODO: Do we want to expand this to backfill metadata for existing grouphashes? If we do,
@@ -254,6 +305,6 @@ def get_or_create_grouphashes(project: Project, hashes: Sequence[str]) -> list[G
             # For now, this just creates a record with a creation timestamp
             GroupHashMetadata.objects.create(grouphash=grouphash)
 
-        grouphashes.append(grouphash)
+        grouphashes_by_hash[hash_value] = grouphash
 
-    return grouphashes
+    return grouphashes_by_hash
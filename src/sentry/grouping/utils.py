@@ -1,14 +1,57 @@
 import re
+import threading
+from collections.abc import Callable
 from hashlib import md5
+from typing import Generic, TypeVar
 
+from cachetools import LRUCache
 from django.utils.encoding import force_bytes
 
 from sentry.stacktraces.processing import get_crash_frame_from_event_data
+from sentry.utils import metrics
 from sentry.utils.safe import get_path
 
+T = TypeVar("T")
+
 _fingerprint_var_re = re.compile(r"\{\{\s*(\S+)\s*\}\}")
 
 
+class ParsedConfigCache(Generic[T]):
+    """
+    Process-wide, size-capped LRU of parsed grouping configs (enhancements, fingerprinting rules),
+    keyed by a hash of their source. Parsing and merging these is expensive, and without this cache
+    it happens for every event of every project with custom rules.
+
+    Cached objects are shared between events and projects, and so must never be mutated.
+    """
+
+    def __init__(self, name: str, maxsize: int) -> None:
+        self.name = name
+        self._cache: LRUCache[str, T] = LRUCache(maxsize=maxsize)
+        # `LRUCache` reorders its entries on every read, so even lookups must hold the lock
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: str, load: Callable[[], T]) -> T:
+        with self._lock:
+            rv = self._cache.get(key)
+        if rv is not None:
+            metrics.incr("grouping.parsed_config_cache", tags={"cache": self.name, "result": "hit"})
+            return rv
+
+        metrics.incr("grouping.parsed_config_cache", tags={"cache": self.name, "result": "miss"})
+        # Load outside of the lock, a concurrent miss for the same key just parses twice
+        rv = load()
+        with self._lock:
+            self._cache[key] = rv
+            size = len(self._cache)
+        metrics.gauge("grouping.parsed_config_cache.size", size, tags={"cache": self.name})
+        return rv
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
 def parse_fingerprint_var(value):
     match = _fingerprint_var_re.match(value)
     if match is not None and match.end() == len(value):
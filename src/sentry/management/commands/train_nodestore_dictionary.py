@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Trains a zstd dictionary for nodestore compression from sampled event payloads"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            dest="projects",
+            action="append",
+            type=int,
+            required=True,
+            help="ID of a project to sample events from, can be given multiple times",
+        )
+        parser.add_argument("--platform", dest="platform", help="only sample events of a platform")
+        parser.add_argument("--dict-id", dest="dict_id", type=int, required=True)
+        parser.add_argument("--dict-size", dest="dict_size", type=int, default=112640)
+        parser.add_argument("--samples", dest="samples", type=int, default=5000)
+        parser.add_argument("--days", dest="days", type=int, default=7)
+        parser.add_argument("--output", dest="output", required=True)
+
+    def handle(self, **options):
+        import zstandard
+        from django.utils import timezone
+
+        from sentry import eventstore, nodestore
+        from sentry.eventstore.models import Event
+        from sentry.nodestore.compression import get_dictionaries
+
+        if options["dict_id"] <= 0 or options["dict_id"] >= 2**31:
+            raise CommandError("--dict-id must be a positive 32-bit integer")
+        if options["dict_id"] in get_dictionaries():
+            raise CommandError(f"Dictionary ID {options['dict_id']} is already in use")
+
+        end = timezone.now()
+        conditions = [["platform", "=", options["platform"]]] if options["platform"] else None
+        events = eventstore.backend.get_events(
+            filter=eventstore.Filter(
+                start=end - timedelta(days=options["days"]),
+                end=end,
+                project_ids=options["projects"],
+                conditions=conditions,
+            ),
+            limit=options["samples"],
+            referrer="management.train_nodestore_dictionary",
+        )
+
+        samples = []
+        for event in events:
+            data = nodestore.backend.get_bytes(
+                Event.generate_node_id(event.project_id, event.event_id)
+            )
+            if data:
+                samples.append(data)
+
+        if len(samples) < 10:
+            raise CommandError(f"Found only {len(samples)} event payloads, not enough to train on")
+
+        dictionary = zstandard.train_dictionary(
+            options["dict_size"], samples, dict_id=options["dict_id"]
+        )
+        with open(options["output"], "wb") as f:
+            f.write(dictionary.as_bytes())
+
+        plain_size = sum(len(sample) for sample in samples)
+        compressor = zstandard.ZstdCompressor(dict_data=dictionary)
+        compressed_size = sum(len(compressor.compress(sample)) for sample in samples)
+        baseline_size = sum(len(zstandard.ZstdCompressor().compress(sample)) for sample in samples)
+        self.stdout.write(
+            f"Trained dictionary {options['dict_id']} on {len(samples)} payloads "
+            f"({plain_size} bytes): {baseline_size} bytes compressed without the dictionary, "
+            f"{compressed_size} bytes with it.\n"
+            f"Add {{{options['dict_id']}: {options['output']!r}}} to "
+            "SENTRY_NODESTORE_ZSTD_DICTIONARIES on every host before enabling it in "
+            "nodestore.zstd-dictionaries.platforms."
+        )
@@ -134,6 +134,40 @@ class ProjectOptionManager(OptionManager["ProjectOption"]):
 
         return self._option_cache.get(cache_key, {})
 
+    def get_all_values_bulk(
+        self, projects: Sequence[Project | int]
+    ) -> Mapping[int, Mapping[str, Any]]:
+        """
+        The options of several projects, the same as `get_all_values` for each of them. Projects
+        missing from the caches are loaded with a single cache and database query.
+        """
+        project_ids = [
+            project.id if isinstance(project, models.Model) else project for project in projects
+        ]
+
+        missing = {
+            self._make_key(project_id): project_id
+            for project_id in project_ids
+            if self._make_key(project_id) not in self._option_cache
+        }
+        if missing:
+            for cache_key, result in cache.get_many(list(missing)).items():
+                if result is not None:
+                    self._option_cache[cache_key] = result
+                    del missing[cache_key]
+
+        if missing:
+            results: dict[str, dict[str, Any]] = {cache_key: {} for cache_key in missing}
+            for option in self.filter(project__in=missing.values()):
+                results[self._make_key(option.project_id)][option.key] = option.value
+            cache.set_many(results)
+            self._option_cache.update(results)
+
+        return {
+            project_id: self._option_cache.get(self._make_key(project_id), {})
+            for project_id in project_ids
+        }
+
     def reload_cache(self, project_id: int, update_reason: str) -> Mapping[str, Any]:
         from sentry.tasks.relay import schedule_invalidate_project_config
 
@@ -8,11 +8,19 @@ from django.db.models.signals import post_delete, post_save, pre_save
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
-from sentry import analytics
+from sentry import analytics, options
 from sentry.backup.scopes import RelocationScope
 from sentry.db.models import FlexibleForeignKey, JSONField, Model, region_silo_model, sane_repr
 from sentry.models.organization import Organization
-from sentry.ownership.grammar import convert_codeowners_syntax, create_schema_from_issue_owners
+from sentry.ownership.grammar import (
+    VERSION,
+    convert_codeowners_rules,
+    convert_codeowners_syntax,
+    create_schema_from_issue_owners,
+    get_codeowners_rule_hash,
+    get_codeowners_rules,
+)
+from sentry.utils import metrics
 from sentry.utils.cache import cache
 
 logger = logging.getLogger(__name__)
@@ -95,7 +103,8 @@ class ProjectCodeOwners(Model):
         from sentry.api.validators.project_codeowners import validate_codeowners_associations
         from sentry.utils.codeowners import MAX_RAW_LENGTH
 
-        if raw and self.raw != raw:
+        raw_changed = bool(raw) and self.raw != raw
+        if raw_changed:
             self.raw = raw
 
         if not self.raw:
@@ -109,6 +118,11 @@ class ProjectCodeOwners(Model):
             logger.warning({"raw": f"Raw needs to be <= {MAX_RAW_LENGTH} characters in length"})
             return
 
+        if options.get("codeowners.incremental-sync.enabled"):
+            # Without a new file the associations changed, so all rules need to be resolved again
+            self.update_schema_incrementally(reuse_rules=raw is not None, raw_changed=raw_changed)
+            return
+
         associations, _ = validate_codeowners_associations(self.raw, self.project)
 
         issue_owner_rules = convert_codeowners_syntax(
@@ -129,6 +143,64 @@ class ProjectCodeOwners(Model):
         except ValidationError:
             return
 
+    def update_schema_incrementally(
+        self, reuse_rules: bool = True, raw_changed: bool = False
+    ) -> None:
+        """
+        Like `update_schema`, but only converts the rules which changed since the schema was last
+        updated. Schema rules carry the content hash of the CODEOWNERS rule they were converted
+        from, and unchanged rules are reused as is, so only the owners of changed rules are
+        validated and resolved. Rules without any associated owner aren't part of the schema, so
+        they're converted again each time in case their owners got associated in the meantime.
+        """
+        from sentry.api.validators.project_codeowners import validate_codeowners_associations
+
+        assert self.raw is not None
+        code_mapping = self.repository_project_path_config
+        previous_rules: dict[str, dict] = {}
+        if reuse_rules and self.schema:
+            previous_rules = {
+                rule["hash"]: rule for rule in self.schema.get("rules", []) if "hash" in rule
+            }
+
+        rules = [
+            (rule, get_codeowners_rule_hash(rule, code_mapping))
+            for rule in get_codeowners_rules(self.raw)
+        ]
+        changed_rules = list(
+            {
+                rule_hash: rule for rule, rule_hash in rules if rule_hash not in previous_rules
+            }.values()
+        )
+        metrics.distribution("codeowners.update_schema.rules", len(rules))
+        metrics.distribution("codeowners.update_schema.changed_rules", len(changed_rules))
+
+        converted_rules = {}
+        if changed_rules:
+            associations, _ = validate_codeowners_associations(
+                "\n".join(changed_rules), self.project
+            )
+            try:
+                converted_rules = convert_codeowners_rules(
+                    project_id=self.project.id,
+                    rules=changed_rules,
+                    associations=associations,
+                    code_mapping=code_mapping,
+                )
+            except ValidationError:
+                return
+
+        schema_rules = []
+        for _, rule_hash in rules:
+            schema_rule = previous_rules.get(rule_hash) or converted_rules.get(rule_hash)
+            if schema_rule is not None:
+                schema_rules.append(schema_rule)
+
+        schema = {"$version": VERSION, "rules": schema_rules}
+        if raw_changed or schema != self.schema:
+            self.schema = schema
+            self.save()
+
 
 def modify_date_updated(instance, **kwargs):
     if instance.id is None:
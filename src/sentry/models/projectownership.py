@@ -361,6 +361,11 @@ class ProjectOwnership(Model):
     ) -> Sequence[Rule]:
         rules = []
         if ownership.schema is not None:
+            if options.get("ownership.compiled-matcher.enabled"):
+                from sentry.ownership.compiled import get_compiled_rules
+
+                return get_compiled_rules(ownership.schema).get_matching_rules(data)
+
             munged_data = None
             if options.get("ownership.munge_data_for_performance"):
                 munged_data = Matcher.munge_if_needed(data)
@@ -6,10 +6,12 @@ from threading import local
 from typing import Any
 
 import sentry_sdk
+from cachetools import TTLCache
 from django.core.cache import BaseCache, InvalidCacheBackendError, caches
 from django.utils.functional import cached_property
 
 from sentry import options
+from sentry.nodestore import compression
 from sentry.utils import json, metrics
 from sentry.utils.services import Service
 
@@ -28,6 +30,11 @@ json_dumps = json.JSONEncoder(
 
 json_loads = json.loads
 
+# Entries in the in-process cache are only meant to serve repeated reads of the same nodes within a
+# request or task, so they don't live long. This also bounds how long a node deleted from another
+# thread or process can still be served.
+LOCAL_CACHE_TTL = 10
+
 
 class NodeStorage(local, Service):
     """
@@ -62,6 +69,14 @@ class NodeStorage(local, Service):
 
     This is used in reprocessing to store a snapshot of the event from multiple
     stages of the pipeline.
+
+    Reads are served from up to two cache tiers in front of the backend:
+
+    * An in-process LRU of raw node bytes, bounded by the total size of the
+      cached nodes (`nodestore.local-cache.max-bytes`, disabled when 0).
+      Since it holds the encoded node, it serves all subkeys, and every read
+      decodes a fresh copy which callers are free to mutate.
+    * The optional `nodedata` Django cache of decoded default payloads.
     """
 
     __all__ = (
@@ -100,6 +115,7 @@ class NodeStorage(local, Service):
         if value is None:
             return None
 
+        value = compression.decompress(value)
         lines_iter = iter(value.splitlines())
         try:
             if subkey is not None:
@@ -125,7 +141,13 @@ class NodeStorage(local, Service):
         >>> nodestore._get_bytes('key1')
         b'{"message": "hello world"}'
         """
-        return self._get_bytes(id)
+        bytes_data = self._get_local_cache_item(id)
+        if bytes_data is None:
+            bytes_data = self._get_bytes(id)
+            self._set_local_cache_item(id, bytes_data)
+        if bytes_data is None:
+            return None
+        return compression.decompress(bytes_data)
 
     def _get_bytes(self, id: str) -> bytes | None:
         raise NotImplementedError
@@ -138,6 +160,13 @@ class NodeStorage(local, Service):
         """
         with sentry_sdk.start_span(op="nodestore.get") as span:
             span.set_tag("node_id", id)
+            local_bytes = self._get_local_cache_item(id)
+            if local_bytes is not None:
+                span.set_tag("origin", "from_local_cache")
+                rv = self._decode(local_bytes, subkey=subkey)
+                span.set_tag("found", bool(rv))
+                return rv
+
             if subkey is None:
                 item_from_cache = self._get_cache_item(id)
                 if item_from_cache:
@@ -149,8 +178,9 @@ class NodeStorage(local, Service):
             span.set_tag("subkey", str(subkey))
             bytes_data = self._get_bytes(id)
             rv = self._decode(bytes_data, subkey=subkey)
+            # set cache items only after we know decoding did not fail
+            self._set_local_cache_item(id, bytes_data)
             if subkey is None:
-                # set cache item only after we know decoding did not fail
                 self._set_cache_item(id, rv)
 
             span.set_tag("result", "from_service")
@@ -183,24 +213,37 @@ class NodeStorage(local, Service):
             span.set_tag("subkey", str(subkey))
             span.set_tag("num_ids", len(id_list))
 
+            local_items = {
+                id: self._decode(value, subkey=subkey)
+                for id, value in self._get_local_cache_items(id_list).items()
+            }
+            if len(local_items) == len(id_list):
+                span.set_tag("result", "from_local_cache")
+                return local_items
+
             if subkey is None:
-                cache_items = self._get_cache_items(id_list)
-                if len(cache_items) == len(id_list):
+                cache_items = self._get_cache_items([id for id in id_list if id not in local_items])
+                if len(local_items) + len(cache_items) == len(id_list):
                     span.set_tag("result", "from_cache")
+                    cache_items.update(local_items)
                     return cache_items
 
-                uncached_ids = [id for id in id_list if id not in cache_items]
+                uncached_ids = [
+                    id for id in id_list if id not in cache_items and id not in local_items
+                ]
             else:
-                uncached_ids = id_list
+                uncached_ids = [id for id in id_list if id not in local_items]
 
             with sentry_sdk.start_span(op="nodestore._get_bytes_multi_and_decode") as span:
+                bytes_items = self._get_bytes_multi(uncached_ids)
                 items = {
-                    id: self._decode(value, subkey=subkey)
-                    for id, value in self._get_bytes_multi(uncached_ids).items()
+                    id: self._decode(value, subkey=subkey) for id, value in bytes_items.items()
                 }
+            self._set_local_cache_items(bytes_items)
             if subkey is None:
                 self._set_cache_items(items)
                 items.update(cache_items)
+            items.update(local_items)
 
             span.set_tag("result", "from_service")
             span.set_tag("found", len(items))
@@ -229,7 +272,9 @@ class NodeStorage(local, Service):
         >>> nodestore.set_bytes('key1', b"{'foo': 'bar'}")
         """
         metrics.distribution("nodestore.set_bytes", len(data))
-        return self._set_bytes(item_id, data, ttl)
+        self._set_bytes(item_id, data, ttl)
+        # Replace whatever this process had cached for the node, including other subkeys
+        self._set_local_cache_item(item_id, data)
 
     def _set_bytes(self, item_id: str, data: bytes, ttl: timedelta | None = None) -> None:
         raise NotImplementedError
@@ -261,7 +306,9 @@ class NodeStorage(local, Service):
         {'foo': 'bam'}
         """
         cache_item = data.get(None)
-        bytes_data = self._encode(data)
+        bytes_data = compression.compress(
+            self._encode(data), platform=cache_item.get("platform") if cache_item else None
+        )
         self.set_bytes(item_id, bytes_data, ttl=ttl)
         # set cache only after encoding and write to nodestore has succeeded
         if options.get("nodestore.set-subkeys.enable-set-cache-item"):
@@ -294,13 +341,68 @@ class NodeStorage(local, Service):
             self.cache.set_many(items)
 
     def _delete_cache_item(self, item_id: str) -> None:
+        if self.local_cache is not None:
+            self.local_cache.pop(item_id, None)
         if self.cache:
             self.cache.delete(item_id)
 
     def _delete_cache_items(self, id_list: list[str]) -> None:
+        if self.local_cache is not None:
+            for item_id in id_list:
+                self.local_cache.pop(item_id, None)
         if self.cache:
             self.cache.delete_many([item_id for item_id in id_list])
 
+    def _get_local_cache_item(self, item_id: str) -> bytes | None:
+        if self.local_cache is None:
+            return None
+        rv = self.local_cache.get(item_id)
+        metrics.incr(
+            "nodestore.cache.lookup",
+            tags={"tier": "local", "result": "hit" if rv is not None else "miss"},
+        )
+        return rv
+
+    def _get_local_cache_items(self, id_list: list[str]) -> dict[str, bytes]:
+        if self.local_cache is None:
+            return {}
+        rv = {}
+        for item_id in id_list:
+            value = self.local_cache.get(item_id)
+            if value is not None:
+                rv[item_id] = value
+        metrics.incr(
+            "nodestore.cache.lookup", amount=len(rv), tags={"tier": "local", "result": "hit"}
+        )
+        metrics.incr(
+            "nodestore.cache.lookup",
+            amount=len(id_list) - len(rv),
+            tags={"tier": "local", "result": "miss"},
+        )
+        return rv
+
+    def _set_local_cache_item(self, item_id: str, data: bytes | None) -> None:
+        if self.local_cache is None:
+            return
+        # Nodes larger than the whole cache can't be stored (and would raise), but must still
+        # evict whatever was cached for them before
+        if data and len(data) <= self.local_cache.maxsize:
+            self.local_cache[item_id] = data
+        else:
+            self.local_cache.pop(item_id, None)
+
+    def _set_local_cache_items(self, items: Mapping[str, bytes | None]) -> None:
+        for item_id, data in items.items():
+            self._set_local_cache_item(item_id, data)
+
+    @cached_property
+    def local_cache(self) -> TTLCache[str, bytes] | None:
+        # Like any other attribute this is per thread, so no locking is needed
+        max_bytes = options.get("nodestore.local-cache.max-bytes")
+        if max_bytes <= 0:
+            return None
+        return TTLCache(maxsize=max_bytes, ttl=LOCAL_CACHE_TTL, getsizeof=len)
+
     @cached_property
     def cache(self) -> BaseCache | None:
         try:
@@ -1,14 +1,37 @@
 from __future__ import annotations
 
+import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import timedelta
 from typing import Any
 
 import sentry_sdk
 
 from sentry.nodestore.base import NodeStorage
+from sentry.utils import metrics
 from sentry.utils.kvstore.bigtable import BigtableKVStorage
 
+logger = logging.getLogger(__name__)
+
+# Pools reading the chunks of `get_multi`, keyed by their size. They're shared by all nodestore
+# instances (which are per thread) and live as long as the process, so the number of reader threads
+# stays bounded however many threads use nodestore.
+_get_multi_executors: dict[int, ThreadPoolExecutor] = {}
+_get_multi_executors_lock = threading.Lock()
+
+
+def _get_multi_executor(max_workers: int) -> ThreadPoolExecutor:
+    with _get_multi_executors_lock:
+        executor = _get_multi_executors.get(max_workers)
+        if executor is None:
+            executor = _get_multi_executors[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="nodestore-get-multi"
+            )
+        return executor
+
 
 class BigtableNodeStorage(NodeStorage):
     """
@@ -22,6 +45,15 @@ class BigtableNodeStorage(NodeStorage):
         valid for reading + returning)
     :param compression: A boolean whether to enable zlib-compression, or the
         string "zstd" to use zstd.
+    :param get_multi_chunk_size: How many keys are read per request in
+        ``get_multi``.
+    :param get_multi_max_workers: How many chunks of ``get_multi`` are read in
+        parallel. With 1, chunks are read one after another.
+    :param get_multi_deadline: How many seconds ``get_multi`` waits for its
+        chunks. Nodes from chunks which didn't complete in time are returned as
+        missing. The Bigtable requests of the chunks are given the same
+        deadline, so abandoned chunks don't keep running past it. ``None``
+        waits for all chunks.
 
     >>> from datetime import timedelta
     >>> BigtableNodeStorage(
@@ -43,6 +75,9 @@ class BigtableNodeStorage(NodeStorage):
         automatic_expiry: bool = False,
         default_ttl: timedelta | None = None,
         compression: bool | str = False,
+        get_multi_chunk_size: int = 50,
+        get_multi_max_workers: int = 1,
+        get_multi_deadline: float | None = None,
         **client_options: object,
     ):
         if compression is True:
@@ -62,14 +97,60 @@ class BigtableNodeStorage(NodeStorage):
         )
         self.automatic_expiry = automatic_expiry
         self.skip_deletes = automatic_expiry and "_SENTRY_CLEANUP" in os.environ
+        self.get_multi_chunk_size = get_multi_chunk_size
+        self.get_multi_max_workers = get_multi_max_workers
+        self.get_multi_deadline = get_multi_deadline
 
     def _get_bytes(self, id: str) -> bytes | None:
         return self.store.get(id)
 
+    def _get_many(
+        self, id_list: list[str], deadline: float | None = None
+    ) -> list[tuple[str, bytes]]:
+        if deadline is None:
+            return list(self.store.get_many(id_list))
+
+        timeout = deadline - time.monotonic()
+        if timeout <= 0:
+            # The caller has given up on this chunk already
+            return []
+        return list(self.store.get_many(id_list, timeout=timeout))
+
     @sentry_sdk.tracing.trace
     def _get_bytes_multi(self, id_list: list[str]) -> dict[str, bytes | None]:
         rv: dict[str, bytes | None] = {id: None for id in id_list}
-        rv.update(self.store.get_many(id_list))
+
+        chunks = [
+            id_list[i : i + self.get_multi_chunk_size]
+            for i in range(0, len(id_list), self.get_multi_chunk_size)
+        ]
+        if self.get_multi_max_workers <= 1 or len(chunks) <= 1:
+            rv.update(self.store.get_many(id_list))
+            return rv
+
+        deadline = None
+        if self.get_multi_deadline is not None:
+            deadline = time.monotonic() + self.get_multi_deadline
+
+        executor = _get_multi_executor(self.get_multi_max_workers)
+        futures = [executor.submit(self._get_many, chunk, deadline) for chunk in chunks]
+        done, not_done = wait(futures, timeout=self.get_multi_deadline)
+
+        # Only chunks which haven't started yet can be cancelled. Running ones can't be interrupted,
+        # but their requests time out at the same deadline
+        for future in not_done:
+            future.cancel()
+        if not_done:
+            metrics.incr("nodestore.bigtable.get_multi.deadline_exceeded", amount=len(not_done))
+            logger.warning(
+                "nodestore.bigtable.get_multi.deadline_exceeded",
+                extra={"chunks": len(chunks), "incomplete_chunks": len(not_done)},
+            )
+
+        # Keep the order of the chunks, so errors surface the same way as when reading serially
+        for future in futures:
+            if future in done:
+                rv.update(future.result())
         return rv
 
     def _set_bytes(self, id: str, data: Any, ttl: timedelta | None = None) -> None:
@@ -0,0 +1,112 @@
+"""
+Compression of node payloads with trained zstd dictionaries.
+
+Events of the same platform share most of their structure (keys, SDK metadata, module names, ...),
+which generic compression of a single payload can't take advantage of. A dictionary trained on
+sampled payloads (see the `train_nodestore_dictionary` management command) primes the compressor
+with that shared content.
+
+Dictionaries are configured in `SENTRY_NODESTORE_ZSTD_DICTIONARIES` as a mapping of dictionary ID to
+the path of the trained dictionary, and must stay configured for as long as nodes compressed with
+them exist. Which dictionary is used for new writes is controlled per platform with the
+`nodestore.zstd-dictionaries.platforms` option, where `"*"` is the fallback for any other platform.
+
+The dictionary ID is recorded in the zstd frame header, so reading doesn't need to know which
+dictionary (if any) a node was written with, and nodes written before dictionaries were enabled are
+returned unchanged.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+
+import zstandard
+from django.conf import settings
+
+from sentry import options
+from sentry.utils import metrics
+
+# Every zstd frame starts with this, whereas nodes are either JSON or (legacy) pickle
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+COMPRESSION_LEVEL = 3
+
+_local = threading.local()
+
+
+@functools.cache
+def get_dictionaries() -> dict[int, zstandard.ZstdCompressionDict]:
+    dictionaries = {}
+    for dict_id, path in settings.SENTRY_NODESTORE_ZSTD_DICTIONARIES.items():
+        with open(path, "rb") as f:
+            dictionary = zstandard.ZstdCompressionDict(f.read())
+        if dictionary.dict_id() != int(dict_id):
+            raise ValueError(
+                f"Dictionary at {path} has ID {dictionary.dict_id()}, but is configured as {dict_id}"
+            )
+        dictionary.precompute_compress(level=COMPRESSION_LEVEL)
+        dictionaries[int(dict_id)] = dictionary
+    return dictionaries
+
+
+def get_dictionary_id(platform: str | None) -> int | None:
+    """
+    The ID of the dictionary new nodes of the given platform should be compressed with, if any.
+    """
+    platforms = options.get("nodestore.zstd-dictionaries.platforms")
+    if not platforms:
+        return None
+    dict_id = platforms.get(platform or "", platforms.get("*"))
+    if dict_id is None or int(dict_id) not in get_dictionaries():
+        return None
+    return int(dict_id)
+
+
+def _get_compressor(dict_id: int) -> zstandard.ZstdCompressor:
+    # (De)compressors can't be shared between threads, but are expensive enough to set up with a
+    # dictionary that we want to reuse them
+    compressors = _local.__dict__.setdefault("compressors", {})
+    if dict_id not in compressors:
+        compressors[dict_id] = zstandard.ZstdCompressor(
+            level=COMPRESSION_LEVEL, dict_data=get_dictionaries()[dict_id]
+        )
+    return compressors[dict_id]
+
+
+def _get_decompressor(dict_id: int) -> zstandard.ZstdDecompressor:
+    decompressors = _local.__dict__.setdefault("decompressors", {})
+    if dict_id not in decompressors:
+        dictionary = get_dictionaries()[dict_id] if dict_id else None
+        decompressors[dict_id] = zstandard.ZstdDecompressor(dict_data=dictionary)
+    return decompressors[dict_id]
+
+
+def compress(data: bytes, platform: str | None) -> bytes:
+    """
+    Compress the encoded node with the dictionary configured for its platform. Returns the data
+    unchanged if there is none.
+    """
+    dict_id = get_dictionary_id(platform)
+    if dict_id is None:
+        return data
+
+    rv = _get_compressor(dict_id).compress(data)
+    metrics.distribution(
+        "nodestore.zstd_dictionary.ratio",
+        len(rv) / len(data) if data else 1,
+        tags={"dict_id": dict_id},
+    )
+    return rv
+
+
+def decompress(data: bytes) -> bytes:
+    """
+    Decompress a node written by `compress`. Anything else, in particular nodes written before
+    dictionaries were enabled, is returned unchanged.
+    """
+    if not data.startswith(ZSTD_FRAME_MAGIC):
+        return data
+
+    dict_id = zstandard.get_frame_parameters(data).dict_id
+    return _get_decompressor(dict_id).decompress(data)
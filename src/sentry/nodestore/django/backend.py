@@ -9,6 +9,7 @@ from typing import Any
 from django.utils import timezone
 
 from sentry.db.models.query import create_or_update
+from sentry.nodestore import compression
 from sentry.nodestore.base import NodeStorage
 from sentry.utils.strings import compress, decompress
 
@@ -27,6 +28,7 @@ class DjangoNodeStorage(NodeStorage):
             return None
 
         try:
+            value = compression.decompress(value)
             if value.startswith(b"{"):
                 return NodeStorage._decode(self, value, subkey=subkey)
 
@@ -62,6 +64,8 @@ class DjangoNodeStorage(NodeStorage):
         days = math.floor(total_seconds / 86400)
 
         BulkDeleteQuery(model=Node, dtfield="timestamp", days=days).execute()
+        if self.local_cache is not None:
+            self.local_cache.clear()
         if self.cache:
             self.cache.clear()
 
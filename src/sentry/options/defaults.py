@@ -709,6 +709,16 @@ register(
 # Killswitch to stop storing any reprocessing payloads.
 register("store.reprocessing-force-disable", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Collect error events without attachments per project and save them with
+# `save_event_batch` instead of one `save_event` task per event.
+register("store.save-event-batch.enabled", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# The most events saved by one `save_event_batch` task.
+register("store.save-event-batch.size", default=50, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Seconds the first event of a batch waits for others before it is saved.
+register(
+    "store.save-event-batch.max-delay", type=Float, default=1.0, flags=FLAG_AUTOMATOR_MODIFIABLE
+)
+
 register(
     "store.race-free-group-creation-force-disable", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE
 )
@@ -1017,6 +1027,17 @@ register(
 register(
     "post_process.get-autoassign-owners", type=Sequence, default=[], flags=FLAG_AUTOMATOR_MODIFIABLE
 )
+# Run independent post_process_group pipeline steps concurrently, giving each step a time budget
+# in seconds after which the steps depending on it are started regardless.
+register(
+    "post_process.parallel-steps.enabled", type=Bool, default=False, flags=FLAG_AUTOMATOR_MODIFIABLE
+)
+register(
+    "post_process.parallel-steps.step-timeout",
+    type=Float,
+    default=5.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "api.organization.disable-last-deploys",
     type=Sequence,
@@ -1486,6 +1507,14 @@ register(
 
 # Performance issue option for *all* performance issues detection
 register("performance.issues.all.problem-detection", default=1.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Find candidate spans for detectors with batched scans over a columnar representation of the
+# transaction's spans. Requires numpy, falls back to walking the span dicts without it.
+register(
+    "performance.issues.columnar-detection.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Individual system-wide options in case we need to turn off specific detectors for load concerns, ignoring the set project options.
 register(
@@ -1916,6 +1945,17 @@ register("txnames.bump-lifetime-sample-rate", default=0.1, flags=FLAG_AUTOMATOR_
 register(
     "nodestore.set-subkeys.enable-set-cache-item", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE
 )
+# Total size in bytes of the nodes each nodestore instance keeps in memory, 0 disables the tier.
+# Read once per process and thread.
+register("nodestore.local-cache.max-bytes", type=Int, default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Mapping of platform (or "*" for any other) to the ID of the trained zstd dictionary new nodes are
+# compressed with. Dictionaries must be configured in SENTRY_NODESTORE_ZSTD_DICTIONARIES.
+register(
+    "nodestore.zstd-dictionaries.platforms",
+    type=Dict,
+    default={},
+    flags=FLAG_ALLOW_EMPTY | FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # === Backpressure related runtime options ===
 
@@ -2250,6 +2290,22 @@ register(
     default=0.0,
     flags=FLAG_AUTOMATOR_MODIFIABLE | FLAG_MODIFIABLE_RATE,
 )
+# Reuse on-demand metric specs, and the conditions and hashes derived from their queries, across
+# project config builds
+register(
+    "on_demand_metrics.spec_cache.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Seconds the custom measurements of an organization's projects are cached for by query builders,
+# 0 disables the cache
+register(
+    "querybuilder.custom-measurements.cache-ttl",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Relocation: whether or not the self-serve API for the feature is enabled. When set on a region
 # silo, this flag controls whether or not that region's API will serve relocation requests to
@@ -2385,6 +2441,14 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Serve grouphash lookups at ingest from an in-process + default Django cache of hash -> group
+register(
+    "grouping.grouphash_cache.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 register(
     "grouping.config_transition.killswitch_enabled",
     type=Bool,
@@ -2473,6 +2537,21 @@ register(
     default=300,  # 5 minutes
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# How many spans of a segment are read from the buffer per round-trip
+register(
+    "standalone-spans.buffer-read-chunk-size",
+    type=Int,
+    default=500,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
+# How many segments are flushed per partition each time segments are processed, 0 for no limit.
+# Segments past the limit stay in the bucket and are flushed on the next pass.
+register(
+    "standalone-spans.buffer-max-segments-per-flush",
+    type=Int,
+    default=0,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "standalone-spans.detect-performance-issues-consumer.enable",
     default=True,
@@ -2691,6 +2770,22 @@ register(
     default=10000,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Count events of groups in Redis ring buffers in post-processing, and answer event frequency
+# conditions over short windows from them instead of Snuba.
+register(
+    "rules.frequency-counters.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Max number of small projects of an organization whose delayed rule Snuba queries are coalesced
+# into one task, 1 disables coalescing.
+register(
+    "delayed_processing.cross_project_batch.max_projects",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 register(
     "grouping.grouphash_metadata.ingestion_writes_enabled",
@@ -2716,6 +2811,38 @@ register(
     default=False,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Match ownership rules with an index of their path patterns, see `sentry.ownership.compiled`
+register(
+    "ownership.compiled-matcher.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Seconds project configs are kept in memory by `RedisProjectConfigCache`, 0 disables it
+register(
+    "relay.projectconfig-cache.local-ttl",
+    type=Float,
+    default=0.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Number of Discover batch fragments a data export fetches from Snuba concurrently
+register(
+    "data-export.concurrent-fragments",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Only convert the CODEOWNERS rules which changed when syncing, see
+# `ProjectCodeOwners.update_schema_incrementally`
+register(
+    "codeowners.incremental-sync.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Restrict uptime issue creation for specific host provider identifiers. Items
 # in this list map to the `host_provider_id` column in the UptimeSubscription
@@ -2729,3 +2856,21 @@ register(
     default=[],
     flags=FLAG_ALLOW_EMPTY | FLAG_AUTOMATOR_MODIFIABLE,
 )
+
+# Number of threads `RedisBuffer` uses to flush a batch of pending counters. Batches are sharded by
+# model and key hash range, so workers never update the same rows.
+register(
+    "buffer.flush-workers",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Write buffered counter filters and extra values with RedisBuffer's compact encoding instead of
+# JSON/pickle. Both encodings are always readable.
+register(
+    "buffer.compact-encoding",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
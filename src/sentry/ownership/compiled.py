@@ -0,0 +1,125 @@
+"""
+Compiled form of an ownership schema, which finds the rules matching an event without testing every
+rule against every frame.
+
+Path and CODEOWNERS patterns are indexed by one of the path components they contain literally, e.g.
+`src/sentry/*.py` by `sentry`. A frame can only match such a pattern if one of its paths has that
+component, so the index narrows the rules down to a few candidates with a dictionary lookup per
+path component. The candidates, and all rules which can't be indexed, are then tested as usual, so
+the matching rules are exactly the ones `Rule.test` would find.
+
+Compiled schemas are kept in a process-local LRU cache keyed by a hash of the schema.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import orjson
+
+from sentry.ownership.grammar import CODEOWNERS, PATH, Matcher, Rule, load_schema
+
+# Characters with a special meaning in glob or CODEOWNERS patterns
+_PATTERN_SPECIAL_CHARACTERS = re.compile(r"[*?\[\]{}!]")
+
+CACHE_SIZE = 256
+_cache: OrderedDict[str, CompiledOwnershipRules] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_index_token(pattern: str) -> str | None:
+    """
+    The longest path component which any path matching the pattern contains, in lowercase. Returns
+    `None` if there's no such component.
+    """
+    if "\\" in pattern:
+        # Escapes and Windows separators are normalized by the matchers, don't try to replicate that
+        return None
+
+    segments = _PATTERN_SPECIAL_CHARACTERS.split(pattern)
+    token = ""
+    for index, segment in enumerate(segments):
+        components = segment.split("/")
+        # Only components delimited by slashes or the pattern's start and end are complete, the
+        # ones next to a special character could be part of a longer component.
+        if index > 0:
+            components = components[1:]
+        if index < len(segments) - 1:
+            components = components[:-1]
+        for component in components:
+            if len(component) > len(token):
+                token = component
+
+    return token.lower() or None
+
+
+class CompiledOwnershipRules:
+    def __init__(self, rules: Sequence[Rule]) -> None:
+        self.rules = rules
+        self.unindexed: list[int] = []
+        self.index: defaultdict[str, list[int]] = defaultdict(list)
+
+        for position, rule in enumerate(rules):
+            token = None
+            if rule.matcher.type in (PATH, CODEOWNERS):
+                token = get_index_token(rule.matcher.pattern)
+
+            if token is None:
+                self.unindexed.append(position)
+            else:
+                self.index[token].append(position)
+
+    def get_candidates(self, frames: Sequence[Mapping[str, Any]], keys: Sequence[str]) -> set[int]:
+        candidates = set(self.unindexed)
+        if not self.index:
+            return candidates
+
+        seen = set()
+        for frame in frames:
+            if not isinstance(frame, Mapping):
+                continue
+            for key in keys:
+                value = frame.get(key)
+                if not value or not isinstance(value, str) or value in seen:
+                    continue
+                seen.add(value)
+                for component in value.replace("\\", "/").lower().split("/"):
+                    candidates.update(self.index.get(component, ()))
+
+        return candidates
+
+    def get_matching_rules(self, data: Mapping[str, Any]) -> list[Rule]:
+        """
+        The rules matching the event, in schema order.
+        """
+        munged_data = Matcher.munge_if_needed(data)
+        return [
+            self.rules[position]
+            for position in sorted(self.get_candidates(*munged_data))
+            if self.rules[position].test(data, munged_data)
+        ]
+
+
+def get_schema_hash(schema: Mapping[str, Any]) -> str:
+    return hashlib.md5(orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def get_compiled_rules(schema: Mapping[str, Any]) -> CompiledOwnershipRules:
+    schema_hash = get_schema_hash(schema)
+    with _cache_lock:
+        compiled = _cache.get(schema_hash)
+        if compiled is not None:
+            _cache.move_to_end(schema_hash)
+            return compiled
+
+    compiled = CompiledOwnershipRules(load_schema(schema))
+    with _cache_lock:
+        _cache[schema_hash] = compiled
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return compiled
@@ -18,6 +18,7 @@ from sentry.users.services.user.service import user_service
 from sentry.utils.codeowners import codeowners_match
 from sentry.utils.event_frames import find_stack_frames, get_sdk_name, munged_filename_and_frames
 from sentry.utils.glob import glob_match
+from sentry.utils.hashlib import sha1_text
 from sentry.utils.safe import PathSearchable, get_path
 
 __all__ = ("parse_rules", "dump_schema", "load_schema")
@@ -462,6 +463,52 @@ def convert_codeowners_syntax(
     return result
 
 
+def get_codeowners_rules(codeowners: str) -> list[str]:
+    """The lines of CODEOWNERS text which aren't comments or empty"""
+    return [rule for rule in codeowners.splitlines() if rule.strip() and not rule.startswith("#")]
+
+
+def get_codeowners_rule_hash(rule: str, code_mapping: RepositoryProjectPathConfig) -> str:
+    """Content hash of a CODEOWNERS rule and the code mapping it's converted with. Rules with the
+    same hash convert to the same schema rule as long as their owners' associations don't change.
+    """
+    return sha1_text(code_mapping.source_root, code_mapping.stack_root, rule.strip()).hexdigest()
+
+
+def convert_codeowners_rules(
+    project_id: int,
+    rules: Sequence[str],
+    associations: Mapping[str, Any],
+    code_mapping: RepositoryProjectPathConfig,
+) -> dict[str, dict[str, Any]]:
+    """Converts CODEOWNERS rules into schema rules, keyed by the rules' content hashes
+    rules: CODEOWNERS rules, see `get_codeowners_rules`
+    associations: dict of {externalName: sentryName}
+    code_mapping: RepositoryProjectPathConfig object
+
+    Rules without any associated owner are left out. Raises a ValidationError if an owner can't
+    be resolved, like `create_schema_from_issue_owners`.
+    """
+    rule_hashes = []
+    issue_owner_rules = ""
+    for rule in rules:
+        # Rules convert to a single line of IssueOwner syntax, or none at all
+        issue_owner_rule = convert_codeowners_syntax(rule, associations, code_mapping)
+        if issue_owner_rule:
+            rule_hashes.append(get_codeowners_rule_hash(rule, code_mapping))
+            issue_owner_rules += issue_owner_rule
+
+    if not rule_hashes:
+        return {}
+
+    schema = create_schema_from_issue_owners(project_id=project_id, issue_owners=issue_owner_rules)
+    assert schema is not None
+    return {
+        rule_hash: {**schema_rule, "hash": rule_hash}
+        for rule_hash, schema_rule in zip(rule_hashes, schema["rules"])
+    }
+
+
 def resolve_actors(owners: Iterable[Owner], project_id: int) -> dict[Owner, Actor]:
     """Convert a list of Owner objects into a dictionary
     of {Owner: Actor} pairs. Actors not identified are returned
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import logging
 import uuid
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Generator, Iterable, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any, Literal, NotRequired, TypedDict
 
@@ -29,6 +30,7 @@ from sentry.ingest.transaction_clusterer.rules import (
     get_sorted_rules,
 )
 from sentry.interfaces.security import DEFAULT_DISALLOWED_SOURCES
+from sentry.models.options.project_option import ProjectOption
 from sentry.models.organization import Organization
 from sentry.models.project import Project
 from sentry.models.projectkey import ProjectKey
@@ -81,6 +83,14 @@ MIN_CLUSTERER_RUNS = 10
 logger = logging.getLogger(__name__)
 
 
+def _record_exposed_feature(feature: str, has_feature: bool) -> bool:
+    metrics.incr(
+        "sentry.relay.config.features",
+        tags={"outcome": "enabled" if has_feature else "disabled", "feature": feature},
+    )
+    return has_feature
+
+
 def get_exposed_features(project: Project) -> Sequence[str]:
     active_features = []
     for feature in EXPOSABLE_FEATURES:
@@ -91,19 +101,51 @@ def get_exposed_features(project: Project) -> Sequence[str]:
         else:
             raise RuntimeError("EXPOSABLE_FEATURES must start with 'organizations:' or 'projects:'")
 
-        if has_feature:
-            metrics.incr(
-                "sentry.relay.config.features", tags={"outcome": "enabled", "feature": feature}
-            )
+        if _record_exposed_feature(feature, has_feature):
             active_features.append(feature)
-        else:
-            metrics.incr(
-                "sentry.relay.config.features", tags={"outcome": "disabled", "feature": feature}
-            )
 
     return active_features
 
 
+def get_exposed_features_bulk(
+    organization: Organization, projects: Sequence[Project]
+) -> Mapping[int, Sequence[str]]:
+    """
+    The exposed features of several projects of the organization, by project id. Organization
+    features are checked once for all projects and project features in a single batch, features
+    the batch can't answer are checked one by one like in :func:`get_exposed_features`.
+    """
+    organization_features = {}
+    project_features = []
+    for feature in EXPOSABLE_FEATURES:
+        if feature.startswith("organizations:"):
+            organization_features[feature] = features.has(feature, organization)
+        elif feature.startswith("projects:"):
+            project_features.append(feature)
+        else:
+            raise RuntimeError("EXPOSABLE_FEATURES must start with 'organizations:' or 'projects:'")
+
+    batch_results = features.batch_has(project_features, projects=projects) or {}
+
+    exposed_features = {}
+    for project in projects:
+        project_results = batch_results.get(f"project:{project.id}") or {}
+        active_features = []
+        for feature in EXPOSABLE_FEATURES:
+            if feature in organization_features:
+                has_feature = organization_features[feature]
+            else:
+                has_feature = project_results.get(feature)
+                if has_feature is None:
+                    has_feature = features.has(feature, project)
+
+            if _record_exposed_feature(feature, bool(has_feature)):
+                active_features.append(feature)
+        exposed_features[project.id] = active_features
+
+    return exposed_features
+
+
 def get_public_key_configs(
     project_keys: Iterable[ProjectKey] | None = None,
 ) -> list[Mapping[str, Any]]:
@@ -281,7 +323,9 @@ def get_metrics_config(timeout: TimeChecker, project: Project) -> Mapping[str, A
 
 
 def get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    exposed_features: Sequence[str] | None = None,
 ) -> ProjectConfig:
     """Constructs the ProjectConfig information.
     :param project: The project to load configuration for. Ensure that
@@ -291,6 +335,8 @@ def get_project_config(
         no project keys are provided it is assumed that the config does not
         need to contain auth information (this is the case when used in
         python's StoreView)
+    :param exposed_features: Pre-fetched exposed features of the project, see
+        :func:`get_exposed_features_bulk`.
     :return: a ProjectConfig object for the given project
     """
     with sentry_sdk.isolation_scope() as scope:
@@ -299,7 +345,38 @@ def get_project_config(
             sentry_sdk.start_transaction(name="get_project_config"),
             metrics.timer("relay.config.get_project_config.duration"),
         ):
-            return _get_project_config(project, project_keys=project_keys)
+            return _get_project_config(
+                project, project_keys=project_keys, exposed_features=exposed_features
+            )
+
+
+def get_project_configs(
+    project_keys: Sequence[tuple[Project, Sequence[ProjectKey]]],
+) -> list[ProjectConfig]:
+    """Constructs the ProjectConfigs of several projects of one organization.
+
+    This is the same as calling :func:`get_project_config` for every project
+    and its keys, but the options and features of all projects are fetched up
+    front in a few queries instead of a few per project.
+    :param project_keys: Pairs of a project and the keys to include in its
+        config. A project can be listed several times, e.g. once per key.
+    :return: the ProjectConfig of every pair, in the same order
+    """
+    projects = list({project.id: project for project, _ in project_keys}.values())
+    if not projects:
+        return []
+
+    organization = projects[0].organization
+    with _config_section("prefetch"):
+        ProjectOption.objects.get_all_values_bulk(projects)
+        exposed_features = get_exposed_features_bulk(organization, projects)
+
+    return [
+        get_project_config(
+            project, project_keys=keys, exposed_features=exposed_features[project.id]
+        )
+        for project, keys in project_keys
+    ]
 
 
 def get_dynamic_sampling_config(timeout: TimeChecker, project: Project) -> Mapping[str, Any] | None:
@@ -1000,15 +1077,29 @@ def _get_mobile_performance_profiles(organization: Organization) -> list[dict[st
     ]
 
 
+@contextmanager
+def _config_section(name: str) -> Generator[None]:
+    """
+    Traces and times a section of the project config.
+    """
+    with (
+        sentry_sdk.start_span(op=name),
+        metrics.timer("relay.config.section.duration", tags={"section": name}),
+    ):
+        yield
+
+
 def _get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    exposed_features: Sequence[str] | None = None,
 ) -> ProjectConfig:
     if project.status != ObjectStatus.ACTIVE:
         return ProjectConfig(project, disabled=True)
 
     public_keys = get_public_key_configs(project_keys=project_keys)
 
-    with sentry_sdk.start_span(op="get_public_config"):
+    with _config_section("get_public_config"):
         now = datetime.now(timezone.utc)
         cfg = {
             "disabled": False,
@@ -1033,9 +1124,11 @@ def _get_project_config(
 
     config = cfg["config"]
 
-    with sentry_sdk.start_span(op="get_exposed_features"):
-        if exposed_features := get_exposed_features(project):
-            config["features"] = exposed_features
+    with _config_section("get_exposed_features"):
+        if exposed_features is None:
+            exposed_features = get_exposed_features(project)
+        if exposed_features:
+            config["features"] = list(exposed_features)
 
     # NOTE: Omitting dynamicSampling because of a failure increases the number
     # of events forwarded by Relay, because dynamic sampling will stop filtering
@@ -1090,18 +1183,18 @@ def _get_project_config(
     if performance_score_profiles:
         config["performanceScore"] = {"profiles": performance_score_profiles}
 
-    with sentry_sdk.start_span(op="get_filter_settings"):
+    with _config_section("get_filter_settings"):
         if filter_settings := get_filter_settings(project):
             config["filterSettings"] = filter_settings
-    with sentry_sdk.start_span(op="get_grouping_config_dict_for_project"):
+    with _config_section("get_grouping_config_dict_for_project"):
         grouping_config = get_grouping_config_dict_for_project(project)
         if grouping_config is not None:
             config["groupingConfig"] = grouping_config
-    with sentry_sdk.start_span(op="get_event_retention"):
+    with _config_section("get_event_retention"):
         event_retention = quotas.backend.get_event_retention(project.organization)
         if event_retention is not None:
             config["eventRetention"] = event_retention
-    with sentry_sdk.start_span(op="get_all_quotas"):
+    with _config_section("get_all_quotas"):
         if quotas_config := get_quotas(project, keys=project_keys):
             config["quotas"] = quotas_config
 
@@ -39,12 +39,12 @@ from sentry.snuba.metrics.extraction import (
     WIDGET_QUERY_CACHE_MAX_CHUNKS,
     MetricSpec,
     MetricSpecType,
-    OnDemandMetricSpec,
     OnDemandMetricSpecVersioning,
     SpecVersion,
     TagMapping,
     TagSpec,
     are_specs_equal,
+    get_on_demand_metric_spec,
     should_use_on_demand_metrics,
 )
 from sentry.snuba.models import SnubaQuery
@@ -780,7 +780,7 @@ def _convert_aggregate_and_query_to_metrics(
         # Create as many specs as we support
         for spec_version in OnDemandMetricSpecVersioning.get_spec_versions():
             try:
-                on_demand_spec = OnDemandMetricSpec(
+                on_demand_spec = get_on_demand_metric_spec(
                     field=aggregate,
                     query=query,
                     environment=environment,
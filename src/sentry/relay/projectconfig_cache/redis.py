@@ -1,19 +1,31 @@
 import logging
-from collections.abc import Mapping
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
 
 import zstandard
 
+from sentry import options
 from sentry.relay.projectconfig_cache.base import ProjectConfigCache
 from sentry.utils import json, metrics, redis
 from sentry.utils.redis import validate_dynamic_cluster
 
 REDIS_CACHE_TIMEOUT = 3600  # 1 hr
 COMPRESSION_LEVEL = 3  # 3 is the default level of compression
+LOCAL_CACHE_SIZE = 10000
 
 logger = logging.getLogger(__name__)
 
 
+class LocalEntry(NamedTuple):
+    rev: bytes
+    config: Mapping[str, Any]
+    size: int
+    expires_at: float
+
+
 class RedisProjectConfigCache(ProjectConfigCache):
     def __init__(self, **options):
         cluster_key = options.get("cluster", "default")
@@ -22,6 +34,11 @@ class RedisProjectConfigCache(ProjectConfigCache):
         read_cluster_key = options.get("read_cluster", cluster_key)
         self.cluster_read = redis.redis_clusters.get_binary(read_cluster_key)
 
+        # In-process tier of decompressed configs and the revision they were read at, see
+        # `get_many`
+        self._local: OrderedDict[str, LocalEntry] = OrderedDict()
+        self._local_lock = threading.Lock()
+
         super().__init__(**options)
 
     def validate(self):
@@ -57,6 +74,10 @@ class RedisProjectConfigCache(ProjectConfigCache):
             # made transactional.
             if rev := config.get("rev"):
                 p.setex(self.__get_redis_rev_key(public_key), REDIS_CACHE_TIMEOUT, rev)
+            else:
+                # Configs without a revision (e.g. disabled ones) must not be shadowed by the
+                # previous config still in memory
+                p.delete(self.__get_redis_rev_key(public_key))
 
         p.execute()
 
@@ -65,14 +86,89 @@ class RedisProjectConfigCache(ProjectConfigCache):
         with self.cluster.pipeline() as p:
             for public_key in public_keys:
                 p.delete(self.__get_redis_key(public_key))
+                # The revision of a deleted config must not be used to serve it from memory
+                p.delete(self.__get_redis_rev_key(public_key))
             return_values = p.execute()
 
+        with self._local_lock:
+            for public_key in public_keys:
+                self._local.pop(public_key, None)
+
         metrics.incr(
-            "relay.projectconfig_cache.write", amount=sum(return_values), tags={"action": "delete"}
+            "relay.projectconfig_cache.write",
+            amount=sum(return_values[::2]),
+            tags={"action": "delete"},
         )
 
     def get(self, public_key):
-        rv_b = self.cluster_read.get(self.__get_redis_key(public_key))
+        return self.get_many([public_key])[public_key]
+
+    def get_many(self, public_keys: Iterable[str]) -> dict[str, Mapping[str, Any] | None]:
+        """
+        Fetch the configs of many public keys at once, with a pipeline per cluster node.
+
+        If the local tier is enabled, configs are also kept in memory for a short while. A config
+        in memory is used if the revision key in Redis still has the revision it was read at,
+        which skips fetching and decompressing it.
+        """
+        public_keys = list(public_keys)
+        local_ttl = options.get("relay.projectconfig-cache.local-ttl")
+
+        revs: dict[str, bytes | None] = {}
+        results: dict[str, Mapping[str, Any] | None] = {}
+        if local_ttl > 0:
+            with self.cluster_read.pipeline(transaction=False) as p:
+                for public_key in public_keys:
+                    p.get(self.__get_redis_rev_key(public_key))
+                revs = dict(zip(public_keys, p.execute()))
+            results = self.__get_local(revs)
+
+        missing = [public_key for public_key in public_keys if public_key not in results]
+        if missing:
+            with self.cluster_read.pipeline(transaction=False) as p:
+                for public_key in missing:
+                    p.get(self.__get_redis_key(public_key))
+                values = p.execute()
+
+            expires_at = time.monotonic() + local_ttl
+            for public_key, rv_b in zip(missing, values):
+                results[public_key] = config = self.__load(rv_b)
+                rev = revs.get(public_key)
+                if rev is not None and config is not None and config.get("rev") == rev.decode():
+                    self.__set_local(public_key, LocalEntry(rev, config, len(rv_b), expires_at))
+
+        return results
+
+    def __get_local(self, revs: Mapping[str, bytes | None]) -> dict[str, Mapping[str, Any]]:
+        now = time.monotonic()
+        results = {}
+        bytes_saved = 0
+        with self._local_lock:
+            for public_key, rev in revs.items():
+                entry = self._local.get(public_key)
+                if entry is None or rev is None:
+                    continue
+                if entry.rev != rev or entry.expires_at < now:
+                    del self._local[public_key]
+                    continue
+
+                self._local.move_to_end(public_key)
+                results[public_key] = entry.config
+                bytes_saved += entry.size
+
+        metrics.incr("relay.projectconfig_cache.local.hit", amount=len(results))
+        metrics.incr("relay.projectconfig_cache.local.miss", amount=len(revs) - len(results))
+        metrics.incr("relay.projectconfig_cache.local.bytes_saved", amount=bytes_saved)
+        return results
+
+    def __set_local(self, public_key: str, entry: LocalEntry) -> None:
+        with self._local_lock:
+            self._local[public_key] = entry
+            self._local.move_to_end(public_key)
+            if len(self._local) > LOCAL_CACHE_SIZE:
+                self._local.popitem(last=False)
+
+    def __load(self, rv_b: bytes | None) -> Mapping[str, Any] | None:
         if rv_b is not None:
             try:
                 rv = zstandard.decompress(rv_b).decode()
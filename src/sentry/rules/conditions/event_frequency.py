@@ -21,6 +21,8 @@ from sentry.issues.grouptype import GroupCategory, get_group_type_by_type_id
 from sentry.models.group import Group
 from sentry.rules import EventState
 from sentry.rules.conditions.base import EventCondition, GenericCondition
+from sentry.rules.processing import frequency_counters
+from sentry.rules.processing.frequency_counters import FrequencyCounter
 from sentry.tsdb.base import TSDBModel
 from sentry.types.condition_activity import (
     FREQUENCY_CONDITION_BUCKET_SIZE,
@@ -129,6 +131,11 @@ class _QSTypedDict(TypedDict):
 class BaseEventFrequencyCondition(EventCondition, abc.ABC):
     intervals = STANDARD_INTERVALS
     form_cls = EventFrequencyForm
+    # Whether `batch_query_hook` only depends on the groups it's given, so delayed processing can
+    # query the groups of several projects of an organization at once.
+    supports_cross_project_batch_query = True
+    # The Redis frequency counter which can answer this condition's queries over short windows
+    frequency_counter: FrequencyCounter | None = None
 
     def __init__(
         self,
@@ -223,6 +230,9 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
         """
         Queries Snuba for a unique condition for a single group.
         """
+        result = self.get_counter_result({event.group_id}, start, end, environment_id)
+        if result and event.group_id in result:
+            return result[event.group_id]
         return self.query_hook(event, start, end, environment_id)
 
     def query_hook(
@@ -240,7 +250,27 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
         """
         Queries Snuba for a unique condition for multiple groups.
         """
-        return self.batch_query_hook(group_ids, start, end, environment_id)
+        result = self.get_counter_result(group_ids, start, end, environment_id)
+        if result is None:
+            return self.batch_query_hook(group_ids, start, end, environment_id)
+
+        missing_group_ids = group_ids - result.keys()
+        if missing_group_ids:
+            result.update(self.batch_query_hook(missing_group_ids, start, end, environment_id))
+        return result
+
+    def get_counter_result(
+        self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
+    ) -> dict[int, int] | None:
+        """
+        Answers the query from the condition's Redis frequency counter, for the groups it can.
+        Returns `None` if the counters are disabled or can't answer the query.
+        """
+        if self.frequency_counter is None or not frequency_counters.is_enabled():
+            return None
+        return frequency_counters.get_counts(
+            self.frequency_counter, group_ids, start, end, environment_id
+        )
 
     def batch_query_hook(
         self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
@@ -410,6 +440,7 @@ class BaseEventFrequencyCondition(EventCondition, abc.ABC):
 class EventFrequencyCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventFrequencyCondition"
     label = "The issue is seen more than {value} times in {interval}"
+    frequency_counter = FrequencyCounter.EVENTS
 
     def query_hook(
         self, event: GroupEvent, start: datetime, end: datetime, environment_id: int
@@ -473,6 +504,7 @@ class EventFrequencyCondition(BaseEventFrequencyCondition):
 class EventUniqueUserFrequencyCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventUniqueUserFrequencyCondition"
     label = "The issue is seen by more than {value} users in {interval}"
+    frequency_counter = FrequencyCounter.USERS
 
     def query_hook(
         self, event: GroupEvent, start: datetime, end: datetime, environment_id: int
@@ -582,6 +614,9 @@ class EventFrequencyPercentCondition(BaseEventFrequencyCondition):
     id = "sentry.rules.conditions.event_frequency.EventFrequencyPercentCondition"
     label = "The issue affects more than {value} percent of sessions in {interval}"
     logger = logging.getLogger("sentry.rules.event_frequency")
+    # The session count is queried for the project of the first group only
+    supports_cross_project_batch_query = False
+    frequency_counter = FrequencyCounter.EVENTS
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.intervals = PERCENT_INTERVALS
@@ -625,13 +660,44 @@ class EventFrequencyPercentCondition(BaseEventFrequencyCondition):
             return int(session_count / (60 / interval_in_minutes))
         return None
 
+    def get_avg_sessions_in_interval(
+        self, project_id: int, environment_id: int, start: datetime, end: datetime
+    ) -> int | None:
+        session_count_last_hour = self.get_session_count(project_id, environment_id, start, end)
+        return self.get_session_interval(session_count_last_hour, self.get_option("interval"))
+
+    def get_counter_result(
+        self, group_ids: set[int], start: datetime, end: datetime, environment_id: int
+    ) -> dict[int, int] | None:
+        issue_counts = super().get_counter_result(group_ids, start, end, environment_id)
+        if not issue_counts:
+            return issue_counts
+
+        groups = Group.objects.filter(id__in=issue_counts.keys()).values(
+            "id", "type", "project_id", "project__organization_id"
+        )
+        project_id = self.get_value_from_groups(groups, "project_id")
+        avg_sessions_in_interval = (
+            self.get_avg_sessions_in_interval(project_id, environment_id, start, end)
+            if project_id
+            else None
+        )
+        error_issue_ids, _ = self.get_error_and_generic_group_ids(groups)
+
+        batch_percents: dict[int, int] = {group["id"]: 0 for group in groups}
+        if avg_sessions_in_interval:
+            # We do not have sessions for non-error issue types
+            for group_id in error_issue_ids:
+                count = issue_counts[group_id]
+                batch_percents[group_id] = int(100 * round(count / avg_sessions_in_interval, 4))
+        return batch_percents
+
     def query_hook(
         self, event: GroupEvent, start: datetime, end: datetime, environment_id: int
     ) -> int:
         project_id = event.project_id
-        session_count_last_hour = self.get_session_count(project_id, environment_id, start, end)
-        avg_sessions_in_interval = self.get_session_interval(
-            session_count_last_hour, self.get_option("interval")
+        avg_sessions_in_interval = self.get_avg_sessions_in_interval(
+            project_id, environment_id, start, end
         )
         if avg_sessions_in_interval:
             issue_count = self.get_snuba_query_result(
@@ -672,9 +738,8 @@ class EventFrequencyPercentCondition(BaseEventFrequencyCondition):
         if not project_id:
             return {group["id"]: 0 for group in groups}
 
-        session_count_last_hour = self.get_session_count(project_id, environment_id, start, end)
-        avg_sessions_in_interval = self.get_session_interval(
-            session_count_last_hour, self.get_option("interval")
+        avg_sessions_in_interval = self.get_avg_sessions_in_interval(
+            project_id, environment_id, start, end
         )
 
         if not avg_sessions_in_interval:
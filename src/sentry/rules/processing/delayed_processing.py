@@ -2,7 +2,7 @@ import logging
 import math
 import uuid
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from datetime import datetime, timedelta, timezone
 from itertools import islice
 from typing import Any, DefaultDict, NamedTuple
@@ -76,6 +76,20 @@ class DataAndGroups(NamedTuple):
         return f"<DataAndGroups data: {self.data} group_ids: {self.group_ids}>"
 
 
+class DelayedProject(NamedTuple):
+    """
+    Everything read from the buffer and the database which is needed to process the delayed rules of
+    a project (batch), apart from the Snuba query results.
+    """
+
+    project: Project
+    batch_key: str | None
+    rulegroup_to_event_data: dict[str, str]
+    rules_to_groups: DefaultDict[int, set[int]]
+    alert_rules: list[Rule]
+    condition_groups: dict[UniqueConditionQuery, DataAndGroups]
+
+
 def fetch_project(project_id: int) -> Project | None:
     try:
         return Project.objects.get_from_cache(id=project_id)
@@ -299,48 +313,120 @@ def get_group_to_groupevent(
     )
 
 
+def get_condition_query_result(
+    unique_condition: UniqueConditionQuery,
+    condition_data: EventFrequencyConditionData,
+    group_ids: set[int],
+    project: Project,
+    current_time: datetime,
+) -> dict[int, int] | None:
+    """
+    Run the Snuba query of a unique condition for the given groups. Returns `None` if the
+    condition isn't a registered frequency condition.
+    """
+    cls_id = unique_condition.cls_id
+    condition_cls = rules.get(cls_id)
+    if condition_cls is None:
+        logger.warning(
+            "Unregistered condition %r",
+            cls_id,
+            extra={"project_id": project.id},
+        )
+        return None
+
+    condition_inst = condition_cls(project=project, data=condition_data)  # type: ignore[arg-type]
+    if not isinstance(condition_inst, BaseEventFrequencyCondition):
+        logger.warning("Unregistered condition %r", cls_id, extra={"project_id": project.id})
+        return None
+
+    _, duration = condition_inst.intervals[unique_condition.interval]
+
+    comparison_interval: timedelta | None = None
+    if unique_condition.comparison_interval is not None:
+        comparison_interval = COMPARISON_INTERVALS_VALUES.get(unique_condition.comparison_interval)
+
+    result = safe_execute(
+        condition_inst.get_rate_bulk,
+        duration=duration,
+        group_ids=group_ids,
+        environment_id=unique_condition.environment_id,
+        current_time=current_time,
+        comparison_interval=comparison_interval,
+    )
+    return result or {}
+
+
 def get_condition_group_results(
     condition_groups: dict[UniqueConditionQuery, DataAndGroups], project: Project
 ) -> dict[UniqueConditionQuery, dict[int, int]] | None:
     condition_group_results = {}
     current_time = datetime.now(tz=timezone.utc)
-    project_id = project.id
 
     for unique_condition, (condition_data, group_ids) in condition_groups.items():
-        cls_id = unique_condition.cls_id
-        condition_cls = rules.get(cls_id)
-        if condition_cls is None:
-            logger.warning(
-                "Unregistered condition %r",
-                cls_id,
-                extra={"project_id": project_id},
-            )
-            continue
+        result = get_condition_query_result(
+            unique_condition, condition_data, group_ids, project, current_time
+        )
+        if result is not None:
+            condition_group_results[unique_condition] = result
 
-        condition_inst = condition_cls(project=project, data=condition_data)  # type: ignore[arg-type]
-        if not isinstance(condition_inst, BaseEventFrequencyCondition):
-            logger.warning("Unregistered condition %r", cls_id, extra={"project_id": project_id})
-            continue
+    return condition_group_results
 
-        _, duration = condition_inst.intervals[unique_condition.interval]
 
-        comparison_interval: timedelta | None = None
-        if unique_condition.comparison_interval is not None:
-            comparison_interval = COMPARISON_INTERVALS_VALUES.get(
-                unique_condition.comparison_interval
-            )
+def get_condition_group_results_for_projects(
+    condition_groups_by_project: Mapping[Project, dict[UniqueConditionQuery, DataAndGroups]],
+) -> dict[int, dict[UniqueConditionQuery, dict[int, int]]]:
+    """
+    Cross-project variant of `get_condition_group_results`, returning the results keyed by project
+    ID. Identical unique condition queries of projects in the same organization are merged into a
+    single query for the groups of all of them, as long as the condition's query only depends on
+    the groups. Group IDs are unique across projects, so every project can look its groups up in the
+    merged results.
+    """
+    current_time = datetime.now(tz=timezone.utc)
+    results: dict[int, dict[UniqueConditionQuery, dict[int, int]]] = {
+        project.id: {} for project in condition_groups_by_project
+    }
+
+    merged: DefaultDict[
+        tuple[int, UniqueConditionQuery], list[tuple[Project, DataAndGroups]]
+    ] = defaultdict(list)
+    for project, condition_groups in condition_groups_by_project.items():
+        for unique_condition, data_and_groups in condition_groups.items():
+            condition_cls = rules.get(unique_condition.cls_id)
+            if getattr(condition_cls, "supports_cross_project_batch_query", False):
+                merged[(project.organization_id, unique_condition)].append(
+                    (project, data_and_groups)
+                )
+                continue
 
-        result = safe_execute(
-            condition_inst.get_rate_bulk,
-            duration=duration,
-            group_ids=group_ids,
-            environment_id=unique_condition.environment_id,
-            current_time=current_time,
-            comparison_interval=comparison_interval,
+            result = get_condition_query_result(
+                unique_condition, *data_and_groups, project, current_time
+            )
+            if result is not None:
+                results[project.id][unique_condition] = result
+
+    for (_, unique_condition), projects_data_and_groups in merged.items():
+        project, (condition_data, _) = projects_data_and_groups[0]
+        group_ids: set[int] = set()
+        for _, data_and_groups in projects_data_and_groups:
+            group_ids.update(data_and_groups.group_ids)
+
+        tags = {"condition": unique_condition.cls_id.rsplit(".", 1)[-1]}
+        metrics.distribution(
+            "delayed_processing.coalesced_query.num_projects",
+            len(projects_data_and_groups),
+            tags=tags,
         )
-        condition_group_results[unique_condition] = result or {}
+        with metrics.timer("delayed_processing.coalesced_query.duration", tags=tags):
+            result = get_condition_query_result(
+                unique_condition, condition_data, group_ids, project, current_time
+            )
 
-    return condition_group_results
+        if result is not None:
+            for project, _ in projects_data_and_groups:
+                results[project.id][unique_condition] = result
+
+    return results
 
 
 def passes_comparison(
@@ -476,7 +562,7 @@ def bucket_num_groups(num_groups: int) -> str:
     return "1"
 
 
-def process_rulegroups_in_batches(project_id: int):
+def process_rulegroups_in_batches(project_id: int, small_project_ids: list[int] | None = None):
     """
     This will check the number of rulegroup_to_event_data items in the Redis buffer for a project.
 
@@ -490,6 +576,9 @@ def process_rulegroups_in_batches(project_id: int):
     redis doesn't maintain the sort order of the hash keys.
 
     `apply_delayed` will fetch the batch from redis and process the rules.
+
+    If `small_project_ids` is passed, a project which fits into a single batch is appended to it
+    instead, to be processed together with other small projects by `dispatch_coalesced_projects`.
     """
     batch_size = options.get("delayed_processing.batch_size")
     event_count = buffer.backend.get_hash_length(Project, {"project_id": project_id})
@@ -498,6 +587,9 @@ def process_rulegroups_in_batches(project_id: int):
     )
 
     if event_count < batch_size:
+        if small_project_ids is not None:
+            small_project_ids.append(project_id)
+            return
         return apply_delayed.delay(project_id)
 
     logger.info(
@@ -537,12 +629,39 @@ def process_delayed_alert_conditions() -> None:
         log_str = ", ".join(f"{project_id}: {timestamp}" for project_id, timestamp in project_ids)
         logger.info("delayed_processing.project_id_list", extra={"project_ids": log_str})
 
+        small_project_ids: list[int] | None = None
+        if options.get("delayed_processing.cross_project_batch.max_projects") > 1:
+            small_project_ids = []
+
         for project_id, _ in project_ids:
-            process_rulegroups_in_batches(project_id)
+            process_rulegroups_in_batches(project_id, small_project_ids)
+
+        if small_project_ids:
+            dispatch_coalesced_projects(small_project_ids)
 
         buffer.backend.delete_key(PROJECT_ID_BUFFER_LIST_KEY, min=0, max=fetch_time.timestamp())
 
 
+def dispatch_coalesced_projects(project_ids: list[int]) -> None:
+    """
+    Schedule `apply_delayed_projects` for the projects, grouped by organization and chunked by the
+    configured max fan-in, so the Snuba queries of their delayed rules can be coalesced.
+    """
+    max_projects = options.get("delayed_processing.cross_project_batch.max_projects")
+    projects_by_org: DefaultDict[int, list[int]] = defaultdict(list)
+    for project_id, organization_id in Project.objects.filter(id__in=project_ids).values_list(
+        "id", "organization_id"
+    ):
+        projects_by_org[organization_id].append(project_id)
+
+    for org_project_ids in projects_by_org.values():
+        for chunk in chunked(sorted(org_project_ids), max_projects):
+            if len(chunk) == 1:
+                apply_delayed.delay(chunk[0])
+            else:
+                apply_delayed_projects.delay(chunk)
+
+
 @instrumented_task(
     name="sentry.rules.processing.delayed_processing",
     queue="delayed_rules",
@@ -556,9 +675,56 @@ def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **k
     """
     Grab rules, groups, and events from the Redis buffer, evaluate the "slow" conditions in a bulk snuba query, and fire them if they pass
     """
+    delayed_project = fetch_delayed_project(project_id, batch_key)
+    if not delayed_project:
+        return
+
+    with metrics.timer("delayed_processing.get_condition_group_results.duration"):
+        condition_group_results = get_condition_group_results(
+            delayed_project.condition_groups, delayed_project.project
+        )
+
+    fire_delayed_project(delayed_project, condition_group_results)
+
+
+@instrumented_task(
+    name="sentry.rules.processing.delayed_processing.apply_delayed_projects",
+    queue="delayed_rules",
+    default_retry_delay=5,
+    max_retries=5,
+    soft_time_limit=50,
+    time_limit=60,
+    silo_mode=SiloMode.REGION,
+)
+def apply_delayed_projects(project_ids: list[int], *args: Any, **kwargs: Any) -> None:
+    """
+    `apply_delayed` for several small projects of an organization at once, coalescing their Snuba
+    queries where possible. See `dispatch_coalesced_projects`.
+    """
+    with metrics.timer("delayed_processing.apply_delayed_projects.duration"):
+        delayed_projects = []
+        for project_id in project_ids:
+            if delayed_project := fetch_delayed_project(project_id):
+                delayed_projects.append(delayed_project)
+
+        with metrics.timer("delayed_processing.get_condition_group_results.duration"):
+            condition_group_results = get_condition_group_results_for_projects(
+                {
+                    delayed_project.project: delayed_project.condition_groups
+                    for delayed_project in delayed_projects
+                }
+            )
+
+        for delayed_project in delayed_projects:
+            fire_delayed_project(
+                delayed_project, condition_group_results[delayed_project.project.id]
+            )
+
+
+def fetch_delayed_project(project_id: int, batch_key: str | None = None) -> DelayedProject | None:
     project = fetch_project(project_id)
     if not project:
-        return
+        return None
 
     rulegroup_to_event_data = fetch_rulegroup_to_event_data(project_id, batch_key)
     rules_to_groups = get_rules_to_groups(rulegroup_to_event_data)
@@ -568,9 +734,22 @@ def apply_delayed(project_id: int, batch_key: str | None = None, *args: Any, **k
         "delayed_processing.condition_groups",
         extra={"condition_groups": condition_groups, "project_id": project_id},
     )
+    return DelayedProject(
+        project=project,
+        batch_key=batch_key,
+        rulegroup_to_event_data=rulegroup_to_event_data,
+        rules_to_groups=rules_to_groups,
+        alert_rules=alert_rules,
+        condition_groups=condition_groups,
+    )
 
-    with metrics.timer("delayed_processing.get_condition_group_results.duration"):
-        condition_group_results = get_condition_group_results(condition_groups, project)
+
+def fire_delayed_project(
+    delayed_project: DelayedProject,
+    condition_group_results: dict[UniqueConditionQuery, dict[int, int]] | None,
+) -> None:
+    project, batch_key, rulegroup_to_event_data, rules_to_groups, alert_rules, _ = delayed_project
+    project_id = project.id
 
     rules_to_slow_conditions = defaultdict(list)
     for rule in alert_rules:
@@ -0,0 +1,155 @@
+"""
+Sliding window event frequency counters, which let event frequency conditions answer queries over
+short windows from Redis instead of Snuba.
+
+Every group has a ring buffer of per-minute event counts for each environment it's seen in, and one
+for all environments. The ring buffers are hashes of `RING_SIZE` slots which are updated in
+post-processing, see `record_event`. Unique users are counted with a HyperLogLog per group,
+environment and minute. All keys of a group share a hash tag, so they can be read at once.
+
+Counts are kept per minute, so a window is approximated by as many minutes as it's long, ending
+with the (partial) minute of its end. Windows shorter than `MIN_WINDOW` would be too inaccurate and
+windows reaching further back than the ring buffer can't be answered, both of which are left to
+Snuba. So are groups whose counters were created after the start of a window, as events before then
+weren't counted.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+
+from sentry import options
+from sentry.utils import metrics, redis
+
+if TYPE_CHECKING:
+    from sentry.eventstore.models import GroupEvent
+
+#: Number of minute buckets per ring buffer, which covers 1 hour windows compared to 5 minutes ago.
+RING_SIZE = 65
+#: Ring buffers expire once the group hasn't been seen in the ring's time span.
+TTL = RING_SIZE * 60
+#: Shorter windows are answered by Snuba.
+MIN_WINDOW = timedelta(minutes=5)
+#: Counter of all environments, used by rules without an environment.
+ALL_ENVIRONMENTS = 0
+
+record_event_script = redis.load_redis_script("rules/frequency_counter.lua")
+
+
+class FrequencyCounter(Enum):
+    EVENTS = "events"
+    USERS = "users"
+
+
+def is_enabled() -> bool:
+    return options.get("rules.frequency-counters.enabled")
+
+
+def get_redis_client() -> Any:
+    return redis.redis_clusters.get(settings.SENTRY_RULE_FREQUENCY_COUNTERS_REDIS_CLUSTER)
+
+
+def _get_counts_key(group_id: int, environment_id: int) -> str:
+    return f"rfc:{{{group_id}}}:{environment_id}:c"
+
+
+def _get_users_key(group_id: int, environment_id: int, minute: int) -> str:
+    return f"rfc:{{{group_id}}}:{environment_id}:u:{minute}"
+
+
+def record_event(event: GroupEvent) -> None:
+    """
+    Count the event in the ring buffers of its group.
+    """
+    now = int(time.time()) // 60
+    minute = int(event.datetime.timestamp()) // 60
+    if minute <= now - RING_SIZE:
+        return
+
+    environment_ids = [ALL_ENVIRONMENTS, event.get_environment().id]
+    client = get_redis_client()
+    record_event_script(
+        [_get_counts_key(event.group_id, environment_id) for environment_id in environment_ids],
+        [minute, now, RING_SIZE, TTL],
+        client=client,
+    )
+
+    user = event.get_tag("sentry:user")
+    if user:
+        with client.pipeline(transaction=False) as pipeline:
+            for environment_id in environment_ids:
+                key = _get_users_key(event.group_id, environment_id, minute)
+                pipeline.pfadd(key, user)
+                pipeline.expire(key, TTL)
+            pipeline.execute()
+
+
+def _get_window_minutes(start: datetime, end: datetime) -> range:
+    end_minute = int(end.timestamp()) // 60
+    return range(end_minute - round((end - start) / timedelta(minutes=1)) + 1, end_minute + 1)
+
+
+def get_counts(
+    counter: FrequencyCounter,
+    group_ids: Iterable[int],
+    start: datetime,
+    end: datetime,
+    environment_id: int | None,
+) -> dict[int, int] | None:
+    """
+    Count the events or unique users of the groups within the window. Returns `None` if the window
+    can't be answered from the counters at all, and omits the groups which can't be answered.
+    """
+    now = int(time.time()) // 60
+    minutes = _get_window_minutes(start, end)
+    if end - start < MIN_WINDOW or minutes.start <= now - RING_SIZE:
+        return None
+
+    group_ids = list(group_ids)
+    environment_id = environment_id or ALL_ENVIRONMENTS
+    client = get_redis_client()
+    with client.pipeline(transaction=False) as pipeline:
+        for group_id in group_ids:
+            pipeline.hgetall(_get_counts_key(group_id, environment_id))
+            if counter == FrequencyCounter.USERS:
+                pipeline.pfcount(
+                    *(_get_users_key(group_id, environment_id, minute) for minute in minutes)
+                )
+        results = iter(pipeline.execute())
+
+    counts = {}
+    for group_id in group_ids:
+        ring = next(results)
+        user_count = next(results) if counter == FrequencyCounter.USERS else None
+        # Events of the window's first minute might not all have been counted
+        if not ring or int(ring["since"]) >= minutes.start:
+            continue
+
+        if user_count is not None:
+            counts[group_id] = user_count
+            continue
+
+        count = 0
+        for minute in minutes:
+            slot = minute % RING_SIZE
+            if int(ring.get(f"m{slot}", -1)) == minute:
+                count += int(ring[f"c{slot}"])
+        counts[group_id] = count
+
+    metrics.incr(
+        "rules.frequency_counters.groups",
+        amount=len(counts),
+        tags={"counter": counter.value, "answered": True},
+    )
+    metrics.incr(
+        "rules.frequency_counters.groups",
+        amount=len(group_ids) - len(counts),
+        tags={"counter": counter.value, "answered": False},
+    )
+    return counts
@@ -0,0 +1,27 @@
+-- Count an event in the minute bucket of ring buffers of per-minute event counts.
+-- Every key is a hash with a count field "c<slot>" and a minute field "m<slot>" per slot, plus a
+-- "since" field with the minute counting started in, which tells readers which windows are
+-- fully covered by the buffer.
+assert(#KEYS >= 1, "provide at least one ring buffer key")
+assert(#ARGV == 4, "provide the event minute, the current minute, the ring size and a TTL")
+
+local minute = tonumber(ARGV[1])
+local now = tonumber(ARGV[2])
+local size = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+
+local minute_field = "m" .. (minute % size)
+local count_field = "c" .. (minute % size)
+
+for _, key in ipairs(KEYS) do
+    redis.call("HSETNX", key, "since", now)
+    local stored = tonumber(redis.call("HGET", key, minute_field))
+    if stored == nil or stored < minute then
+        -- The slot holds a bucket which has fallen out of the ring, reuse it
+        redis.call("HSET", key, minute_field, minute, count_field, 1)
+    elseif stored == minute then
+        redis.call("HINCRBY", key, count_field, 1)
+    end
+    -- Otherwise the event is older than the ring and can't be counted anymore
+    redis.call("EXPIRE", key, ttl)
+end
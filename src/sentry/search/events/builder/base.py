@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Callable, Mapping, Sequence
+import time
+from collections.abc import Callable, Generator, Mapping, Sequence
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from re import Match
 from typing import Any, Union, cast
@@ -30,6 +32,7 @@ from snuba_sdk import (
     Request,
 )
 
+from sentry import options
 from sentry.api import event_search
 from sentry.discover.arithmetic import (
     OperandType,
@@ -60,8 +63,11 @@ from sentry.snuba.dataset import Dataset
 from sentry.snuba.metrics.utils import MetricMeta
 from sentry.snuba.query_sources import QuerySource
 from sentry.users.services.user.service import user_service
+from sentry.utils import metrics
+from sentry.utils.cache import cache
 from sentry.utils.dates import outside_retention_with_modified_start
 from sentry.utils.env import in_test_environment
+from sentry.utils.hashlib import md5_text
 from sentry.utils.snuba import (
     QueryOutsideRetentionError,
     UnqualifiedQueryError,
@@ -316,22 +322,40 @@ class BaseQueryBuilder:
         equations: list[str] | None = None,
         orderby: list[str] | str | None = None,
     ) -> None:
-        with sentry_sdk.start_span(op="QueryBuilder", description="resolve_query"):
-            with sentry_sdk.start_span(op="QueryBuilder", description="resolve_time_conditions"):
+        with self.resolve_section("resolve_query"):
+            with self.resolve_section("resolve_time_conditions"):
                 # Has to be done early, since other conditions depend on start and end
                 self.resolve_time_conditions()
-            with sentry_sdk.start_span(op="QueryBuilder", description="resolve_conditions"):
+            with self.resolve_section("resolve_conditions"):
                 self.where, self.having = self.resolve_conditions(query)
-            with sentry_sdk.start_span(op="QueryBuilder", description="resolve_params"):
+            with self.resolve_section("resolve_params"):
                 # params depends on parse_query, and conditions being resolved first since there may be projects in conditions
                 self.where += self.resolve_params()
-            with sentry_sdk.start_span(op="QueryBuilder", description="resolve_columns"):
+            with self.resolve_section("resolve_columns"):
                 self.columns = self.resolve_select(selected_columns, equations)
-            with sentry_sdk.start_span(op="QueryBuilder", description="resolve_orderby"):
+            with self.resolve_section("resolve_orderby"):
                 self.orderby = self.resolve_orderby(orderby)
-            with sentry_sdk.start_span(op="QueryBuilder", description="resolve_groupby"):
+            with self.resolve_section("resolve_groupby"):
                 self.groupby = self.resolve_groupby(groupby_columns)
 
+    @contextmanager
+    def resolve_section(self, description: str) -> Generator[None]:
+        """
+        Traces a section of the query resolution and reports the CPU time spent in it, which
+        excludes the time spent waiting on queries made while resolving, e.g. by the indexer.
+        """
+        start = time.thread_time()
+        try:
+            with sentry_sdk.start_span(op="QueryBuilder", description=description):
+                yield
+        finally:
+            metrics.distribution(
+                "query_builder.resolve.cpu_time",
+                time.thread_time() - start,
+                tags={"builder": type(self).__name__, "section": description},
+                unit="second",
+            )
+
     def parse_config(self) -> None:
         if not hasattr(self, "config") or self.config is None:
             raise Exception("Setup failed, dataset config was not loaded")
@@ -959,6 +983,22 @@ class BaseQueryBuilder:
 
         from sentry.snuba.metrics.datasource import get_custom_measurements
 
+        # Custom measurements are looked up over the last 90 days, regardless of the query's time
+        # range, so builders of the same projects can share them
+        cache_ttl = options.get("querybuilder.custom-measurements.cache-ttl")
+        cache_key = None
+        if cache_ttl > 0:
+            cache_key = "querybuilder:custom-measurements:{}:{}".format(
+                self.organization_id, md5_text(repr(sorted(self.params.project_ids))).hexdigest()
+            )
+            cached_result = cache.get(cache_key)
+            metrics.incr(
+                "query_builder.custom_measurements.cache",
+                tags={"result": "miss" if cached_result is None else "hit"},
+            )
+            if cached_result is not None:
+                return cached_result
+
         try:
             result: Sequence[MetricMeta] = get_custom_measurements(
                 project_ids=self.params.project_ids,
@@ -970,6 +1010,9 @@ class BaseQueryBuilder:
         except Exception as error:
             sentry_sdk.capture_exception(error)
             return []
+
+        if cache_key is not None:
+            cache.set(cache_key, result, cache_ttl)
         return result
 
     def get_custom_measurement_names_set(self) -> set[str]:
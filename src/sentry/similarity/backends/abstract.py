@@ -14,6 +14,15 @@ class AbstractIndexBackend(metaclass=ABCMeta):
     def record(self, scope, key, items, timestamp=None):
         pass
 
+    def record_many(self, scope, records):
+        """
+        Record the features of several keys within the scope. Records are `(key, items, timestamp)`
+        tuples, where items are the same as for `record`.
+        """
+        return [
+            self.record(scope, key, items, timestamp=timestamp) for key, items, timestamp in records
+        ]
+
     @abstractmethod
     def merge(self, scope, destination, items, timestamp=None):
         pass
@@ -32,13 +32,25 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
         self.candidate_set_limit = candidate_set_limit
 
     def _build_signature_arguments(self, features):
-        if not features:
-            return [0] * self.bands
-
-        arguments = []
-        for bucket in band(self.bands, self.signature_builder(features)):
-            arguments.extend([1, ",".join(str(b) for b in bucket), 1])
-        return arguments
+        return self._build_signatures_arguments([features])[0]
+
+    def _build_signatures_arguments(self, feature_sets):
+        # Signatures of all feature sets are built at once, which is a lot cheaper than one by one
+        signatures = iter(
+            self.signature_builder.build_many([features for features in feature_sets if features])
+        )
+
+        results = []
+        for features in feature_sets:
+            if not features:
+                results.append([0] * self.bands)
+                continue
+
+            arguments = []
+            for bucket in band(self.bands, next(signatures)):
+                arguments.extend([1, ",".join(str(b) for b in bucket), 1])
+            results.append(arguments)
+        return results
 
     def __index(self, scope, args):
         # scope must be passed into the script call as a key to allow the
@@ -89,9 +101,10 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
             limit if limit is not None else -1,
         ]
 
-        for idx, threshold, features in items:
+        signatures = self._build_signatures_arguments([features for _, _, features in items])
+        for (idx, threshold, _), signature in zip(items, signatures):
             arguments.extend([idx, threshold])
-            arguments.extend(self._build_signature_arguments(features))
+            arguments.extend(signature)
 
         return self._as_search_result(self.__index(scope, arguments))
 
@@ -136,9 +149,42 @@ class RedisScriptMinHashIndexBackend(AbstractIndexBackend):
             key,
         ]
 
-        for idx, features in items:
+        signatures = self._build_signatures_arguments([features for _, features in items])
+        for (idx, _), signature in zip(items, signatures):
             arguments.append(idx)
-            arguments.extend(self._build_signature_arguments(features))
+            arguments.extend(signature)
+
+        return self.__index(scope, arguments)
+
+    def record_many(self, scope, records):
+        records = [(key, items, timestamp) for key, items, timestamp in records if items]
+        if not records:
+            return  # nothing to do
+
+        arguments = [
+            "RECORD_MANY",
+            int(time.time()),
+            self.namespace,
+            self.bands,
+            self.interval,
+            self.retention,
+            self.candidate_set_limit,
+            scope,
+        ]
+
+        signatures = iter(
+            self._build_signatures_arguments(
+                [features for _, items, _ in records for _, features in items]
+            )
+        )
+        for key, items, timestamp in records:
+            if timestamp is None:
+                timestamp = int(time.time())
+
+            arguments.extend([key, timestamp, len(items)])
+            for idx, _ in items:
+                arguments.append(idx)
+                arguments.extend(next(signatures))
 
         return self.__index(scope, arguments)
 
@@ -1,8 +1,59 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from typing import Any
 
 import mmh3
+import numpy as np
+
+
+def _rotl32(value: Any, shift: int) -> Any:
+    return (value << np.uint32(shift)) | (value >> np.uint32(32 - shift))
+
+
+def _murmurhash3_32(values: Sequence[bytes], seeds: Sequence[int]) -> Any:
+    """
+    MurmurHash3 (x86, 32 bit) of every value with every seed, as an array of signed integers with
+    a row per value and a column per seed. The results are identical to `mmh3.hash(value, seed)`.
+    """
+    c1, c2 = np.uint32(0xCC9E2D51), np.uint32(0x1B873593)
+
+    # Values are sorted by length, so the ones which still have blocks left at any position are a
+    # prefix of the rows and their hashes can be updated in place
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    order = np.argsort(-lengths, kind="stable")
+    lengths = lengths[order]
+    values = [values[i] for i in order]
+    # Values are padded with zeros to the same number of 4 byte blocks, which makes the partial
+    # block at the end of each value its tail
+    width = max(int(lengths.max(initial=0)) + 3, 4) // 4 * 4
+    blocks = (
+        np.frombuffer(b"".join(value.ljust(width, b"\0") for value in values), dtype="<u4")
+        .reshape(len(values), width // 4)
+        .astype(np.uint32)
+    )
+    block_counts = lengths // 4
+
+    h = np.tile(np.asarray(seeds, dtype=np.uint32), (len(values), 1))
+    for position in range(int(block_counts.max(initial=0))):
+        active = int(np.count_nonzero(block_counts > position))
+        k = _rotl32(blocks[:active, position] * c1, 15) * c2
+        h[:active] = _rotl32(h[:active] ^ k[:, None], 13) * np.uint32(5) + np.uint32(0xE6546B64)
+
+    tails = blocks[np.arange(len(values)), np.minimum(block_counts, blocks.shape[1] - 1)]
+    k = _rotl32(tails * c1, 15) * c2
+    h = np.where((lengths % 4 > 0)[:, None], h ^ k[:, None], h)
+
+    h ^= lengths.astype(np.uint32)[:, None]
+    h ^= h >> np.uint32(16)
+    h *= np.uint32(0x85EBCA6B)
+    h ^= h >> np.uint32(13)
+    h *= np.uint32(0xC2B2AE35)
+    h ^= h >> np.uint32(16)
+
+    hashes = np.empty_like(h)
+    hashes[order] = h
+    return hashes.view(np.int32)
 
 
 class MinHashSignatureBuilder:
@@ -15,3 +66,25 @@ class MinHashSignatureBuilder:
             min(mmh3.hash(feature, column) % self.rows for feature in features)
             for column in range(self.columns)
         ]
+
+    def build_many(self, feature_sets: Iterable[Iterable[str | bytes]]) -> list[list[int]]:
+        """
+        Signatures of several feature sets, the same as calling the builder on each of them. The
+        features of all sets are hashed with all columns at once.
+        """
+        values = []
+        offsets = []
+        for features in feature_sets:
+            offsets.append(len(values))
+            values.extend(
+                feature.encode("utf8") if isinstance(feature, str) else feature
+                for feature in features
+            )
+            if len(values) == offsets[-1]:
+                raise ValueError("Cannot build the signature of an empty set of features")
+
+        if not offsets:
+            return []
+
+        buckets = _murmurhash3_32(values, range(self.columns)).astype(np.int64) % self.rows
+        return np.minimum.reduceat(buckets, offsets, axis=0).tolist()
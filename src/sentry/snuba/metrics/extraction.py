@@ -3,7 +3,8 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from enum import Enum
@@ -12,7 +13,7 @@ from typing import Any, Literal, NamedTuple, NotRequired, Optional, Self, TypedD
 import sentry_sdk
 from django.utils.functional import cached_property
 
-from sentry import features
+from sentry import features, options
 from sentry.api import event_search
 from sentry.api.event_search import (
     AggregateFilter,
@@ -38,6 +39,7 @@ from sentry.snuba.dataset import Dataset
 from sentry.snuba.metrics.naming_layer.mri import ParsedMRI, parse_mri
 from sentry.snuba.metrics.utils import MetricOperationType
 from sentry.utils import metrics
+from sentry.utils.cache import cache
 from sentry.utils.hashlib import md5_text
 from sentry.utils.snuba import is_measurement, is_span_op_breakdown, resolve_column
 
@@ -1186,6 +1188,15 @@ class QueryParsingResult:
         return len(self.conditions) == 0
 
 
+#: Number of specs kept in the process-local cache of `get_on_demand_metric_spec`.
+SPEC_CACHE_SIZE = 10000
+#: How long the query hashes and conditions of specs are kept in the shared cache.
+SPEC_CACHE_TTL = 24 * 60 * 60
+
+_spec_cache: OrderedDict[str, OnDemandMetricSpec] = OrderedDict()
+_spec_cache_lock = threading.Lock()
+
+
 class MetricSpecType(Enum):
     # Encodes environment into the query hash, does not support group-by environment
     SIMPLE_QUERY = "simple_query"
@@ -1552,7 +1563,7 @@ def fetch_on_demand_metric_spec(
     """Function to query the right spec based on the feature flags for an organization."""
     # The spec version defines what OnDemandMetricSpec version is created
     spec_version = OnDemandMetricSpecVersioning.get_query_spec_version(org_id)
-    return OnDemandMetricSpec(
+    return get_on_demand_metric_spec(
         field=field,
         query=query,
         environment=environment,
@@ -1562,6 +1573,97 @@ def fetch_on_demand_metric_spec(
     )
 
 
+def _get_spec_cache_key(
+    field: str,
+    query: str,
+    environment: str | None,
+    groupbys: Sequence[str] | None,
+    spec_type: MetricSpecType,
+    spec_version: SpecVersion,
+) -> str:
+    return md5_text(
+        repr(
+            (
+                field,
+                query,
+                environment,
+                list(groupbys or ()),
+                spec_type.value,
+                spec_version.version,
+                sorted(spec_version.flags),
+            )
+        )
+    ).hexdigest()
+
+
+def get_on_demand_metric_spec(
+    field: str,
+    query: str,
+    environment: str | None = None,
+    groupbys: Sequence[str] | None = None,
+    spec_type: MetricSpecType = MetricSpecType.SIMPLE_QUERY,
+    spec_version: SpecVersion | None = None,
+) -> OnDemandMetricSpec:
+    """
+    Creates an `OnDemandMetricSpec` like its constructor, but reuses specs built from the same
+    arguments, e.g. by the same widget or alert for other projects.
+
+    Specs are kept in a process-local LRU cache. The query hash and condition derived from the
+    query, which need the query to be parsed, are also kept in the shared cache, so that they
+    survive across workers and config builds. Both caches are keyed by all arguments, so a spec
+    is rebuilt once its query changes.
+    """
+    if not options.get("on_demand_metrics.spec_cache.enabled"):
+        return OnDemandMetricSpec(
+            field=field,
+            query=query,
+            environment=environment,
+            groupbys=groupbys,
+            spec_type=spec_type,
+            spec_version=spec_version,
+        )
+
+    spec_version = spec_version or OnDemandMetricSpecVersioning.get_default_spec_version()
+    spec_cache_key = _get_spec_cache_key(
+        field, query, environment, groupbys, spec_type, spec_version
+    )
+    with _spec_cache_lock:
+        spec = _spec_cache.get(spec_cache_key)
+        if spec is not None:
+            _spec_cache.move_to_end(spec_cache_key)
+            metrics.incr("on_demand_metrics.spec_cache", tags={"result": "local_hit"})
+            return spec
+
+    spec = OnDemandMetricSpec(
+        field=field,
+        query=query,
+        environment=environment,
+        groupbys=groupbys,
+        spec_type=spec_type,
+        spec_version=spec_version,
+    )
+
+    derived_cache_key = f"on-demand.spec.{spec_cache_key}"
+    derived = cache.get(derived_cache_key)
+    if derived is None:
+        cache.set(
+            derived_cache_key,
+            {"query_hash": spec.query_hash, "condition": spec.condition},
+            timeout=SPEC_CACHE_TTL,
+        )
+        metrics.incr("on_demand_metrics.spec_cache", tags={"result": "miss"})
+    else:
+        # Seeds the cached properties, so the query isn't parsed again
+        spec.__dict__.update(derived)
+        metrics.incr("on_demand_metrics.spec_cache", tags={"result": "hit"})
+
+    with _spec_cache_lock:
+        _spec_cache[spec_cache_key] = spec
+        if len(_spec_cache) > SPEC_CACHE_SIZE:
+            _spec_cache.popitem(last=False)
+    return spec
+
+
 def _convert_countif_filter(key: str, op: str, value: str) -> RuleCondition:
     """Maps ``count_if`` arguments to a ``RuleCondition``."""
     assert op in _COUNTIF_TO_RELAY_OPERATORS, f"Unsupported `count_if` operator {op}"
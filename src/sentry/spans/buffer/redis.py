@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import NamedTuple
 
 import sentry_sdk
@@ -9,9 +9,12 @@ from django.conf import settings
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
 
 from sentry import options
-from sentry.utils import redis
+from sentry.utils import metrics, redis
 from sentry.utils.iterators import chunked
 
+# How many entries of the unprocessed segments bucket are read per round-trip
+BUCKET_PAGE_SIZE = 1000
+
 
 @dataclasses.dataclass
 class ProcessSegmentsContext:
@@ -20,6 +23,15 @@ class ProcessSegmentsContext:
     should_process_segments: bool
 
 
+@dataclasses.dataclass
+class BufferedSegment:
+    key: str
+    spans: list[bytes]
+    # Whether the segment's spans exceeded the size cap, in which case `spans` is empty since the
+    # rest of the segment was never read
+    overflow: bool = False
+
+
 class SegmentKey(NamedTuple):
     segment_id: str
     project_id: int
@@ -129,27 +141,106 @@ class RedisSpansBuffer:
 
         return values
 
-    def get_unprocessed_segments_and_prune_bucket(self, now: int, partition: int) -> list[str]:
+    def iter_and_expire_segments(
+        self, keys: list[str], chunk_size: int, max_segment_bytes: int
+    ) -> Iterator[BufferedSegment]:
+        """
+        Streaming version of `read_and_expire_many_segments`. The first `chunk_size` spans of every
+        segment are read in one round-trip, larger segments are then read `chunk_size` spans at a
+        time. As soon as the spans read for a segment add up to more than `max_segment_bytes`, the
+        rest of it is skipped and the segment is yielded as an overflow, so memory stays bounded no
+        matter how large a trace gets.
+
+        Spans are removed from the head of a segment only once they've been read, and Redis deletes
+        the segment when its last span is removed. Spans appended while a segment is read are read
+        along with it, and spans appended after it's gone start a new segment, which gets scheduled
+        for processing like any other. Segments which haven't been read when iteration stops are
+        deleted.
+        """
+        # A segment recreated after being read is scheduled again, so the same key can come up twice
+        keys = list(dict.fromkeys(keys))
+        unread = set(keys)
+        try:
+            with self.client.pipeline(transaction=False) as p:
+                for key in keys:
+                    p.lrange(key, 0, chunk_size - 1)
+                first_chunks = p.execute()
+
+            # Most segments fit into their first chunk. Remove their spans in a single round-trip,
+            # picking up anything that was appended in the meantime.
+            small_keys = [key for key, chunk in zip(keys, first_chunks) if len(chunk) < chunk_size]
+            with self.client.pipeline(transaction=False) as p:
+                for key, chunk in zip(keys, first_chunks):
+                    if len(chunk) < chunk_size:
+                        p.ltrim(key, len(chunk), -1)
+                        p.lrange(key, 0, chunk_size - 1)
+                appended_chunks = dict(zip(small_keys, p.execute()[1::2]))
+
+            for key, chunk in zip(keys, first_chunks):
+                spans = list(chunk)
+                if key in appended_chunks:
+                    chunk = appended_chunks[key]
+                    spans.extend(chunk)
+
+                size = sum(len(span) for span in spans)
+                while chunk and size <= max_segment_bytes:
+                    with self.client.pipeline(transaction=False) as p:
+                        p.ltrim(key, len(chunk), -1)
+                        p.lrange(key, 0, chunk_size - 1)
+                        chunk = p.execute()[1]
+                    spans.extend(chunk)
+                    size += sum(len(span) for span in chunk)
+
+                if size > max_segment_bytes:
+                    self.client.delete(key)
+                    unread.discard(key)
+                    metrics.incr("spans.buffer.segment_overflow")
+                    yield BufferedSegment(key=key, spans=[], overflow=True)
+                else:
+                    unread.discard(key)
+                    yield BufferedSegment(key=key, spans=spans)
+        finally:
+            if unread:
+                self.client.delete(*unread)
+
+    def get_unprocessed_segments_and_prune_bucket(
+        self, now: int, partition: int, max_segments: int | None = None
+    ) -> list[str]:
+        """
+        Returns the keys of segments which have been buffered for longer than the buffer window,
+        and removes them from the bucket. The bucket is read in pages, and with `max_segments` only
+        that many segments are returned, the rest is left for the next call.
+        """
         key = get_unprocessed_segments_key(partition)
-        results = self.client.lrange(key, 0, -1) or []
-
         buffer_window = options.get("standalone-spans.buffer-window.seconds")
 
-        segment_keys = []
+        segment_keys: list[str] = []
         processed_segment_ts = None
-        for result in chunked(results, 2):
-            try:
-                segment_timestamp, segment_key = result
-                segment_timestamp = int(segment_timestamp)
-                if now - segment_timestamp < buffer_window:
+        start = 0
+        done = False
+        while not done:
+            results = self.client.lrange(key, start, start + BUCKET_PAGE_SIZE * 2 - 1) or []
+            start += len(results)
+            done = len(results) < BUCKET_PAGE_SIZE * 2
+
+            for result in chunked(results, 2):
+                if max_segments and len(segment_keys) >= max_segments:
+                    done = True
+                    break
+                try:
+                    segment_timestamp, segment_key = result
+                    segment_timestamp = int(segment_timestamp)
+                    if now - segment_timestamp < buffer_window:
+                        done = True
+                        break
+
+                    processed_segment_ts = segment_timestamp
+                    segment_keys.append(segment_key.decode("utf-8"))
+                except Exception:
+                    # Just in case something funky happens here
+                    sentry_sdk.capture_exception()
+                    done = True
                     break
-
-                processed_segment_ts = segment_timestamp
-                segment_keys.append(segment_key.decode("utf-8"))
-            except Exception:
-                # Just in case something funky happens here
-                sentry_sdk.capture_exception()
-                break
 
         self.client.ltrim(key, len(segment_keys) * 2, -1)
 
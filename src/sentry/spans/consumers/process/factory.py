@@ -210,7 +210,11 @@ def _expand_segments(should_process_segments: list[ProcessSegmentsContext]):
             payload_context = {}
 
             with txn.start_child(op="process", description="fetch_unprocessed_segments"):
-                keys = client.get_unprocessed_segments_and_prune_bucket(timestamp, partition)
+                keys = client.get_unprocessed_segments_and_prune_bucket(
+                    timestamp,
+                    partition,
+                    max_segments=options.get("standalone-spans.buffer-max-segments-per-flush"),
+                )
 
             sentry_sdk.set_measurement("segments.count", len(keys))
             if len(keys) > 0:
@@ -218,19 +222,30 @@ def _expand_segments(should_process_segments: list[ProcessSegmentsContext]):
 
             # With pipelining, redis server is forced to queue replies using
             # up memory, so batching the keys we fetch.
-            with txn.start_child(op="process", description="read_and_expire_many_segments"):
+            chunk_size = options.get("standalone-spans.buffer-read-chunk-size")
+            with txn.start_child(op="process", description="iter_and_expire_segments"):
                 for i in range(0, len(keys), BATCH_SIZE):
-                    segments = client.read_and_expire_many_segments(keys[i : i + BATCH_SIZE])
+                    for segment in client.iter_and_expire_segments(
+                        keys[i : i + BATCH_SIZE],
+                        chunk_size=chunk_size,
+                        max_segment_bytes=MAX_PAYLOAD_SIZE,
+                    ):
+                        if segment.overflow:
+                            logger.warning(
+                                "Failed to produce message: max payload size exceeded.",
+                                extra={"segment_key": segment.key},
+                            )
+                            metrics.incr("performance.buffered_segments.max_payload_size_exceeded")
+                            continue
 
-                    for j, segment in enumerate(segments):
-                        if not segment:
+                        if not segment.spans:
                             continue
 
-                        payload_data = prepare_buffered_segment_payload(segment)
+                        payload_data = prepare_buffered_segment_payload(segment.spans)
                         if len(payload_data) > MAX_PAYLOAD_SIZE:
                             logger.warning(
                                 "Failed to produce message: max payload size exceeded.",
-                                extra={"segment_key": keys[i + j]},
+                                extra={"segment_key": segment.key},
                             )
                             metrics.incr("performance.buffered_segments.max_payload_size_exceeded")
                             continue
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+import contextvars
 import logging
 import uuid
-from collections.abc import MutableMapping, Sequence
+from collections.abc import Callable, MutableMapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from time import time
 from typing import TYPE_CHECKING, Any, TypedDict
 
 import sentry_sdk
 from django.conf import settings
+from django.db import connections
 from django.db.models.signals import post_save
 from django.utils import timezone
 from google.api_core.exceptions import ServiceUnavailable
 
-from sentry import features, projectoptions
+from sentry import features, options, projectoptions
 from sentry.exceptions import PluginError
 from sentry.issues.grouptype import GroupCategory
 from sentry.issues.issue_occurrence import IssueOccurrence
@@ -58,6 +61,10 @@ locks = LockManager(
 ISSUE_OWNERS_PER_PROJECT_PER_MIN_RATELIMIT = 50
 HIGHER_ISSUE_OWNERS_PER_PROJECT_PER_MIN_RATELIMIT = 200
 
+_pipeline_step_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="post_process_step")
+# How often to check whether queued pipeline steps have started, and with that their timeout
+_PIPELINE_STEP_START_POLL_INTERVAL = 0.05
+
 
 class PostProcessJob(TypedDict, total=False):
     event: GroupEvent
@@ -708,7 +715,7 @@ def run_post_process_job(job: PostProcessJob) -> None:
         # specific pipelines for issue types
         pipeline = GROUP_CATEGORY_POST_PROCESS_PIPELINE[issue_category]
 
-    for pipeline_step in pipeline:
+    def run_pipeline_step(pipeline_step: Callable[[PostProcessJob], None]) -> None:
         try:
             with (
                 metrics.timer(
@@ -744,6 +751,98 @@ def run_post_process_job(job: PostProcessJob) -> None:
                 },
             )
 
+    if options.get("post_process.parallel-steps.enabled"):
+        run_pipeline_concurrently(
+            pipeline,
+            run_pipeline_step,
+            options.get("post_process.parallel-steps.step-timeout"),
+        )
+    else:
+        for pipeline_step in pipeline:
+            run_pipeline_step(pipeline_step)
+
+
+def run_pipeline_concurrently(
+    pipeline: Sequence[Callable[[PostProcessJob], None]],
+    run_pipeline_step: Callable[[Callable[[PostProcessJob], None]], None],
+    step_timeout: float,
+) -> None:
+    """
+    Runs the pipeline steps in a thread pool, starting each step as soon as the earlier steps it
+    depends on (see `PIPELINE_STEP_DEPENDENCIES`) are done. Steps which take longer than
+    `step_timeout` seconds after they started are left running in the background, and count as
+    done for the steps depending on them.
+    """
+    dependencies: list[set[int]] = []
+    for index, pipeline_step in enumerate(pipeline):
+        step_dependencies = PIPELINE_STEP_DEPENDENCIES.get(pipeline_step.__name__)
+        dependencies.append(
+            {
+                earlier_index
+                for earlier_index, earlier_step in enumerate(pipeline[:index])
+                if step_dependencies is None or earlier_step.__name__ in step_dependencies
+            }
+        )
+
+    pending = list(range(len(pipeline)))
+    running: dict[Future[None], int] = {}
+    # Start time of each step, set by the worker thread once the step leaves the pool's queue
+    started: dict[int, float] = {}
+    done: set[int] = set()
+    while pending or running:
+        for index in [index for index in pending if dependencies[index] <= done]:
+            pending.remove(index)
+            future = _pipeline_step_pool.submit(
+                contextvars.copy_context().run,
+                _run_pipeline_step_in_thread,
+                run_pipeline_step,
+                pipeline[index],
+                index,
+                started,
+            )
+            running[future] = index
+
+        now = time()
+        timeout = min(
+            (
+                started[index] + step_timeout - now
+                if index in started
+                else _PIPELINE_STEP_START_POLL_INTERVAL
+            )
+            for index in running.values()
+        )
+        completed, _ = wait(running, timeout=max(timeout, 0), return_when=FIRST_COMPLETED)
+        now = time()
+        for future, index in list(running.items()):
+            if future in completed:
+                del running[future]
+                done.add(index)
+            elif index in started and started[index] + step_timeout <= now:
+                del running[future]
+                done.add(index)
+                metrics.incr(
+                    "sentry.tasks.post_process.post_process_group.timeout",
+                    tags={"pipeline": pipeline[index].__name__},
+                )
+                logger.warning(
+                    "post_process.pipeline_step_timeout",
+                    extra={"pipeline": pipeline[index].__name__, "timeout": step_timeout},
+                )
+
+
+def _run_pipeline_step_in_thread(
+    run_pipeline_step: Callable[[Callable[[PostProcessJob], None]], None],
+    pipeline_step: Callable[[PostProcessJob], None],
+    index: int,
+    started: dict[int, float],
+) -> None:
+    started[index] = time()
+    try:
+        run_pipeline_step(pipeline_step)
+    finally:
+        # Database connections are per thread, don't leak the ones opened by this worker
+        connections.close_all()
+
 
 def process_event(data: MutableMapping[str, Any], group_id: int | None) -> Event:
     from sentry.eventstore.models import Event
@@ -975,12 +1074,22 @@ def process_replay_link(job: PostProcessJob) -> None:
         )
 
 
+def _record_frequency_counters(job: PostProcessJob) -> None:
+    from sentry.rules.processing import frequency_counters
+
+    if frequency_counters.is_enabled():
+        with metrics.timer("post_process.record_frequency_counters.duration"):
+            safe_execute(frequency_counters.record_event, job["event"])
+
+
 def process_rules(job: PostProcessJob) -> None:
     if job["is_reprocessed"]:
         return
 
     from sentry.rules.processing.processor import RuleProcessor
 
+    _record_frequency_counters(job)
+
     group_event = job["event"]
     is_new = job["group_state"]["is_new"]
     is_regression = job["group_state"]["is_regression"]
@@ -1503,6 +1612,37 @@ def detect_base_urls_for_uptime(job: PostProcessJob):
     detect_base_url_for_project(job["event"].project, url)
 
 
+# The earlier pipeline steps each step needs to run after when running them concurrently, either
+# because it reads job state they update, or because it acts on their changes to the group. Steps
+# which aren't listed run after all earlier steps.
+PIPELINE_STEP_DEPENDENCIES: dict[str, set[str]] = {
+    "_capture_group_stats": set(),
+    "process_snoozes": set(),
+    "process_inbox_adds": {"process_snoozes"},
+    "check_has_high_priority_alerts": set(),
+    "detect_new_escalation": {"process_snoozes"},
+    "process_commits": set(),
+    "handle_owner_assignment": set(),
+    "handle_auto_assignment": {"handle_owner_assignment"},
+    "process_rules": {
+        "process_snoozes",
+        "process_inbox_adds",
+        "detect_new_escalation",
+        "handle_auto_assignment",
+    },
+    "process_service_hooks": {"process_rules"},
+    "process_resource_change_bounds": set(),
+    "process_plugins": set(),
+    "process_code_mappings": set(),
+    "process_similarity": set(),
+    "update_existing_attachments": set(),
+    "fire_error_processed": set(),
+    "sdk_crash_monitoring": set(),
+    "process_replay_link": set(),
+    "link_event_to_user_report": set(),
+    "detect_base_urls_for_uptime": set(),
+}
+
 GROUP_CATEGORY_POST_PROCESS_PIPELINE = {
     GroupCategory.ERROR: [
         _capture_group_stats,
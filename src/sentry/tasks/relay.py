@@ -124,22 +124,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
         # it could be possible that refrequent invalidations cause the task to take excessive time
         # to complete.
         for organization in Organization.objects.filter(id=organization_id):
-            for project in Project.objects.filter(organization_id=organization_id):
-                project.set_cached_field_value("organization", organization)
-                for key in ProjectKey.objects.filter(project_id=project.id):
-                    key.set_cached_field_value("project", project)
-                    # If we find the config in the cache it means it was active.  As such we want to
-                    # recalculate it.  If the config was not there at all, we leave it and avoid the
-                    # cost of re-computation.
-                    if projectconfig_cache.backend.get(key.public_key) is not None:
-                        configs[key.public_key] = compute_projectkey_config(key)
-                        action = "recompute"
-                    else:
-                        action = "not-cached"
-                    metrics.incr(
-                        "relay.projectconfig_cache.invalidation.recompute",
-                        tags={"action": action, "scope": "organization"},
-                    )
+            configs.update(compute_organization_configs(organization))
     elif project_id:
         for project in Project.objects.filter(id=project_id):
             for key in ProjectKey.objects.filter(project_id=project_id):
@@ -178,6 +163,53 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     return configs
 
 
+def compute_organization_configs(organization):
+    """Computes the configs of all active keys in the organization.
+
+    Keys of all projects are loaded in one query and looked up in the cache at once, the configs
+    of the cached keys are then built in bulk by :func:`sentry.relay.config.get_project_configs`.
+
+    :returns: A dict mapping the public keys which were cached to their config.
+    """
+    from sentry.models.project import Project
+    from sentry.models.projectkey import ProjectKey, ProjectKeyStatus
+    from sentry.relay.config import get_project_configs
+
+    projects = {}
+    for project in Project.objects.filter(organization_id=organization.id):
+        project.set_cached_field_value("organization", organization)
+        projects[project.id] = project
+
+    keys = list(ProjectKey.objects.filter(project_id__in=list(projects)))
+    cached = projectconfig_cache.backend.get_many([key.public_key for key in keys])
+
+    configs = {}
+    pending = []
+    for key in keys:
+        key.set_cached_field_value("project", projects[key.project_id])
+        # If we find the config in the cache it means it was active.  As such we want to
+        # recalculate it.  If the config was not there at all, we leave it and avoid the
+        # cost of re-computation.
+        if cached.get(key.public_key) is None:
+            action = "not-cached"
+        elif key.status != ProjectKeyStatus.ACTIVE:
+            configs[key.public_key] = {"disabled": True}
+            action = "recompute"
+        else:
+            pending.append(key)
+            action = "recompute"
+        metrics.incr(
+            "relay.projectconfig_cache.invalidation.recompute",
+            tags={"action": action, "scope": "organization"},
+        )
+
+    project_configs = get_project_configs([(key.project, [key]) for key in pending])
+    for key, project_config in zip(pending, project_configs):
+        configs[key.public_key] = project_config.to_dict()
+
+    return configs
+
+
 def compute_projectkey_config(key):
     """Computes a single config for the given :class:`ProjectKey`.
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import random
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from time import time
 from typing import Any
@@ -25,13 +25,17 @@ from sentry.models.project import Project
 from sentry.silo.base import SiloMode
 from sentry.stacktraces.processing import process_stacktraces, should_process_for_stacktraces
 from sentry.tasks.base import instrumented_task
-from sentry.utils import metrics
+from sentry.utils import metrics, redis
 from sentry.utils.safe import safe_execute
 from sentry.utils.sdk import set_current_event_project
 
 error_logger = logging.getLogger("sentry.errors.events")
 info_logger = logging.getLogger("sentry.store")
 
+# How long events collected for `save_event_batch` are kept around, matching
+# the lifetime of their payloads in the processing store.
+SAVE_EVENT_BATCH_TTL = 60 * 60 * 24
+
 
 class RetryProcessing(Exception):
     pass
@@ -95,6 +99,14 @@ def submit_save_event(
     if cache_key:
         data = None
 
+        if (
+            not task_kind.has_attachments
+            and not task_kind.from_reprocessing
+            and options.get("store.save-event-batch.enabled")
+        ):
+            _enqueue_save_event_batch(project_id, cache_key, start_time)
+            return
+
     # XXX: honor from_reprocessing
     if task_kind.has_attachments:
         task = save_event_attachments
@@ -112,6 +124,29 @@ def submit_save_event(
     task.delay(**task_kwargs)
 
 
+def _get_save_event_batch_key(project_id: int) -> str:
+    return f"save-event-batch:{project_id}"
+
+
+def _enqueue_save_event_batch(project_id: int, cache_key: str, start_time: float | None) -> None:
+    client = redis.redis_clusters.get(settings.SENTRY_SAVE_EVENT_BATCH_CLUSTER)
+    key = _get_save_event_batch_key(project_id)
+
+    with client.pipeline() as pipeline:
+        pipeline.rpush(key, orjson.dumps([cache_key, start_time]))
+        pipeline.expire(key, SAVE_EVENT_BATCH_TTL)
+        pending, _ = pipeline.execute()
+
+    # The first event of a batch schedules its save, and a full batch is saved right away.
+    if pending == 1:
+        save_event_batch.apply_async(
+            kwargs={"project_id": project_id},
+            countdown=options.get("store.save-event-batch.max-delay"),
+        )
+    elif pending % options.get("store.save-event-batch.size") == 0:
+        save_event_batch.delay(project_id=project_id)
+
+
 def _do_preprocess_event(
     cache_key: str,
     data: MutableMapping[str, Any] | None,
@@ -592,6 +627,144 @@ def _do_save_event(
             time_synthetic_monitoring_event(data, project_id, start_time)
 
 
+def _flush_save_event_batch(project_id: int) -> None:
+    """
+    Saves the oldest events collected by `submit_save_event` for a project.
+    """
+    client = redis.redis_clusters.get(settings.SENTRY_SAVE_EVENT_BATCH_CLUSTER)
+    key = _get_save_event_batch_key(project_id)
+    batch_size = options.get("store.save-event-batch.size")
+
+    with client.pipeline() as pipeline:
+        pipeline.lrange(key, 0, batch_size - 1)
+        pipeline.ltrim(key, batch_size, -1)
+        pipeline.llen(key)
+        entries, _, remaining = pipeline.execute()
+
+    # Events which arrived while the batch was full are not scheduled by themselves.
+    if remaining:
+        save_event_batch.delay(project_id=project_id)
+
+    if not entries:
+        return
+
+    cache_keys = []
+    start_times = []
+    for entry in entries:
+        cache_key, start_time = orjson.loads(entry)
+        cache_keys.append(cache_key)
+        if start_time is not None:
+            start_times.append(start_time)
+
+    metrics.distribution("events.save_event_batch.size", len(cache_keys))
+    _do_save_event_batch(cache_keys, project_id, min(start_times) if start_times else None)
+
+
+def _do_save_event_batch(
+    cache_keys: Sequence[str],
+    project_id: int,
+    start_time: float | None = None,
+) -> None:
+    """
+    Saves a batch of error events of a single project to the database.
+
+    Events that have attachments, transactions and reprocessed events without
+    a project in their payload are not supported here and must be sent
+    through `save_event` and friends instead.
+
+    The batch has already been taken off the queue, so if saving it fails
+    every event is handed to `save_event` on its own rather than dropped.
+    """
+
+    set_current_event_project(project_id)
+
+    from sentry.event_manager import save_error_events_many
+
+    payloads = processing.event_processing_store.get_many(cache_keys)
+
+    datas: list[MutableMapping[str, Any]] = []
+    batch_cache_keys = []
+    for cache_key in cache_keys:
+        data = payloads.get(cache_key)
+        # See `_do_save_event` for why payloads may be gone or empty by now.
+        if not data:
+            metrics.incr(
+                "events.failed", tags={"reason": "cache", "stage": "post"}, skip_internal=False
+            )
+            continue
+
+        if killswitch_matches_context(
+            "store.load-shed-save-event-projects",
+            {
+                "project_id": project_id,
+                "event_type": data.get("type") or "none",
+                "platform": data.get("platform") or "none",
+            },
+        ):
+            processing.event_processing_store.delete_by_key(cache_key)
+            reprocessing2.mark_event_reprocessed(data)
+            continue
+
+        datas.append(data)
+        batch_cache_keys.append(cache_key)
+
+    if not datas:
+        return
+
+    with metrics.global_tags(event_type="error"):
+        try:
+            events = save_error_events_many(datas, project_id, start_time=start_time)
+        except Exception:
+            metrics.incr("events.save_event.exception", tags={"event_type": "error"})
+            error_logger.exception(
+                "save_event_batch.failed",
+                extra={"project_id": project_id, "batch_size": len(datas)},
+            )
+            # The payloads are still in the processing store. `save_event` takes
+            # care of marking them reprocessed and timing them.
+            for cache_key, data in zip(batch_cache_keys, datas):
+                save_event.delay(
+                    cache_key=cache_key,
+                    data=None,
+                    start_time=start_time,
+                    event_id=data["event_id"],
+                    project_id=project_id,
+                )
+            return
+
+        saved_event_ids = set()
+        try:
+            for event in events:
+                saved_event_ids.add(event.event_id)
+                # Put the updated event back into the cache so that post_process
+                # has the most recent data.
+                data = event.data.data
+                if not isinstance(data, dict):
+                    data = dict(data.items())
+                processing.event_processing_store.store(data)
+
+            for data in datas:
+                if data["event_id"] not in saved_event_ids:
+                    # Delete the event payload from cache since it won't show up in post-processing.
+                    processing.event_processing_store.delete(data)
+        finally:
+            for data in datas:
+                reprocessing2.mark_event_reprocessed(data)
+                if start_time:
+                    metrics.timing(
+                        "events.time-to-process",
+                        time() - start_time,
+                        instance=data["platform"],
+                        tags={
+                            "is_reprocessing2": (
+                                "true" if reprocessing2.is_reprocessed_event(data) else "false"
+                            ),
+                        },
+                    )
+
+                time_synthetic_monitoring_event(data, project_id, start_time)
+
+
 def time_synthetic_monitoring_event(
     data: Mapping[str, Any], project_id: int, start_time: float | None
 ) -> bool:
@@ -660,6 +833,17 @@ def save_event(
     _do_save_event(cache_key, data, start_time, event_id, project_id, **kwargs)
 
 
+@instrumented_task(
+    name="sentry.tasks.store.save_event_batch",
+    queue="events.save_event",
+    time_limit=65,
+    soft_time_limit=60,
+    silo_mode=SiloMode.REGION,
+)
+def save_event_batch(project_id: int, **kwargs: Any) -> None:
+    _flush_save_event_batch(project_id)
+
+
 @instrumented_task(
     name="sentry.tasks.store.save_event_transaction",
     queue="events.save_event_transaction",
@@ -10,9 +10,11 @@ from django.utils import timezone
 from google.api_core import exceptions, retry
 from google.cloud import bigtable
 from google.cloud.bigtable.row import PartialRowData
+from google.cloud.bigtable.row_data import DEFAULT_RETRY_READ_ROWS
 from google.cloud.bigtable.row_set import RowSet
 from google.cloud.bigtable.table import Table
 
+from sentry.nodestore.compression import ZSTD_FRAME_MAGIC
 from sentry.utils.codecs import Codec, ZlibCodec, ZstdCodec
 from sentry.utils.kvstore.abstract import KVStorage
 
@@ -120,12 +122,19 @@ class BigtableKVStorage(KVStorage[str, bytes]):
 
         return self.__decode_row(row)
 
-    def get_many(self, keys: Sequence[str]) -> Iterator[tuple[str, bytes]]:
+    def get_many(
+        self, keys: Sequence[str], timeout: float | None = None
+    ) -> Iterator[tuple[str, bytes]]:
         rows = RowSet()
         for key in keys:
             rows.add_row_key(key)
 
-        for row in self._get_table().read_rows(row_set=rows):
+        read_retry = DEFAULT_RETRY_READ_ROWS
+        if timeout is not None:
+            # Bounds the request including its retries, not just how long we wait for it
+            read_retry = read_retry.with_deadline(timeout)
+
+        for row in self._get_table().read_rows(row_set=rows, retry=read_retry):
             value = self.__decode_row(row)
 
             # Even though Bigtable in't going to return empty rows, an empty
@@ -224,7 +233,9 @@ class BigtableKVStorage(KVStorage[str, bytes]):
         # tracking now is whether compression is on or not for the data column.
         flags = self.Flags(0)
 
-        if self.compression:
+        # Values which already are zstd frames (such as nodes compressed with a trained dictionary)
+        # won't get any smaller, don't waste time compressing them again
+        if self.compression and not value.startswith(ZSTD_FRAME_MAGIC):
             compression_flag, strategy = self.compression_strategies[self.compression]
             flags |= compression_flag
             value = strategy.encode(value)
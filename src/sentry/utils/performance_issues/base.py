@@ -6,7 +6,7 @@ import re
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from enum import Enum
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 from urllib.parse import parse_qs, urlparse
 
 from sentry import options
@@ -30,6 +30,10 @@ from sentry.models.project import Project
 
 from .types import PerformanceProblemsMap, Span
 
+if TYPE_CHECKING:
+    from .columnar import SpanColumns
+    from .span_features import SpanFeatureCache, SpanFeatures
+
 
 class DetectorType(Enum):
     SLOW_DB_QUERY = "slow_db_query"
@@ -93,6 +97,7 @@ class PerformanceDetector(ABC):
     def __init__(self, settings: dict[DetectorType, Any], event: dict[str, Any]) -> None:
         self.settings = settings[self.settings_key]
         self._event = event
+        self.span_features: SpanFeatureCache | None = None
 
     def find_span_prefix(self, settings, span_op: str):
         allowed_span_ops = settings.get("allowed_span_ops", [])
@@ -106,7 +111,7 @@ class PerformanceDetector(ABC):
         if not op or not span_id:
             return None
 
-        span_duration = get_span_duration(span)
+        span_duration = self.features(span).duration
         for setting in self.settings:
             op_prefix = self.find_span_prefix(setting, op)
             if op_prefix:
@@ -116,6 +121,16 @@ class PerformanceDetector(ABC):
     def event(self) -> dict[str, Any]:
         return self._event
 
+    def features(self, span: Span) -> SpanFeatures:
+        """
+        Derived values of the span, shared with the other detectors run on the same event.
+        """
+        if self.span_features is None:
+            from .span_features import SpanFeatureCache
+
+            self.span_features = SpanFeatureCache(self._event.get("spans") or [])
+        return self.span_features.get(span)
+
     @property
     @abstractmethod
     def settings_key(self) -> DetectorType:
@@ -125,6 +140,15 @@ class PerformanceDetector(ABC):
     def visit_span(self, span: Span) -> None:
         raise NotImplementedError
 
+    def visit_columns(self, columns: SpanColumns) -> None:
+        """
+        Visit the event's spans through their columnar representation. Detectors which can tell
+        from a batched scan which spans they would act on override this to only visit those,
+        everything else visits every span in order.
+        """
+        for span in columns.spans:
+            self.visit_span(span)
+
     def on_complete(self) -> None:
         pass
 
@@ -0,0 +1,84 @@
+"""
+Columnar representation of a transaction's spans, for detectors which can find their candidate
+spans with a batched scan instead of looking at every span dict in turn.
+
+`SpanColumns` is built once per event and shared between all detectors. Span ops are interned into
+a table of distinct values, so a predicate on the op only has to run once per distinct op (usually a
+handful) rather than once per span, and the resulting mask can be combined with masks on the
+duration columns. Detectors still run their regular `visit_span` on the spans which pass the scan,
+so the scan only needs to be a superset of what `visit_span` would act on for the detected problems
+to be identical.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from .types import Span
+
+
+@dataclass(frozen=True)
+class SpanColumns:
+    spans: Sequence[Span]
+    # Seconds since epoch, as in the span payload. Missing timestamps are 0, like in
+    # `get_span_duration`.
+    start: Any
+    end: Any
+    duration_ms: Any
+    # Index into `ops` of each span's op, where a missing op is interned as ""
+    op_codes: Any
+    ops: Sequence[str]
+
+    @classmethod
+    def from_spans(cls, spans: Sequence[Span]) -> SpanColumns:
+        count = len(spans)
+        op_table: dict[str, int] = {}
+        op_codes = np.empty(count, dtype=np.int32)
+        for i, span in enumerate(spans):
+            op_codes[i] = op_table.setdefault(span.get("op") or "", len(op_table))
+
+        start = np.fromiter(
+            (span.get("start_timestamp", 0) for span in spans), dtype=np.float64, count=count
+        )
+        end = np.fromiter(
+            (span.get("timestamp", 0) for span in spans), dtype=np.float64, count=count
+        )
+
+        return cls(
+            spans=spans,
+            start=start,
+            end=end,
+            duration_ms=(end - start) * 1000,
+            op_codes=op_codes,
+            ops=list(op_table),
+        )
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def op_mask(self, predicate: Callable[[str], bool]) -> Any:
+        """
+        Boolean mask of the spans whose op matches the predicate, which is evaluated once per
+        distinct op.
+        """
+        matching = [code for code, op in enumerate(self.ops) if predicate(op)]
+        return np.isin(self.op_codes, matching)
+
+    def min_duration_mask(self, duration_ms: float) -> Any:
+        """
+        Boolean mask of the spans lasting at least roughly the given duration. Floating point
+        durations can be off by a fraction of a millisecond from the `timedelta` based ones used by
+        the detectors, so this errs on the side of including spans.
+        """
+        return self.duration_ms >= duration_ms - 1
+
+    def iter_spans(self, mask: Any) -> Iterator[Span]:
+        """
+        The spans selected by the mask, in their original order.
+        """
+        for index in np.flatnonzero(mask):
+            yield self.spans[index]
@@ -22,7 +22,6 @@ from ..base import (
     PerformanceDetector,
     fingerprint_spans,
     get_notification_attachment_body,
-    get_span_duration,
     get_span_evidence_value,
 )
 from ..performance_problem import PerformanceProblem
@@ -92,8 +91,7 @@ class ConsecutiveDBSpanDetector(PerformanceDetector):
             "consecutive_count_threshold"
         )
         exceeds_span_duration_threshold = all(
-            get_span_duration(span).total_seconds() * 1000
-            > self.settings.get("span_duration_threshold")
+            self.features(span).duration_ms > self.settings.get("span_duration_threshold")
             for span in self.independent_db_spans
         )
 
@@ -219,7 +217,7 @@ class ConsecutiveDBSpanDetector(PerformanceDetector):
         sum_of_dependent_span_durations = 0.0
         for span in consecutive_spans:
             if span not in independent_spans:
-                sum_of_dependent_span_durations += get_span_duration(span).total_seconds() * 1000
+                sum_of_dependent_span_durations += self.features(span).duration_ms
 
         return total_duration - max(max_independent_span_duration, sum_of_dependent_span_durations)
 
@@ -239,10 +237,8 @@ class ConsecutiveDBSpanDetector(PerformanceDetector):
 
     def _is_db_query(self, span: Span) -> bool:
         op: str = span.get("op", "") or ""
-        description: str = span.get("description", "") or ""
         is_db_op = op == "db" or op.startswith("db.sql")
-        is_query = description.strip().upper().startswith("SELECT")
-        return is_db_op and is_query
+        return is_db_op and self.features(span).is_select_query
 
     def _fingerprint(self) -> str:
         prior_span_index = self.consecutive_db_spans.index(self.independent_db_spans[0]) - 1
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 from collections import defaultdict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import sentry_sdk
 from symbolic.proguard import ProguardMapper
@@ -30,6 +30,9 @@ from ..base import (
 from ..performance_problem import PerformanceProblem
 from ..types import Span
 
+if TYPE_CHECKING:
+    from ..columnar import SpanColumns
+
 
 class BaseIOMainThreadDetector(PerformanceDetector):
     __slots__ = ("stored_problems",)
@@ -57,6 +60,11 @@ class BaseIOMainThreadDetector(PerformanceDetector):
             parent_span_id = span["parent_span_id"]
             self.parent_to_blocked_span[parent_span_id].append(span)
 
+    def visit_columns(self, columns: SpanColumns) -> None:
+        mask = columns.op_mask(lambda op: op.lower().startswith(self.SPAN_PREFIX))
+        for span in columns.iter_spans(mask):
+            self.visit_span(span)
+
     def on_complete(self) -> None:
         for parent_span_id, span_list in self.parent_to_blocked_span.items():
             span_list = [
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sentry import features
 from sentry.issues.grouptype import PerformanceLargeHTTPPayloadGroupType
@@ -21,6 +21,9 @@ from ..base import (
 from ..performance_problem import PerformanceProblem
 from ..types import Span
 
+if TYPE_CHECKING:
+    from ..columnar import SpanColumns
+
 # Matches a file extension, ignoring query parameters at the end
 EXTENSION_REGEX = re.compile(r"\.([a-zA-Z0-9]+)/?(?!/)(\?.*)?$")
 EXTENSION_ALLOW_LIST = ("JSON",)
@@ -57,6 +60,13 @@ class LargeHTTPPayloadDetector(PerformanceDetector):
         if encoded_body_size > payload_size_threshold:
             self._store_performance_problem(span)
 
+    def visit_columns(self, columns: SpanColumns) -> None:
+        mask = columns.op_mask(lambda op: op.startswith("http")) & columns.min_duration_mask(
+            MINIMUM_SPAN_DURATION.total_seconds() * 1000
+        )
+        for span in columns.iter_spans(mask):
+            self.visit_span(span)
+
     def _store_performance_problem(self, span: Span) -> None:
         fingerprint = self._fingerprint(span)
         offender_span_ids = []
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sentry.issues.grouptype import PerformanceRenderBlockingAssetSpanGroupType
 from sentry.issues.issue_occurrence import IssueEvidence
@@ -14,12 +14,14 @@ from ..base import (
     PerformanceDetector,
     fingerprint_resource_span,
     get_notification_attachment_body,
-    get_span_duration,
     get_span_evidence_value,
 )
 from ..performance_problem import PerformanceProblem
 from ..types import Span
 
+if TYPE_CHECKING:
+    from ..columnar import SpanColumns
+
 
 class RenderBlockingAssetSpanDetector(PerformanceDetector):
     __slots__ = ("stored_problems", "fcp", "transaction_start")
@@ -115,6 +117,14 @@ class RenderBlockingAssetSpanDetector(PerformanceDetector):
             self.fcp = None
             self.fcp_value = 0
 
+    def visit_columns(self, columns: SpanColumns) -> None:
+        if not self.fcp:
+            return
+
+        mask = columns.op_mask(lambda op: op in ["resource.link", "resource.script"])
+        for span in columns.iter_spans(mask):
+            self.visit_span(span)
+
     def _get_duration(self, item: Mapping[str, Any] | None) -> float:
         if not item:
             return 0
@@ -148,7 +158,7 @@ class RenderBlockingAssetSpanDetector(PerformanceDetector):
         if encoded_body_size < minimum_size_bytes or encoded_body_size > self.MAX_SIZE_BYTES:
             return False
 
-        span_duration = get_span_duration(span)
+        span_duration = self.features(span).duration
         fcp_ratio_threshold = self.settings.get("fcp_ratio_threshold")
         return span_duration / self.fcp > fcp_ratio_threshold
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sentry.issues.grouptype import PerformanceSlowDBQueryGroupType
 from sentry.issues.issue_occurrence import IssueEvidence
@@ -13,13 +13,15 @@ from ..base import (
     DETECTOR_TYPE_TO_GROUP_TYPE,
     DetectorType,
     PerformanceDetector,
-    fingerprint_span,
     get_notification_attachment_body,
     get_span_evidence_value,
 )
 from ..performance_problem import PerformanceProblem
 from ..types import Span
 
+if TYPE_CHECKING:
+    from ..columnar import SpanColumns
+
 # Truncating the evidence to prevent hitting Kafka's broken message size limit.
 #  A better solution would be to audit the usage of `description`,
 #  `evidence_data` and `evidence_display` and deduplicate those keys. Right now
@@ -49,7 +51,8 @@ class SlowDBQueryDetector(PerformanceDetector):
         op, span_id, op_prefix, span_duration, settings = settings_for_span
         duration_threshold = settings.get("duration_threshold")
 
-        fingerprint = fingerprint_span(span)
+        features = self.features(span)
+        fingerprint = features.fingerprint
 
         if not fingerprint:
             return
@@ -57,8 +60,7 @@ class SlowDBQueryDetector(PerformanceDetector):
         if not SlowDBQueryDetector.is_span_eligible(span):
             return
 
-        description = span.get("description", None)
-        description = description.strip()
+        description = features.normalized_description
 
         if span_duration >= timedelta(
             milliseconds=duration_threshold
@@ -101,6 +103,21 @@ class SlowDBQueryDetector(PerformanceDetector):
                 ],
             )
 
+    def visit_columns(self, columns: SpanColumns) -> None:
+        # Spans are checked against the first setting matching their op, so a span can only be slow
+        # enough if it exceeds the threshold of at least one of the settings matching it
+        mask = None
+        for setting in self.settings:
+            setting_mask = columns.op_mask(
+                lambda op, setting=setting: bool(self.find_span_prefix(setting, op))
+            ) & columns.min_duration_mask(setting["duration_threshold"])
+            mask = setting_mask if mask is None else mask | setting_mask
+
+        if mask is None:
+            return
+        for span in columns.iter_spans(mask):
+            self.visit_span(span)
+
     def is_creation_allowed_for_organization(self, organization: Organization | None) -> bool:
         return True
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sentry.issues.grouptype import PerformanceUncompressedAssetsGroupType
 from sentry.issues.issue_occurrence import IssueEvidence
@@ -19,6 +19,9 @@ from ..base import (
 from ..performance_problem import PerformanceProblem
 from ..types import Span
 
+if TYPE_CHECKING:
+    from ..columnar import SpanColumns
+
 EXTENSION_REGEX = re.compile(r"\.([a-zA-Z0-9]+)/?(?!/)(\?.*)?$")
 FILE_EXTENSION_ALLOWLIST = ("CSS", "JSON", "JS")
 
@@ -127,6 +130,12 @@ class UncompressedAssetSpanDetector(PerformanceDetector):
                 ],
             )
 
+    def visit_columns(self, columns: SpanColumns) -> None:
+        allowed_span_ops = self.settings.get("allowed_span_ops")
+        mask = columns.op_mask(lambda op: op in allowed_span_ops)
+        for span in columns.iter_spans(mask):
+            self.visit_span(span)
+
     def _fingerprint(self, span: Span) -> str:
         resource_span = fingerprint_resource_span(span)
         return f"1-{PerformanceUncompressedAssetsGroupType.type_id}-{resource_span}"
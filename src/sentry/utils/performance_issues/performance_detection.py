@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import random
+import time
 from collections.abc import Sequence
 from typing import Any
 
@@ -20,6 +21,7 @@ from sentry.utils.event_frames import get_sdk_name
 from sentry.utils.safe import get_path
 
 from .base import DetectorType, PerformanceDetector
+from .columnar import SpanColumns
 from .detectors.consecutive_db_detector import ConsecutiveDBSpanDetector
 from .detectors.consecutive_http_detector import ConsecutiveHTTPSpanDetector
 from .detectors.http_overhead_detector import HTTPOverheadDetector
@@ -35,8 +37,12 @@ from .detectors.render_blocking_asset_span_detector import RenderBlockingAssetSp
 from .detectors.slow_db_query_detector import SlowDBQueryDetector
 from .detectors.uncompressed_asset_detector import UncompressedAssetSpanDetector
 from .performance_problem import PerformanceProblem
+from .span_features import SpanFeatureCache
 
 PERFORMANCE_GROUP_COUNT_LIMIT = 10
+# Timing every span visit costs about as much as the cheaper detectors themselves, so only a sample
+# of events report per-detector durations
+DETECTOR_DURATION_SAMPLE_RATE = 0.1
 INTEGRATIONS_OF_INTEREST = [
     "django",
     "flask",
@@ -348,11 +354,13 @@ def _detect_performance_problems(
             if detector_class.is_detector_enabled()
         ]
 
-    for detector in detectors:
-        with sentry_sdk.start_span(
-            op="function", description=f"run_detector_on_data.{detector.type.value}"
-        ):
-            run_detector_on_data(detector, data)
+    columns = None
+    if options.get("performance.issues.columnar-detection.enabled"):
+        with sentry_sdk.start_span(op="function", description="SpanColumns.from_spans"):
+            columns = get_span_columns(data)
+
+    with sentry_sdk.start_span(op="function", description="run_detectors_on_data"):
+        run_detectors_on_data(detectors, data, columns)
 
     with sentry_sdk.start_span(op="function", description="report_metrics_for_detectors"):
         # Metrics reporting only for detection, not created issues.
@@ -400,15 +408,79 @@ def _detect_performance_problems(
     return list(unique_problems)
 
 
-def run_detector_on_data(detector: PerformanceDetector, data: dict[str, Any]) -> None:
-    if not detector.is_event_eligible(data):
-        return
+def get_span_columns(data: dict[str, Any]) -> SpanColumns | None:
+    try:
+        return SpanColumns.from_spans(data.get("spans") or [])
+    except (TypeError, ValueError):
+        # Malformed timestamps, the detectors will deal with them (or not) as usual
+        metrics.incr("performance.performance_issue.columnar_build_failed")
+        return None
+
+
+def run_detector_on_data(
+    detector: PerformanceDetector, data: dict[str, Any], columns: SpanColumns | None = None
+) -> None:
+    run_detectors_on_data([detector], data, columns)
+
 
+def run_detectors_on_data(
+    detectors: Sequence[PerformanceDetector],
+    data: dict[str, Any],
+    columns: SpanColumns | None = None,
+) -> None:
+    """
+    Walk the event's spans once, dispatching every span to each eligible detector in turn. The
+    detectors share a cache of values derived from the spans, so that e.g. durations and
+    fingerprints are only computed once per span. Detectors which can pick their candidate spans
+    with a scan over the columnar representation of the spans do so instead of being part of the
+    walk.
+    """
     spans = data.get("spans", [])
-    for span in spans:
-        detector.visit_span(span)
+    span_features = SpanFeatureCache(spans)
+    timed = DETECTOR_DURATION_SAMPLE_RATE > random.random()
+
+    durations: dict[PerformanceDetector, float] = {}
+    walking_detectors = []
+    for detector in detectors:
+        if not detector.is_event_eligible(data):
+            continue
 
-    detector.on_complete()
+        detector.span_features = span_features
+        durations[detector] = 0.0
+        if columns is not None and _overrides_visit_columns(detector):
+            start = time.perf_counter()
+            detector.visit_columns(columns)
+            durations[detector] += time.perf_counter() - start
+        else:
+            walking_detectors.append(detector)
+
+    if timed:
+        for span in spans:
+            for detector in walking_detectors:
+                start = time.perf_counter()
+                detector.visit_span(span)
+                durations[detector] += time.perf_counter() - start
+    else:
+        for span in spans:
+            for detector in walking_detectors:
+                detector.visit_span(span)
+
+    for detector in durations:
+        start = time.perf_counter()
+        detector.on_complete()
+        durations[detector] += time.perf_counter() - start
+
+        if timed:
+            metrics.timing(
+                "performance.performance_issue.detector_duration",
+                durations[detector],
+                tags={"detector": detector.type.value},
+                sample_rate=DETECTOR_DURATION_SAMPLE_RATE,
+            )
+
+
+def _overrides_visit_columns(detector: PerformanceDetector) -> bool:
+    return type(detector).visit_columns is not PerformanceDetector.visit_columns
 
 
 # Reports metrics and creates spans for detection
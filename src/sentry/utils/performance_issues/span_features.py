@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import timedelta
+from functools import cached_property
+
+from .base import fingerprint_span, get_span_duration
+from .types import Span
+
+
+class SpanFeatures:
+    """
+    Values derived from a span which several detectors need. Each is computed the first time a
+    detector asks for it and then shared with all other detectors visiting the same span.
+    """
+
+    def __init__(self, span: Span) -> None:
+        self.span = span
+
+    @cached_property
+    def duration(self) -> timedelta:
+        return get_span_duration(self.span)
+
+    @cached_property
+    def duration_ms(self) -> float:
+        return self.duration.total_seconds() * 1000
+
+    @cached_property
+    def fingerprint(self) -> str | None:
+        return fingerprint_span(self.span)
+
+    @cached_property
+    def normalized_description(self) -> str:
+        return (self.span.get("description") or "").strip()
+
+    @cached_property
+    def is_select_query(self) -> bool:
+        return self.normalized_description[:6].upper() == "SELECT"
+
+
+class SpanFeatureCache:
+    """
+    Per-event cache of `SpanFeatures`, shared between all detectors run on the event.
+    """
+
+    def __init__(self, spans: Sequence[Span]) -> None:
+        self.spans = spans
+        self._features: dict[int, SpanFeatures] = {}
+
+    def get(self, span: Span) -> SpanFeatures:
+        # Spans are dicts, so they're keyed by identity. Ids of spans which aren't part of the
+        # event could get reused once they're garbage collected, hence the check.
+        features = self._features.get(id(span))
+        if features is None or features.span is not span:
+            features = self._features[id(span)] = SpanFeatures(span)
+        return features
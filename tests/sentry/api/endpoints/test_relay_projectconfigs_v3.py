@@ -47,8 +47,8 @@ def call_endpoint(client, relay, private_key, default_projectkey):
 @pytest.fixture
 def projectconfig_cache_get_mock_config(monkeypatch):
     monkeypatch.setattr(
-        "sentry.relay.projectconfig_cache.backend.get",
-        lambda *args, **kwargs: {"is_mock_config": True},
+        "sentry.relay.projectconfig_cache.backend.get_many",
+        lambda public_keys: {public_key: {"is_mock_config": True} for public_key in public_keys},
     )
 
 
@@ -59,7 +59,10 @@ def single_mock_proj_cached(monkeypatch):
             return {"is_mock_config": True}
         return None
 
-    monkeypatch.setattr("sentry.relay.projectconfig_cache.backend.get", cache_get)
+    monkeypatch.setattr(
+        "sentry.relay.projectconfig_cache.backend.get_many",
+        lambda public_keys: {public_key: cache_get(public_key) for public_key in public_keys},
+    )
 
 
 @pytest.fixture
@@ -14,6 +14,7 @@ from sentry.api.event_search import (
     SearchFilter,
     SearchKey,
     SearchValue,
+    _parse_tree,
     parse_search_query,
 )
 from sentry.constants import MODULE_ROOT
@@ -404,6 +405,24 @@ class ParseSearchQueryBackendTest(SimpleTestCase):
                 SearchFilter(key=SearchKey(name="random"), operator="=", value=SearchValue("-2w"))
             ]
 
+    def test_rel_time_filter_shared_parse_tree(self):
+        now = timezone.now()
+        with freeze_time(now):
+            assert parse_search_query("time:-2w")[0].value.raw_value == now - timedelta(days=14)
+        with freeze_time(now + timedelta(days=1)):
+            assert parse_search_query("time:-2w")[0].value.raw_value == now - timedelta(days=13)
+        assert _parse_tree("time:-2w") is _parse_tree("time:-2w")
+
+    def test_shared_parse_tree_configs(self):
+        config = SearchConfig(key_mappings={"target_value": ["someValue"]})
+
+        assert parse_search_query("someValue:123") == [
+            SearchFilter(key=SearchKey(name="someValue"), operator="=", value=SearchValue("123"))
+        ]
+        assert parse_search_query("someValue:123", config=config) == [
+            SearchFilter(key=SearchKey(name="target_value"), operator="=", value=SearchValue("123"))
+        ]
+
     def test_aggregate_rel_time_filter(self):
         now = timezone.now()
         with freeze_time(now):
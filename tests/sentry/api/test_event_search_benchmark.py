@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from sentry.api.event_search import (
+    SearchVisitor,
+    _parse_tree,
+    default_config,
+    event_search_grammar,
+    parse_search_query,
+)
+
+# A typical saved query, which is parsed again on every poll of the page showing it
+QUERY = (
+    "!has:assignee level:[error, fatal] release:[1.0.0, 1.0.1] "
+    'transaction:"/api/0/organizations/{organization_slug}/issues/" '
+    "(browser.name:Chrome OR browser.name:Firefox) user.email:*@example.com"
+)
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def parse_uncached(query: str) -> list:
+    return SearchVisitor(default_config).visit(event_search_grammar.parse(query))
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+def test_benchmark_parse_uncached(benchmark):
+    result = benchmark(parse_uncached, QUERY)
+
+    assert len(result) == 6
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+def test_benchmark_parse_search_query(benchmark):
+    _parse_tree(QUERY)
+
+    result = benchmark(parse_search_query, QUERY)
+
+    assert result == parse_uncached(QUERY)
@@ -0,0 +1,65 @@
+import datetime
+import pickle
+
+import pytest
+
+from sentry.buffer.redis import RedisBuffer
+
+FILTERS = {"id": 1234567}
+# What `_process_existing_aggregate` buffers for every event of an existing group
+EXTRA = {
+    "last_seen": datetime.datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=datetime.UTC),
+    "data": {
+        "type": "error",
+        "title": "ValueError: invalid literal for int() with base 10: 'abc'",
+        "culprit": "app.views in parse_id",
+        "location": None,
+        "metadata": {
+            "type": "ValueError",
+            "value": "invalid literal for int() with base 10: 'abc'",
+            "filename": "app/views.py",
+            "function": "parse_id",
+            "in_app_frame_mix": "in-app-only",
+        },
+        "last_received": 1704112215.123456,
+    },
+}
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def roundtrip_pickle():
+    filters = pickle.loads(pickle.dumps(FILTERS))
+    extra = {k: pickle.loads(pickle.dumps(v)) for k, v in EXTRA.items()}
+    return filters, extra
+
+
+def roundtrip_compact():
+    # Mirrors `RedisBuffer.incr`, values the compact encoding can't represent are pickled
+    filters = RedisBuffer._load_compact_values(RedisBuffer._dump_compact_values(FILTERS))
+    extra = {
+        k: (
+            RedisBuffer._load_compact_value(RedisBuffer._dump_compact_value(v))
+            if RedisBuffer._is_compact_encodable(v)
+            else pickle.loads(pickle.dumps(v))
+        )
+        for k, v in EXTRA.items()
+    }
+    return filters, extra
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@pytest.mark.parametrize(
+    "roundtrip",
+    [roundtrip_pickle, roundtrip_compact],
+    ids=["pickle", "compact"],
+)
+def test_benchmark_buffer_value_encoding(roundtrip, benchmark):
+    assert benchmark(roundtrip) == (FILTERS, EXTRA)
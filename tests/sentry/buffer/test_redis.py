@@ -127,6 +127,52 @@ class TestRedisBuffer:
         self.buf.process("foo")
         process.assert_called_once_with(Group, columns, filters, extra, signal_only)
 
+    @mock.patch("sentry.buffer.redis.RedisBuffer._make_key", mock.Mock(return_value="foo"))
+    @mock.patch("sentry.buffer.base.Buffer.process")
+    def test_process_does_bubble_up_compact(self, process, set_sentry_option):
+        dt = datetime.datetime(2017, 5, 3, 6, 6, 6, 123456, tzinfo=datetime.UTC)
+        with set_sentry_option("buffer.compact-encoding", True):
+            self.buf.incr(Group, {"times_seen": 2}, {"pk": 1}, {"foo": "bar", "datetime": dt})
+
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        assert RedisBuffer._is_compact(client.hget("foo", "f"))
+
+        self.buf.process("foo")
+        process.assert_called_once_with(
+            Group, {"times_seen": 2}, {"pk": 1}, {"foo": "bar", "datetime": dt}, None
+        )
+
+    @django_db_all
+    @mock.patch("sentry.buffer.base.Buffer.process")
+    def test_process_compact_falls_back_for_group_data(
+        self, process, default_group, set_sentry_option
+    ):
+        if self.buf.is_redis_cluster:
+            pytest.skip("the Redis Cluster encoding never supported nested values")
+
+        # `_process_existing_aggregate` buffers the merged `Group.data`, which isn't a scalar
+        data = {
+            **default_group.data,
+            "type": "error",
+            "title": "ValueError: oh no",
+            "metadata": {"type": "ValueError", "value": "oh no", "in_app_frame_mix": "mixed"},
+            "last_received": 1704112215.123,
+        }
+        extra = {"data": data, "last_seen": timezone.now(), "is_public": True}
+        with set_sentry_option("buffer.compact-encoding", True):
+            self.buf.incr(Group, {"times_seen": 1}, {"pk": default_group.id}, extra)
+
+        key = self.buf._make_key(Group, {"pk": default_group.id})
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        assert RedisBuffer._is_compact(client.hget(key, "e+last_seen"))
+        assert not RedisBuffer._is_compact(client.hget(key, "e+data"))
+
+        self.buf.process(key)
+        process.assert_called_once_with(
+            Group, {"times_seen": 1}, {"pk": default_group.id}, extra, None
+        )
+        assert process.call_args.args[3]["is_public"] is True
+
     @django_db_all
     @freeze_time()
     def test_group_cache_updated(self, default_group, task_runner):
@@ -144,6 +190,106 @@ class TestRedisBuffer:
         group = Group.objects.get_from_cache(id=default_group.id)
         assert group.times_seen == orig_times_seen + times_seen_incr
 
+    @django_db_all
+    @freeze_time()
+    def test_process_batch_keys(self, default_group):
+        orig_times_seen = default_group.times_seen
+        missing_group_id = default_group.id + 1000
+        keys = [
+            self.buf._make_key(Group, {"pk": default_group.id}),
+            self.buf._make_key(Group, {"pk": missing_group_id}),
+        ]
+        self.buf.incr(
+            Group, {"times_seen": 3}, {"pk": default_group.id}, {"last_seen": timezone.now()}
+        )
+        self.buf.incr(Group, {"times_seen": 2}, {"pk": missing_group_id})
+
+        with mock.patch("sentry.buffer.redis.buffer_incr_complete") as signal:
+            self.buf.process(batch_keys=keys)
+
+        assert Group.objects.get(id=default_group.id).times_seen == orig_times_seen + 3
+        # The signal still fires for the group which no longer exists
+        assert signal.send_robust.call_count == 2
+
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        for key in keys:
+            assert not client.exists(key)
+            assert not client.exists(self.buf._make_lock_key(key))
+
+    @django_db_all
+    def test_process_batch_skips_locked_keys(self, default_group):
+        orig_times_seen = default_group.times_seen
+        locked_key = self.buf._make_key(Group, {"pk": default_group.id})
+        other_key = self.buf._make_key(Project, {"pk": default_group.project_id})
+        self.buf.incr(Group, {"times_seen": 3}, {"pk": default_group.id})
+        self.buf.incr(
+            Project, {"times_seen": 1}, {"pk": default_group.project_id}, signal_only=True
+        )
+
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        client.set(self.buf._make_lock_key(locked_key), "1")
+
+        with mock.patch("sentry.buffer.base.Buffer.process") as process:
+            self.buf.process(batch_keys=[locked_key, other_key])
+
+        process.assert_called_once_with(
+            Project, {"times_seen": 1}, {"pk": default_group.project_id}, {}, True
+        )
+        assert Group.objects.get(id=default_group.id).times_seen == orig_times_seen
+        assert client.exists(locked_key)
+        assert not client.exists(other_key)
+
+    @django_db_all
+    def test_process_batch_parallel_workers(
+        self, default_group, default_project, set_sentry_option
+    ):
+        keys = []
+        for pk in (default_group.id, default_project.id):
+            self.buf.incr(Project, {"times_seen": 1}, {"pk": pk}, signal_only=True)
+            keys.append(self.buf._make_key(Project, {"pk": pk}))
+
+        with (
+            set_sentry_option("buffer.flush-workers", 4),
+            mock.patch.object(self.buf, "_process_shard_in_thread") as process_shard,
+            mock.patch.object(
+                self.buf, "_shard_incrs", side_effect=lambda incrs, n: [[incr] for incr in incrs]
+            ) as shard,
+        ):
+            self.buf.process(batch_keys=keys)
+
+        shard.assert_called_once_with(mock.ANY, 4)
+        processed = [incr for call in process_shard.call_args_list for incr in call.args[0]]
+        assert sorted(incr.key for incr in processed) == sorted(keys)
+
+    @mock.patch("sentry.buffer.redis.process_incr", mock.Mock())
+    @mock.patch("sentry.buffer.redis.metrics")
+    def test_process_pending_reports_backlog_age(self, mock_metrics):
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        oldest = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+        client.zadd("b:p", {"foo": oldest.timestamp(), "bar": oldest.timestamp() + 30})
+
+        with freeze_time(oldest + datetime.timedelta(minutes=1)):
+            self.buf.process_pending()
+
+        mock_metrics.timing.assert_called_once_with("buffer.pending-age", 60)
+
+    @mock.patch("sentry.buffer.redis.process_incr", mock.Mock())
+    @mock.patch("sentry.buffer.redis.metrics")
+    def test_pending_age_is_kept_across_incrs(self, mock_metrics):
+        model = mock.Mock()
+        model.__name__ = "Mock"
+        first_pending = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+
+        with freeze_time(first_pending) as frozen_time:
+            self.buf.incr(model, {"times_seen": 1}, {"pk": 1})
+            frozen_time.shift(30)
+            # Later writes to a key which is already pending don't reset its age
+            self.buf.incr(model, {"times_seen": 1}, {"pk": 1})
+            frozen_time.shift(30)
+            self.buf.process_pending()
+
+        mock_metrics.timing.assert_called_once_with("buffer.pending-age", 60)
+
     def test_get(self):
         model = mock.Mock()
         model.__name__ = "Mock"
@@ -636,3 +782,30 @@ class TestRedisBuffer:
 )
 def test_dump_value(value):
     assert RedisBuffer._load_value(json.loads(json.dumps(RedisBuffer._dump_value(value)))) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "\u201d:1:",
+        "",
+        -17,
+        1.5,
+        datetime.datetime(2017, 5, 3, 6, 6, 6, 123456, tzinfo=datetime.UTC),
+        datetime.date.today(),
+        True,
+        False,
+    ],
+)
+def test_dump_compact_value(value):
+    loaded = RedisBuffer._load_compact_value(RedisBuffer._dump_compact_value(value).encode())
+    assert loaded == value
+    assert type(loaded) is type(value)
+
+
+def test_dump_compact_values():
+    values = {"project_id": 1, "key": "a:1:b", "release": "1.0\u201d"}
+    encoded = RedisBuffer._dump_compact_values(values)
+    assert RedisBuffer._is_compact(encoded)
+    assert RedisBuffer._load_compact_values(encoded) == values
+    assert len(encoded) < len(json.dumps(RedisBuffer._dump_values(values)))
@@ -1,15 +1,18 @@
+import gzip
 from unittest.mock import patch
 
+import orjson
 from django.db import IntegrityError
 
-from sentry.data_export.base import ExportQueryType
+from sentry.data_export.base import EXPORTED_ROWS_LIMIT, ExportQueryType
 from sentry.data_export.models import ExportedData
-from sentry.data_export.tasks import assemble_download, merge_export_blobs
+from sentry.data_export.tasks import assemble_download, iter_batch_fragments, merge_export_blobs
 from sentry.exceptions import InvalidSearchQuery
 from sentry.models.files.file import File
 from sentry.search.events.constants import TIMEOUT_ERROR_MESSAGE
 from sentry.testutils.cases import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now, iso_format
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.samples import load_data
 from sentry.utils.snuba import (
     DatasetSelectionError,
@@ -229,6 +232,53 @@ class AssembleDownloadTest(TestCase, SnubaTestCase):
 
         assert emailer.called
 
+    @patch("sentry.data_export.models.ExportedData.email_success")
+    def test_discover_ndjson_gzip(self, emailer):
+        de = ExportedData.objects.create(
+            user_id=self.user.id,
+            organization=self.org,
+            query_type=ExportQueryType.DISCOVER,
+            query_info={
+                "project": [self.project.id],
+                "field": ["title", "environment"],
+                "query": "",
+                "format": "ndjson.gz",
+            },
+        )
+        with self.tasks():
+            assemble_download(de.id, batch_size=2)
+        de = ExportedData.objects.get(id=de.id)
+        file = de._get_file()
+        assert file.name.endswith(".ndjson.gz")
+        assert file.headers == {"Content-Type": "application/gzip"}
+        # Every fragment is its own gzip member
+        with file.getfile() as f:
+            rows = [orjson.loads(line) for line in gzip.decompress(f.read()).splitlines()]
+        assert sorted(row["environment"] for row in rows) == ["dev", "prod", "prod"]
+        assert all(row["title"] == "<unlabeled event>" for row in rows)
+        assert emailer.called
+
+    @patch("sentry.data_export.tasks.process_rows")
+    def test_concurrent_fragments(self, process_rows):
+        process_rows.side_effect = lambda processor, data_export, limit, offset: [
+            {"offset": offset + row} for row in range(min(limit, 25 - offset))
+        ]
+        de = ExportedData.objects.create(
+            user_id=self.user.id,
+            organization=self.org,
+            query_type=ExportQueryType.DISCOVER,
+            query_info={"project": [self.project.id], "field": ["title"], "query": ""},
+        )
+
+        with override_options({"data-export.concurrent-fragments": 4}):
+            fragments = []
+            for rows in iter_batch_fragments(None, de, 10, 0, 100):
+                fragments.append([row["offset"] for row in rows])
+                if len(rows) < 10:
+                    break
+
+        assert fragments == [list(range(10)), list(range(10, 20)), list(range(20, 25))]
+
     @patch("sentry.data_export.models.ExportedData.email_success")
     def test_discover_respects_selected_environment(self, emailer):
         de = ExportedData.objects.create(
@@ -470,6 +520,31 @@ class AssembleDownloadTest(TestCase, SnubaTestCase):
         with file.getfile() as f:
             header, row = f.read().strip().split(b"\r\n")
 
+    @patch("sentry.data_export.tasks.current_task")
+    @patch("sentry.data_export.tasks.process_rows")
+    def test_retries_unexpected_errors_from_checkpoint(self, process_rows, current_task):
+        de = ExportedData.objects.create(
+            user_id=self.user.id,
+            organization=self.org,
+            query_type=ExportQueryType.DISCOVER,
+            query_info={"project": [self.project.id], "field": ["title"], "query": ""},
+        )
+        process_rows.side_effect = Exception("test")
+
+        assemble_download(de.id, batch_size=10, offset=20, bytes_written=100)
+
+        current_task.retry.assert_called_once_with(
+            args=[de.id],
+            kwargs={
+                "export_limit": EXPORTED_ROWS_LIMIT,
+                "batch_size": 10,
+                "offset": 20,
+                "bytes_written": 100,
+                "environment_id": None,
+                "export_retries": 3,
+            },
+        )
+
     @patch("sentry.search.events.builder.base.raw_snql_query")
     @patch("sentry.data_export.models.ExportedData.email_failure")
     def test_discover_snuba_error(self, emailer, mock_query):
@@ -39,14 +39,17 @@ from sentry.dynamic_sampling import (
 from sentry.event_manager import (
     EventManager,
     _get_event_instance,
+    assign_event_to_group,
     get_event_type,
     has_pending_commit_resolution,
     materialize_metadata,
+    save_error_events_many,
     save_grouphash_and_group,
 )
 from sentry.eventstore.models import Event
 from sentry.exceptions import HashDiscarded
 from sentry.grouping.api import load_grouping_config
+from sentry.grouping.ingest.hashing import get_or_create_grouphashes_bulk
 from sentry.grouping.utils import hash_from_values
 from sentry.ingest.inbound_filters import FilterStatKeys
 from sentry.integrations.models.external_issue import ExternalIssue
@@ -132,6 +135,76 @@ class EventManagerTest(TestCase, SnubaTestCase, EventManagerTestMixin, Performan
         assert group.platform == "python"
         assert event.platform == "python"
 
+    @mock.patch("sentry.event_manager.eventstream.backend.insert")
+    def test_save_error_events_many(self, eventstream_insert: mock.MagicMock) -> None:
+        datas = []
+        for message in ("foo", "foo", "bar"):
+            manager = EventManager(
+                make_event(message=message, release="1.0", environment="prod", platform="python")
+            )
+            manager.normalize()
+            datas.append(manager.get_data())
+
+        events = save_error_events_many(datas, self.project.id)
+
+        assert len(events) == 3
+        assert eventstream_insert.call_count == 3
+        assert events[0].group_id == events[1].group_id
+        assert events[0].group_id != events[2].group_id
+        assert Environment.objects.filter(projects=self.project, name="prod").count() == 1
+        release = Release.objects.get(organization_id=self.project.organization_id, version="1.0")
+        assert GroupRelease.objects.filter(release_id=release.id).count() == 2
+        for event in events:
+            assert nodestore.backend.get(event.data.id) is not None
+
+    @mock.patch("sentry.event_manager.eventstream.backend.insert")
+    def test_save_error_events_many_resolves_grouphashes_together(
+        self, eventstream_insert: mock.MagicMock
+    ) -> None:
+        existing_event = self.store_event(
+            data=make_event(message="foo"), project_id=self.project.id
+        )
+
+        datas = []
+        for message in ("foo", "foo"):
+            manager = EventManager(make_event(message=message))
+            manager.normalize()
+            datas.append(manager.get_data())
+
+        with (
+            mock.patch(
+                "sentry.event_manager.get_or_create_grouphashes_bulk",
+                wraps=get_or_create_grouphashes_bulk,
+            ) as batch_lookup,
+            mock.patch(
+                "sentry.grouping.ingest.hashing.get_or_create_grouphashes_bulk",
+                wraps=get_or_create_grouphashes_bulk,
+            ) as event_lookup,
+        ):
+            events = save_error_events_many(datas, self.project.id)
+
+        assert [event.group_id for event in events] == [existing_event.group_id] * 2
+        assert batch_lookup.call_count == 1
+        assert event_lookup.call_count == 0
+
+    @mock.patch("sentry.event_manager.eventstream.backend.insert")
+    def test_save_error_events_many_discarded(self, eventstream_insert: mock.MagicMock) -> None:
+        datas = []
+        for message in ("foo", "bar"):
+            manager = EventManager(make_event(message=message))
+            manager.normalize()
+            datas.append(manager.get_data())
+
+        with mock.patch(
+            "sentry.event_manager.assign_event_to_group",
+            side_effect=[HashDiscarded(), mock.DEFAULT],
+            wraps=assign_event_to_group,
+        ):
+            events = save_error_events_many(datas, self.project.id)
+
+        assert [event.event_id for event in events] == [datas[1]["event_id"]]
+        assert eventstream_insert.call_count == 1
+
     @mock.patch("sentry.event_manager.eventstream.backend.insert")
     def test_dupe_message_id(self, eventstream_insert: mock.MagicMock) -> None:
         # Saves the latest event to nodestore and eventstream
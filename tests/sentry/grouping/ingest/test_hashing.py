@@ -4,14 +4,20 @@ from time import time
 from unittest.mock import MagicMock, patch
 
 from sentry.event_manager import EventManager
+from sentry.grouping.ingest import grouphash_cache
+from sentry.grouping.ingest.grouphash_cache import invalidate_grouphash_cache
 from sentry.grouping.ingest.hashing import (
     _calculate_background_grouping,
     _calculate_event_grouping,
     _calculate_secondary_hashes,
+    get_or_create_grouphashes,
+    get_or_create_grouphashes_bulk,
 )
 from sentry.models.group import Group
+from sentry.models.grouphash import GroupHash
 from sentry.projectoptions.defaults import LEGACY_GROUPING_CONFIG
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers import override_options
 from sentry.testutils.skips import requires_snuba
 
 pytestmark = [requires_snuba]
@@ -169,3 +175,74 @@ class SecondaryGroupingTest(TestCase):
             mock_capture_exception.assert_called_with(secondary_grouping_error)
             # This proves the secondary grouping crash didn't crash the overall grouping process
             assert event.group
+
+
+class GetOrCreateGrouphashesBulkTest(TestCase):
+    def test_creates_missing_and_fetches_existing(self) -> None:
+        existing = GroupHash.objects.create(project=self.project, hash="a" * 32)
+
+        grouphashes = get_or_create_grouphashes_bulk(self.project, ["a" * 32, "b" * 32, "a" * 32])
+
+        assert set(grouphashes) == {"a" * 32, "b" * 32}
+        assert grouphashes["a" * 32].id == existing.id
+        assert GroupHash.objects.filter(project=self.project, hash="b" * 32).exists()
+
+    def test_preserves_order(self) -> None:
+        hashes = ["c" * 32, "a" * 32, "b" * 32]
+        assert [gh.hash for gh in get_or_create_grouphashes(self.project, hashes)] == hashes
+
+    @override_options({"grouping.grouphash_cache.enabled": True})
+    def test_serves_grouped_hashes_from_cache(self) -> None:
+        group = self.create_group(project=self.project)
+        GroupHash.objects.create(project=self.project, hash="a" * 32, group=group)
+        GroupHash.objects.create(project=self.project, hash="b" * 32)
+
+        # Warm the cache
+        get_or_create_grouphashes_bulk(self.project, ["a" * 32, "b" * 32])
+
+        with self.assertNumQueries(1):
+            # Only the ungrouped hash needs to go to the database
+            grouphashes = get_or_create_grouphashes_bulk(self.project, ["a" * 32, "b" * 32])
+
+        assert grouphashes["a" * 32].group_id == group.id
+        assert grouphashes["b" * 32].group_id is None
+
+        with self.assertNumQueries(0):
+            assert get_or_create_grouphashes_bulk(self.project, ["a" * 32])
+
+    @override_options({"grouping.grouphash_cache.enabled": True})
+    def test_invalidation(self) -> None:
+        group = self.create_group(project=self.project)
+        other_group = self.create_group(project=self.project)
+        GroupHash.objects.create(project=self.project, hash="a" * 32, group=group)
+
+        get_or_create_grouphashes_bulk(self.project, ["a" * 32])
+
+        GroupHash.objects.filter(project=self.project, hash="a" * 32).update(group=other_group)
+        invalidate_grouphash_cache([self.project.id])
+
+        grouphashes = get_or_create_grouphashes_bulk(self.project, ["a" * 32])
+        assert grouphashes["a" * 32].group_id == other_group.id
+
+    @override_options({"grouping.grouphash_cache.enabled": True})
+    def test_single_cache_request_per_lookup(self) -> None:
+        group = self.create_group(project=self.project)
+        GroupHash.objects.create(project=self.project, hash="a" * 32, group=group)
+        GroupHash.objects.create(project=self.project, hash="b" * 32, group=group)
+
+        # Warm the cache
+        get_or_create_grouphashes_bulk(self.project, ["a" * 32, "b" * 32])
+
+        with (
+            patch("sentry.grouping.ingest.grouphash_cache.cache.get") as cache_get,
+            patch(
+                "sentry.grouping.ingest.grouphash_cache.cache.get_many",
+                wraps=grouphash_cache.cache.get_many,
+            ) as cache_get_many,
+            self.assertNumQueries(0),
+        ):
+            grouphashes = get_or_create_grouphashes_bulk(self.project, ["a" * 32, "b" * 32])
+
+        assert {grouphash.group_id for grouphash in grouphashes.values()} == {group.id}
+        assert cache_get.call_count == 0
+        assert cache_get_many.call_count == 1
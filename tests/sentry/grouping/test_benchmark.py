@@ -1,6 +1,7 @@
 import pytest
 
 from sentry.grouping.api import get_default_grouping_config_dict
+from sentry.grouping.fingerprinting import FingerprintingRules
 from sentry.grouping.strategies.configurations import CONFIGURATIONS
 from tests.sentry.grouping import grouping_input as grouping_inputs
 
@@ -37,3 +38,52 @@ def run_configuration(grouping_input, config):
     event.project = None
 
     event.get_hashes()
+
+
+def _make_large_fingerprinting_rules(num_rules: int) -> FingerprintingRules:
+    lines = []
+    for i in range(num_rules):
+        match i % 4:
+            case 0:
+                lines.append(f"type:GeneratedError{i} -> generated-{i}")
+            case 1:
+                lines.append(f"function:generated_function_{i} module:app.* -> generated-{i}")
+            case 2:
+                lines.append(f'error.value:"generated value {i}*" -> generated-{i}')
+            case _:
+                lines.append(f"logger:generated.logger.{i}.* -> generated-{i}")
+    return FingerprintingRules.from_config_string("\n".join(lines))
+
+
+LARGE_RULE_SET = _make_large_fingerprinting_rules(500)
+LARGE_RULE_SET_EVENT = {
+    "platform": "python",
+    "logger": "app.views",
+    "exception": {
+        "values": [
+            {
+                "type": "GeneratedError496",
+                "value": "something went wrong",
+                "stacktrace": {
+                    "frames": [
+                        {"function": f"frame_{i}", "module": f"app.module_{i}"} for i in range(30)
+                    ]
+                },
+            }
+        ]
+    },
+}
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@pytest.mark.parametrize("matching", ["linear", "compiled"])
+def test_benchmark_fingerprinting_large_rule_set(matching, benchmark):
+    if matching == "linear":
+        get_values = LARGE_RULE_SET._get_fingerprint_values_for_event_linear
+    else:
+        get_values = LARGE_RULE_SET.get_fingerprint_values_for_event
+
+    rv = benchmark(get_values, LARGE_RULE_SET_EVENT)
+
+    assert rv is not None
+    assert rv[1] == ["generated-496"]
@@ -5,7 +5,7 @@ from unittest import mock
 
 import pytest
 
-from sentry.grouping.enhancer import Enhancements
+from sentry.grouping.enhancer import ENHANCEMENTS_CACHE, Enhancements
 from sentry.grouping.enhancer.exceptions import InvalidEnhancerConfig
 from sentry.grouping.enhancer.matchers import _cached, create_match_frame
 
@@ -66,6 +66,23 @@ def test_parse_empty_with_base():
     assert enhancement
 
 
+def test_parsed_enhancements_are_cached():
+    ENHANCEMENTS_CACHE.clear()
+    config = "function:panic_handler ^-group -group"
+    enhancement = Enhancements.from_config_string(config, bases=["common:v1"])
+
+    assert Enhancements.from_config_string(config, bases=["common:v1"]) is enhancement
+    assert Enhancements.from_config_string(config) is not enhancement
+
+    dumped = enhancement.dumps()
+    with mock.patch.object(Enhancements, "_loads", wraps=Enhancements._loads) as mock_loads:
+        loaded = Enhancements.loads(dumped)
+        assert Enhancements.loads(dumped) is loaded
+        assert Enhancements.loads(dumped.encode("ascii")) is loaded
+
+    assert mock_loads.call_count == 1
+
+
 def test_parsing_errors():
     with pytest.raises(InvalidEnhancerConfig):
         Enhancements.from_config_string("invalid.message:foo -> bar")
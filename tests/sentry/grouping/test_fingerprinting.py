@@ -1,9 +1,19 @@
 from typing import Any
+from unittest import mock
 
 import pytest
 
-from sentry.grouping.api import get_default_grouping_config_dict
-from sentry.grouping.fingerprinting import FingerprintingRules, InvalidFingerprintingConfig
+from sentry.grouping.api import (
+    FINGERPRINTING_RULES_CACHE,
+    _load_fingerprinting_rules,
+    get_default_grouping_config_dict,
+    get_fingerprinting_config_for_project,
+)
+from sentry.grouping.fingerprinting import (
+    EventAccess,
+    FingerprintingRules,
+    InvalidFingerprintingConfig,
+)
 from sentry.testutils.pytest.fixtures import django_db_all
 from tests.sentry.grouping import with_fingerprint_input
 
@@ -190,3 +200,79 @@ def test_event_hash_variant(insta_snapshot: Any, input: Any) -> None:
             },
         }
     )
+
+
+@with_fingerprint_input("input")
+@django_db_all  # because of `options` usage
+def test_compiled_matcher_matches_linear_matching(input: Any) -> None:
+    config, evt = input.create_event()
+    data = dict(evt.data)
+
+    assert config.get_fingerprint_values_for_event(
+        data
+    ) == config._get_fingerprint_values_for_event_linear(data)
+
+
+def test_compiled_matcher_only_checks_candidate_rules() -> None:
+    rules = FingerprintingRules.from_config_string(
+        """
+type:DatabaseUnavailable                        -> DatabaseUnavailable
+function:assertion_failed module:foo            -> AssertionFailed, foo
+!type:DatabaseUnavailable                       -> not-db
+sdk:sentry.python                               -> python
+"""
+    )
+    matcher = rules.get_matcher()
+
+    assert matcher.unindexed == [2]
+    assert matcher.index == {
+        "type": {"DatabaseUnavailable": [0]},
+        "function": {"assertion_failed": [1]},
+        "sdk": {"sentry.python": [3]},
+    }
+    assert rules.get_matcher() is matcher
+
+    event = {
+        "exception": {"values": [{"type": "DatabaseUnavailable"}]},
+        "sdk": {"name": "sentry.python"},
+    }
+    candidates = matcher.get_candidate_rules(EventAccess(event))
+    assert candidates == [rules.rules[0], rules.rules[2], rules.rules[3]]
+
+    rule, fingerprint, _ = rules.get_fingerprint_values_for_event(event)
+    assert rule is rules.rules[0]
+    assert fingerprint == ["DatabaseUnavailable"]
+
+
+def test_literal_prefix_short_circuit() -> None:
+    rules = FingerprintingRules.from_config_string(
+        """
+logger:sentry.*                                 -> logger
+error.value:"Connection refused*"               -> refused
+"""
+    )
+
+    assert rules.get_fingerprint_values_for_event({"logger": "sentry.api"})[1] == ["logger"]
+    assert rules.get_fingerprint_values_for_event({"logger": "django.db"}) is None
+    assert rules.get_fingerprint_values_for_event(
+        {"exception": {"values": [{"type": "Error", "value": "CONNECTION REFUSED: db"}]}}
+    )[1] == ["refused"]
+
+
+@django_db_all
+def test_project_fingerprinting_rules_are_cached(default_project: Any) -> None:
+    FINGERPRINTING_RULES_CACHE.clear()
+    default_project.update_option("sentry:fingerprinting_rules", "type:ValueError -> value-error")
+
+    with mock.patch(
+        "sentry.grouping.api._load_fingerprinting_rules", wraps=_load_fingerprinting_rules
+    ) as load_rules:
+        rules = get_fingerprinting_config_for_project(default_project)
+        assert get_fingerprinting_config_for_project(default_project) is rules
+        assert load_rules.call_count == 1
+        assert [rule.fingerprint for rule in rules.rules] == [["value-error"]]
+
+        default_project.update_option("sentry:fingerprinting_rules", "type:KeyError -> key-error")
+        new_rules = get_fingerprinting_config_for_project(default_project)
+        assert load_rules.call_count == 2
+        assert [rule.fingerprint for rule in new_rules.rules] == [["key-error"]]
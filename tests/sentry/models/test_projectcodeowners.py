@@ -1,6 +1,10 @@
+from unittest import mock
+
+from sentry.api.validators import project_codeowners
 from sentry.models.projectcodeowners import ProjectCodeOwners
 from sentry.ownership.grammar import Matcher, Owner, Rule, dump_schema
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.cache import cache
 
 
@@ -88,3 +92,64 @@ class ProjectCodeOwnersTestCase(TestCase):
                 },
             ],
         }
+
+    @override_options({"codeowners.incremental-sync.enabled": True})
+    def test_update_schema_incrementally(self):
+        code_owners = self.create_codeowners(self.project, self.code_mapping)
+        code_owners.update_schema(organization=self.organization, raw=self.data["raw"])
+
+        docs_rule = {
+            "matcher": {"type": "codeowners", "pattern": "docs/*"},
+            "owners": [
+                {"type": "user", "identifier": "admin@localhost"},
+                {"type": "team", "identifier": "tiger-team"},
+            ],
+            "hash": mock.ANY,
+        }
+        assert code_owners.schema == {"$version": 1, "rules": [docs_rule]}
+
+        raw = "# Ecosystem\nsrc/*  @getsentry/ecosystem\n" + self.data["raw"]
+        with mock.patch.object(
+            project_codeowners,
+            "validate_codeowners_associations",
+            wraps=project_codeowners.validate_codeowners_associations,
+        ) as validate_associations:
+            code_owners.update_schema(organization=self.organization, raw=raw)
+
+        # Only the new rule is resolved, and the rules stay in file order
+        validate_associations.assert_called_once_with("src/*  @getsentry/ecosystem", self.project)
+        code_owners.refresh_from_db()
+        assert code_owners.raw == raw
+        assert code_owners.schema == {
+            "$version": 1,
+            "rules": [
+                {
+                    "matcher": {"type": "codeowners", "pattern": "src/*"},
+                    "owners": [{"type": "team", "identifier": "tiger-team"}],
+                    "hash": mock.ANY,
+                },
+                docs_rule,
+            ],
+        }
+
+        with mock.patch.object(
+            project_codeowners, "validate_codeowners_associations"
+        ) as validate_associations:
+            code_owners.update_schema(organization=self.organization, raw=raw)
+        validate_associations.assert_not_called()
+
+    @override_options({"codeowners.incremental-sync.enabled": True})
+    def test_update_schema_incrementally_without_raw(self):
+        code_owners = self.create_codeowners(self.project, self.code_mapping)
+        code_owners.update_schema(organization=self.organization, raw=self.data["raw"])
+
+        # Associations changed, so all rules are resolved again
+        with mock.patch.object(
+            project_codeowners,
+            "validate_codeowners_associations",
+            wraps=project_codeowners.validate_codeowners_associations,
+        ) as validate_associations:
+            code_owners.update_schema(organization=self.organization)
+
+        validate_associations.assert_called_once_with(self.data["raw"].strip("\n"), self.project)
+        assert len(code_owners.schema["rules"]) == 1
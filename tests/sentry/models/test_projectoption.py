@@ -28,3 +28,15 @@ class ProjectOptionManagerTest(TestCase):
         ProjectOption.objects.create(project=self.project, key="foo", value="bar")
         result = ProjectOption.objects.get_value_bulk([self.project], "foo")
         assert result == {self.project: "bar"}
+
+    def test_get_all_values_bulk(self):
+        other_project = self.create_project(organization=self.organization)
+        ProjectOption.objects.create(project=self.project, key="foo", value="bar")
+
+        result = ProjectOption.objects.get_all_values_bulk([self.project, other_project.id])
+        assert result == {self.project.id: {"foo": "bar"}, other_project.id: {}}
+        assert ProjectOption.objects.get_all_values(self.project) == {"foo": "bar"}
+
+        ProjectOption.objects.clear_local_cache()
+        result = ProjectOption.objects.get_all_values_bulk([self.project, other_project])
+        assert result == {self.project.id: {"foo": "bar"}, other_project.id: {}}
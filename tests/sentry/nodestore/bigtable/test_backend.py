@@ -1,4 +1,6 @@
 import os
+import threading
+import time
 from collections.abc import Generator
 from contextlib import contextmanager
 from unittest import mock
@@ -174,3 +176,58 @@ def test_compression() -> None:
     assert ns.store.compression == "zlib"
     ns = BigtableNodeStorage(compression=False)
     assert ns.store.compression is None
+
+
+def test_get_multi_parallel() -> None:
+    ns = MockedBigtableNodeStorage(project="test", get_multi_chunk_size=2, get_multi_max_workers=4)
+    nodes = {f"node_{i}": {"foo": i} for i in range(5)}
+    for node_id, data in nodes.items():
+        ns.set(node_id, data)
+
+    table = ns.store._get_table()
+    with mock.patch.object(table, "read_rows", wraps=table.read_rows) as mock_read_rows:
+        assert ns.get_multi([*nodes, "missing"]) == {**nodes, "missing": None}
+        assert mock_read_rows.call_count == 3
+
+
+def test_get_multi_deadline() -> None:
+    ns = MockedBigtableNodeStorage(
+        project="test", get_multi_chunk_size=1, get_multi_max_workers=2, get_multi_deadline=0.5
+    )
+    ns.set("fast", {"foo": "fast"})
+    ns.set("slow", {"foo": "slow"})
+
+    released = threading.Event()
+    get_many = ns._get_many
+
+    def _get_many(id_list, deadline=None):
+        if id_list == ["slow"]:
+            released.wait(5)
+        return get_many(id_list, deadline)
+
+    with mock.patch.object(ns, "_get_many", side_effect=_get_many):
+        try:
+            # Nodes of chunks which didn't complete in time are returned as missing
+            assert ns.get_multi(["fast", "slow"]) == {"fast": {"foo": "fast"}, "slow": None}
+        finally:
+            released.set()
+
+
+def test_get_multi_deadline_bounds_requests() -> None:
+    ns = MockedBigtableNodeStorage(
+        project="test", get_multi_chunk_size=1, get_multi_max_workers=2, get_multi_deadline=5
+    )
+    ns.set("a", {"foo": "a"})
+    ns.set("b", {"foo": "b"})
+
+    with mock.patch.object(ns.store, "get_many", wraps=ns.store.get_many) as mock_get_many:
+        assert ns.get_multi(["a", "b"]) == {"a": {"foo": "a"}, "b": {"foo": "b"}}
+
+    assert mock_get_many.call_count == 2
+    for call in mock_get_many.call_args_list:
+        assert 0 < call.kwargs["timeout"] <= 5
+
+    # Chunks which only get to run after the deadline don't send a request at all
+    with mock.patch.object(ns.store, "get_many") as mock_get_many:
+        assert ns._get_many(["a"], deadline=time.monotonic() - 1) == []
+    assert mock_get_many.call_count == 0
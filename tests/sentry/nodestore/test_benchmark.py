@@ -0,0 +1,58 @@
+import statistics
+import time
+
+import pytest
+
+from sentry.nodestore.bigtable.backend import BigtableNodeStorage
+from sentry.utils.kvstore.memory import MemoryKVStorage
+
+# Rough cost of a Bigtable read: a round-trip per request plus some time per row
+ROUND_TRIP = 0.005
+PER_KEY = 0.0001
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+class SimulatedLatencyKVStorage(MemoryKVStorage[str, bytes]):
+    """
+    In-memory stand-in for Bigtable which sleeps for as long as a request would take.
+    """
+
+    def get_many(self, keys):
+        time.sleep(ROUND_TRIP + PER_KEY * len(keys))
+        return super().get_many(keys)
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@pytest.mark.parametrize("batch_size", [10, 100, 500])
+@pytest.mark.parametrize("max_workers", [1, 8])
+def test_benchmark_get_multi(batch_size, max_workers, benchmark):
+    ns = BigtableNodeStorage(
+        project="test", get_multi_chunk_size=50, get_multi_max_workers=max_workers
+    )
+    ns.store = SimulatedLatencyKVStorage()
+
+    id_list = [f"{i:032x}" for i in range(batch_size)]
+    for node_id in id_list:
+        ns.set(node_id, {"id": node_id})
+
+    latencies = []
+
+    def get_multi():
+        start = time.perf_counter()
+        rv = ns.get_multi(id_list)
+        latencies.append(time.perf_counter() - start)
+        return rv
+
+    assert len(benchmark.pedantic(get_multi, rounds=50)) == batch_size
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    benchmark.extra_info["p50"] = quantiles[49]
+    benchmark.extra_info["p99"] = quantiles[98]
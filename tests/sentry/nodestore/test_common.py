@@ -8,6 +8,7 @@ import pytest
 
 from sentry.nodestore.django.backend import DjangoNodeStorage
 from sentry.testutils.helpers import override_options
+from sentry.utils import json
 from tests.sentry.nodestore.bigtable.test_backend import (
     MockedBigtableNodeStorage,
     get_temporary_bigtable_nodestorage,
@@ -97,3 +98,88 @@ def test_set_subkeys(ns):
     ns.delete("node_1")
     assert ns.get("node_1") is None
     assert ns.get("node_1", subkey="other") is None
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.local-cache.max-bytes": 1024,
+    }
+)
+def test_local_cache(ns):
+    ns.set_subkeys("node_1", {None: {"foo": "a"}, "other": {"foo": "b"}})
+    # Change the node behind the cache's back, reads must still be served from memory
+    ns._set_bytes("node_1", ns._encode({None: {"foo": "changed"}}))
+
+    assert ns.get("node_1") == {"foo": "a"}
+    assert ns.get("node_1", subkey="other") == {"foo": "b"}
+    assert ns.get_multi(["node_1"]) == {"node_1": {"foo": "a"}}
+    assert ns.get_multi(["node_1"], subkey="other") == {"node_1": {"foo": "b"}}
+
+    # Every read decodes its own copy
+    ns.get("node_1")["foo"] = "mutated"
+    assert ns.get("node_1") == {"foo": "a"}
+
+    ns.delete("node_1")
+    assert ns.get("node_1") is None
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.local-cache.max-bytes": 64,
+    }
+)
+def test_local_cache_evicts_oversized_nodes(ns):
+    ns.set("node_1", {"foo": "a"})
+    assert "node_1" in ns.local_cache
+
+    ns.set("node_1", {"foo": "a" * 100})
+    assert "node_1" not in ns.local_cache
+    assert ns.get("node_1") == {"foo": "a" * 100}
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.local-cache.max-bytes": 1024,
+    }
+)
+def test_local_cache_delete_multi(ns):
+    nodes = [("node_1", {"foo": "a"}), ("node_2", {"foo": "b"})]
+    for n in nodes:
+        ns.set(n[0], n[1])
+
+    assert ns.get_multi(["node_1", "node_2"]) == dict(nodes)
+    ns.delete_multi(["node_1", "node_2"])
+    assert not ns.get("node_1")
+    assert not ns.get("node_2")
+
+
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_zstd_dictionary(ns, tmp_path):
+    import zstandard
+    from django.test import override_settings
+
+    from sentry.nodestore import compression
+
+    samples = [json.dumps({"platform": "python", "id": i}).encode() for i in range(200)]
+    path = tmp_path / "python.dict"
+    path.write_bytes(zstandard.train_dictionary(1024, samples, dict_id=42).as_bytes())
+
+    compression.get_dictionaries.cache_clear()
+    try:
+        with override_settings(SENTRY_NODESTORE_ZSTD_DICTIONARIES={42: str(path)}):
+            ns.set("node_legacy", {"platform": "python", "id": 1})
+            with override_options({"nodestore.zstd-dictionaries.platforms": {"python": 42}}):
+                ns.set_subkeys("node_1", {None: {"platform": "python", "id": 2}, "other": {}})
+
+            assert ns.get("node_legacy") == {"platform": "python", "id": 1}
+            assert ns.get("node_1") == {"platform": "python", "id": 2}
+            assert ns.get("node_1", subkey="other") == {}
+            assert ns.get_multi(["node_1"]) == {"node_1": {"platform": "python", "id": 2}}
+            assert ns.get_bytes("node_1") == ns._encode(
+                {None: {"platform": "python", "id": 2}, "other": {}}
+            )
+    finally:
+        compression.get_dictionaries.cache_clear()
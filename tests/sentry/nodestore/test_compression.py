@@ -0,0 +1,71 @@
+import pytest
+import zstandard
+from django.test import override_settings
+
+from sentry.nodestore import compression
+from sentry.testutils.helpers import override_options
+from sentry.utils import json
+
+DICT_ID = 1234
+
+
+def make_payload(i):
+    return json.dumps(
+        {
+            "platform": "python",
+            "event_id": f"{i:032x}",
+            "sdk": {"name": "sentry.python", "version": "1.2.3"},
+            "tags": [["level", "error"], ["server", f"web-{i % 7}"]],
+            "exception": {"values": [{"type": "ValueError", "value": f"bad value {i}"}]},
+        }
+    ).encode()
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    dictionary = zstandard.train_dictionary(
+        4096, [make_payload(i) for i in range(200)], dict_id=DICT_ID
+    )
+    path = tmp_path / "python.dict"
+    path.write_bytes(dictionary.as_bytes())
+
+    compression.get_dictionaries.cache_clear()
+    with override_settings(SENTRY_NODESTORE_ZSTD_DICTIONARIES={DICT_ID: str(path)}):
+        yield dictionary
+    compression.get_dictionaries.cache_clear()
+
+
+def test_compress_with_dictionary(dictionary):
+    data = make_payload(1000)
+
+    with override_options({"nodestore.zstd-dictionaries.platforms": {"python": DICT_ID}}):
+        compressed = compression.compress(data, "python")
+        # No dictionary configured for the platform, and no fallback
+        assert compression.compress(data, "javascript") == data
+
+    assert compressed.startswith(compression.ZSTD_FRAME_MAGIC)
+    assert zstandard.get_frame_parameters(compressed).dict_id == DICT_ID
+    assert len(compressed) < len(zstandard.ZstdCompressor().compress(data))
+
+    # Reading doesn't depend on the option, only on the dictionary still being configured
+    assert compression.decompress(compressed) == data
+
+
+def test_compress_fallback_platform(dictionary):
+    data = make_payload(1000)
+    with override_options({"nodestore.zstd-dictionaries.platforms": {"*": DICT_ID}}):
+        compressed = compression.compress(data, "javascript")
+    assert zstandard.get_frame_parameters(compressed).dict_id == DICT_ID
+
+
+def test_compress_unknown_dictionary(dictionary):
+    data = make_payload(1000)
+    with override_options({"nodestore.zstd-dictionaries.platforms": {"python": DICT_ID + 1}}):
+        assert compression.compress(data, "python") == data
+
+
+def test_decompress_legacy():
+    data = make_payload(1000)
+    assert compression.decompress(data) == data
+    # Plain zstd frames, without a dictionary, are read as well
+    assert compression.decompress(zstandard.ZstdCompressor().compress(data)) == data
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sentry.ownership.compiled import CompiledOwnershipRules
+from sentry.ownership.grammar import Matcher, Owner, Rule
+
+RULE_COUNT = 5000
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def get_codeowners_rules() -> list[Rule]:
+    """
+    Rules of a 5,000 line CODEOWNERS file of a monorepo, with a directory rule per package and a
+    few extension and catch-all rules.
+    """
+    rules = [
+        Rule(Matcher("codeowners", "*"), [Owner("team", "everyone")]),
+        Rule(Matcher("codeowners", "*.md"), [Owner("team", "docs")]),
+    ]
+    for i in range(RULE_COUNT - len(rules)):
+        pattern = f"/packages/package{i}/" if i % 2 else f"services/service{i}/**/*.py"
+        rules.append(Rule(Matcher("codeowners", pattern), [Owner("team", f"team{i % 100}")]))
+    return rules
+
+
+def get_event_data() -> dict[str, Any]:
+    frames = []
+    for i in range(0, 300, 10):
+        frames.append(
+            {
+                "filename": f"services/service{i}/handlers/api.py",
+                "abs_path": f"/srv/app/services/service{i}/handlers/api.py",
+                "in_app": True,
+            }
+        )
+    return {"platform": "python", "stacktrace": {"frames": frames}}
+
+
+def match_rules(rules: list[Rule], data: dict[str, Any]) -> list[Rule]:
+    munged_data = Matcher.munge_if_needed(data)
+    return [rule for rule in rules if rule.test(data, munged_data)]
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+def test_benchmark_rule_test(benchmark):
+    rules = get_codeowners_rules()
+    data = get_event_data()
+
+    matching_rules = benchmark(match_rules, rules, data)
+
+    assert len(matching_rules) == 31
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+def test_benchmark_compiled(benchmark):
+    rules = get_codeowners_rules()
+    data = get_event_data()
+    compiled = CompiledOwnershipRules(rules)
+
+    matching_rules = benchmark(compiled.get_matching_rules, data)
+
+    assert matching_rules == match_rules(rules, data)
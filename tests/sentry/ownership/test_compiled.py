@@ -0,0 +1,95 @@
+import pytest
+
+from sentry.ownership.compiled import CompiledOwnershipRules, get_compiled_rules, get_index_token
+from sentry.ownership.grammar import Matcher, Owner, Rule, dump_schema
+
+OWNER = [Owner("team", "owners")]
+
+PATTERNS = [
+    Matcher("codeowners", "*"),
+    Matcher("codeowners", "**"),
+    Matcher("codeowners", "*.py"),
+    Matcher("codeowners", "test.py"),
+    Matcher("codeowners", "test.?y"),
+    Matcher("codeowners", "test.*"),
+    Matcher("codeowners", "foo/"),
+    Matcher("codeowners", "foo/*/test.py"),
+    Matcher("codeowners", "foo/**/test.py"),
+    Matcher("codeowners", "/usr/local/src/foo/"),
+    Matcher("codeowners", "/usr/local/src/foo/*"),
+    Matcher("codeowners", "/usr/local/src/foo/*.py"),
+    Matcher("codeowners", "/usr/local/src/foo/test.py"),
+    Matcher("codeowners", "\\filename"),
+    Matcher("codeowners", "/"),
+    Matcher("path", "*.py"),
+    Matcher("path", "foo/*"),
+    Matcher("path", "*/FOO/*"),
+    Matcher("path", "src/{foo,bar}/*"),
+    Matcher("path", "/usr/local/src/config/*"),
+    Matcher("module", "foo.bar*"),
+    Matcher("url", "*example.com*"),
+    Matcher("tags.foo", "bar"),
+]
+
+FRAMES = [
+    [{"filename": "foo/test.py"}, {"abs_path": "/usr/local/src/foo/test.py"}],
+    [{"filename": "config/subdir/baz.txt"}, {"abs_path": "/usr/local/src/config/subdir/baz.txt"}],
+    [{"filename": "not_in_repo.py"}, {"abs_path": "/root/not_in_repo.py"}],
+    [{"filename": "foo/bar/baz/test.py"}, {"abs_path": "/usr/local/src/foo/bar/baz/test.py"}],
+    [{"filename": "foo/test.jy"}, {"abs_path": "/usr/local/src/foo/test.jy"}],
+    [{"filename": "bar/foo/test.py"}, {"abs_path": "/usr/local/src/bar/foo/test.jy"}],
+    [{"filename": "foo/subdir/\\filename"}, {"abs_path": "/usr/local/src/foo/subdir/\\filename"}],
+    [{"filename": "src\\Foo\\test.py"}, {"abs_path": "C:\\src\\Foo\\test.py", "in_app": False}],
+    [{"module": "foo.bar.baz"}],
+]
+
+
+@pytest.mark.parametrize(
+    "pattern, token",
+    [
+        ("*.py", None),
+        ("**", None),
+        ("/", None),
+        ("test.py", "test.py"),
+        ("test.?y", None),
+        ("foo/", "foo"),
+        ("foo/*/test.py", "test.py"),
+        ("/usr/local/src/foo/*.py", "local"),
+        ("*/FOO/*", "foo"),
+        ("src/{foo,bar}/*", "src"),
+        ("src/foo*/bar", "src"),
+        ("\\filename", None),
+    ],
+)
+def test_get_index_token(pattern, token):
+    assert get_index_token(pattern) == token
+
+
+@pytest.mark.parametrize("frames", FRAMES)
+def test_matches_like_rule_test(frames):
+    rules = [Rule(matcher, OWNER) for matcher in PATTERNS]
+    data = {
+        "stacktrace": {"frames": frames},
+        "request": {"url": "https://example.com/foo"},
+        "tags": [["foo", "bar"]],
+    }
+
+    expected = [rule for rule in rules if rule.test(data, None)]
+    assert CompiledOwnershipRules(rules).get_matching_rules(data) == expected
+
+
+def test_candidates_are_narrowed_down():
+    rules = [Rule(Matcher("codeowners", f"/src/module{i}/"), OWNER) for i in range(100)]
+    compiled = CompiledOwnershipRules(rules)
+
+    assert compiled.unindexed == []
+    assert compiled.get_candidates([{"filename": "src/module42/app.py"}], ["filename"]) == {42}
+
+
+def test_get_compiled_rules_is_cached():
+    schema = dump_schema([Rule(Matcher("path", "src/*"), OWNER)])
+
+    assert get_compiled_rules(schema) is get_compiled_rules(dict(schema))
+    assert get_compiled_rules(schema) is not get_compiled_rules(
+        dump_schema([Rule(Matcher("path", "tests/*"), OWNER)])
+    )
@@ -20,7 +20,12 @@ from sentry.dynamic_sampling.rules.base import NEW_MODEL_THRESHOLD_IN_MINUTES
 from sentry.models.projectkey import ProjectKey
 from sentry.models.projectteam import ProjectTeam
 from sentry.models.transaction_threshold import TransactionMetric
-from sentry.relay.config import ProjectConfig, get_project_config
+from sentry.relay.config import (
+    ProjectConfig,
+    get_exposed_features_bulk,
+    get_project_config,
+    get_project_configs,
+)
 from sentry.sentry_metrics.visibility import block_metric, block_tags_of_metric
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.factories import Factories
@@ -224,6 +229,52 @@ def test_project_config_exposed_features(default_project):
     assert cfg_features == ["organizations:profiling"]
 
 
+@django_db_all
+@region_silo_test
+@mock.patch(
+    "sentry.relay.config.EXPOSABLE_FEATURES",
+    ["organizations:profiling", "projects:discard-transaction"],
+)
+def test_exposed_features_bulk(default_project, factories):
+    other_project = factories.create_project(organization=default_project.organization)
+
+    with Feature({"organizations:profiling": True, "projects:discard-transaction": True}):
+        exposed_features = get_exposed_features_bulk(
+            default_project.organization, [default_project, other_project]
+        )
+
+    assert exposed_features == {
+        default_project.id: ["organizations:profiling", "projects:discard-transaction"],
+        other_project.id: ["organizations:profiling", "projects:discard-transaction"],
+    }
+
+
+@django_db_all
+@region_silo_test
+def test_get_project_configs(default_project, factories):
+    default_project.update_option("sentry:breakdowns", {"span_ops": {"type": "spanOperations"}})
+    other_project = factories.create_project(organization=default_project.organization)
+    keys = list(ProjectKey.objects.filter(project=default_project))
+    other_key = factories.create_project_key(other_project)
+
+    configs = get_project_configs([(default_project, keys), (other_project, [other_key])])
+    expected = [
+        get_project_config(default_project, project_keys=keys),
+        get_project_config(other_project, project_keys=[other_key]),
+    ]
+
+    assert len(configs) == 2
+    for config, expected_config in zip(configs, expected):
+        cfg = config.to_dict()
+        expected_cfg = expected_config.to_dict()
+        for key in ("lastChange", "lastFetch", "rev"):
+            cfg.pop(key)
+            expected_cfg.pop(key)
+        assert cfg == expected_cfg
+
+    assert get_project_configs([]) == []
+
+
 @django_db_all
 @region_silo_test
 @mock.patch("sentry.relay.config.EXPOSABLE_FEATURES", ["badprefix:custom-inbound-filters"])
@@ -1,6 +1,7 @@
 from unittest import mock
 
 from sentry.relay.projectconfig_cache import redis
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.utils import metrics
 
@@ -34,3 +35,48 @@ def test_read_write():
 
     assert cache.get_rev(dsn1) == "my_rev_123"
     assert cache.get_rev(dsn2) is None
+
+
+@django_db_all
+def test_get_many():
+    cache = redis.RedisProjectConfigCache()
+    cache.set_many({"a": {"foo": "bar", "rev": "1"}, "b": {"foo": "baz"}})
+
+    assert cache.get_many(["a", "b", "c"]) == {
+        "a": {"foo": "bar", "rev": "1"},
+        "b": {"foo": "baz"},
+        "c": None,
+    }
+
+
+@django_db_all
+@override_options({"relay.projectconfig-cache.local-ttl": 60.0})
+def test_get_many_local():
+    cache = redis.RedisProjectConfigCache()
+    cache.set_many({"a": {"foo": "bar", "rev": "1"}, "b": {"foo": "baz"}})
+    assert cache.get_many(["a", "b"]) == {"a": {"foo": "bar", "rev": "1"}, "b": {"foo": "baz"}}
+
+    # Only configs with an unchanged revision are served from memory
+    with mock.patch("zstandard.decompress", wraps=redis.zstandard.decompress) as decompress:
+        assert cache.get("a") == {"foo": "bar", "rev": "1"}
+        assert cache.get("b") == {"foo": "baz"}
+    assert decompress.call_count == 1
+
+    cache.set_many({"a": {"foo": "qux", "rev": "2"}})
+    assert cache.get("a") == {"foo": "qux", "rev": "2"}
+
+    cache.delete_many(["a"])
+    assert cache.get("a") is None
+
+
+@django_db_all
+@override_options({"relay.projectconfig-cache.local-ttl": 60.0})
+def test_get_many_local_disabled_config():
+    cache = redis.RedisProjectConfigCache()
+    cache.set_many({"a": {"foo": "bar", "rev": "1"}})
+    assert cache.get("a") == {"foo": "bar", "rev": "1"}
+    assert cache.get("a") == {"foo": "bar", "rev": "1"}
+
+    cache.set_many({"a": {"disabled": True}})
+    assert cache.get_rev("a") is None
+    assert cache.get("a") == {"disabled": True}
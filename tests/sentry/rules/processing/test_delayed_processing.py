@@ -23,11 +23,13 @@ from sentry.rules.processing.delayed_processing import (
     DataAndGroups,
     UniqueConditionQuery,
     apply_delayed,
+    apply_delayed_projects,
     bucket_num_groups,
     bulk_fetch_events,
     cleanup_redis_buffer,
     generate_unique_queries,
     get_condition_group_results,
+    get_condition_group_results_for_projects,
     get_condition_query_groups,
     get_group_to_groupevent,
     get_rules_to_fire,
@@ -380,6 +382,49 @@ class GetConditionGroupResultsTest(CreateEventTestCase):
             offset_percent_query: {group_id: 1},
         }
 
+    @patch("sentry.rules.processing.delayed_processing.get_condition_query_result")
+    def test_for_projects_coalesces_queries(self, mock_query):
+        mock_query.side_effect = lambda query, data, group_ids, *args: {
+            group_id: 1 for group_id in group_ids
+        }
+        project_two = self.create_project(organization=self.organization)
+        other_org_project = self.create_project(organization=self.create_organization())
+        condition_data = self.create_event_frequency_condition(interval=self.interval)
+        (query,) = generate_unique_queries(condition_data, self.environment.id)
+
+        results = get_condition_group_results_for_projects(
+            {
+                self.project: {query: DataAndGroups(condition_data, {1})},
+                project_two: {query: DataAndGroups(condition_data, {2, 3})},
+                other_org_project: {query: DataAndGroups(condition_data, {4})},
+            }
+        )
+
+        assert mock_query.call_count == 2
+        assert results == {
+            self.project.id: {query: {1: 1, 2: 1, 3: 1}},
+            project_two.id: {query: {1: 1, 2: 1, 3: 1}},
+            other_org_project.id: {query: {4: 1}},
+        }
+
+    @patch("sentry.rules.processing.delayed_processing.get_condition_query_result")
+    def test_for_projects_percent_sessions_not_coalesced(self, mock_query):
+        mock_query.return_value = {}
+        project_two = self.create_project(organization=self.organization)
+        condition_data = self.create_event_frequency_condition(
+            interval="5m", id="EventFrequencyPercentCondition", value=1.0
+        )
+        (query,) = generate_unique_queries(condition_data, self.environment.id)
+
+        get_condition_group_results_for_projects(
+            {
+                self.project: {query: DataAndGroups(condition_data, {1})},
+                project_two: {query: DataAndGroups(condition_data, {2})},
+            }
+        )
+
+        assert mock_query.call_count == 2
+
 
 class GetGroupToGroupEventTest(CreateEventTestCase):
     def setUp(self):
@@ -774,6 +819,24 @@ class ProcessDelayedAlertConditionsTest(CreateEventTestCase, PerformanceIssueTes
         )
         assert project_ids == []
 
+    @override_options({"delayed_processing.cross_project_batch.max_projects": 10})
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed.delay")
+    @patch("sentry.rules.processing.delayed_processing.apply_delayed_projects.delay")
+    def test_dispatches_coalesced_projects(self, mock_apply_delayed_projects, mock_apply_delayed):
+        self._push_base_events()
+        other_org_project = self.create_project(organization=self.create_organization())
+        self.push_to_hash(other_org_project.id, self.rule1.id, self.group1.id)
+        buffer.backend.push_to_sorted_set(
+            key=PROJECT_ID_BUFFER_LIST_KEY, value=other_org_project.id
+        )
+
+        process_delayed_alert_conditions()
+
+        mock_apply_delayed_projects.assert_called_once_with(
+            sorted([self.project.id, self.project_two.id])
+        )
+        mock_apply_delayed.assert_called_once_with(other_org_project.id)
+
     def test_get_condition_groups(self):
         self._push_base_events()
         project_three = self.create_project(organization=self.organization)
@@ -847,6 +910,27 @@ class ProcessDelayedAlertConditionsTest(CreateEventTestCase, PerformanceIssueTes
         rule_group_data = buffer.backend.get_hash(Project, {"project_id": self.project_two.id})
         assert rule_group_data == {}
 
+    @patch("sentry.rules.conditions.event_frequency.MIN_SESSIONS_TO_FIRE", 1)
+    def test_apply_delayed_projects_rules_to_fire(self):
+        """
+        Test that coalescing the queries of several projects fires the same rules as processing
+        each project on its own.
+        """
+        self._push_base_events()
+        apply_delayed_projects([self.project.id, self.project_two.id])
+
+        rule_fire_histories = RuleFireHistory.objects.filter(
+            rule__in=[self.rule1, self.rule2, self.rule3, self.rule4],
+        ).values_list("rule", "group")
+        assert set(rule_fire_histories) == {
+            (self.rule1.id, self.group1.id),
+            (self.rule2.id, self.group2.id),
+            (self.rule3.id, self.group3.id),
+            (self.rule4.id, self.group4.id),
+        }
+        self.assert_buffer_cleared(project_id=self.project.id)
+        self.assert_buffer_cleared(project_id=self.project_two.id)
+
     def test_apply_delayed_issue_platform_event(self):
         """
         Test that we fire rules triggered from issue platform events
@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sentry.eventstore.models import GroupEvent
+from sentry.rules.conditions.event_frequency import EventFrequencyCondition
+from sentry.rules.processing.frequency_counters import FrequencyCounter, get_counts, record_event
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.datetime import before_now, freeze_time, iso_format
+from sentry.testutils.helpers.options import override_options
+from sentry.testutils.skips import requires_snuba
+
+pytestmark = [requires_snuba]
+
+FROZEN_TIME = before_now(days=1).replace(hour=13, minute=30, second=0, microsecond=0)
+
+
+class FrequencyCountersTest(TestCase):
+    def store_group_event(
+        self, timestamp: datetime, fingerprint: str = "group-1", user_id: str = "1"
+    ) -> GroupEvent:
+        event = self.store_event(
+            data={
+                "timestamp": iso_format(timestamp),
+                "fingerprint": [fingerprint],
+                "environment": "production",
+                "user": {"id": user_id},
+            },
+            project_id=self.project.id,
+        )
+        assert event.group is not None
+        group_event = event.for_group(event.group)
+        record_event(group_event)
+        return group_event
+
+    def store_events(self) -> GroupEvent:
+        # Counting starts with the first event, so the windows below are fully covered
+        with freeze_time(FROZEN_TIME - timedelta(minutes=62)):
+            self.store_group_event(FROZEN_TIME - timedelta(minutes=62), user_id="1")
+
+        with freeze_time(FROZEN_TIME):
+            self.store_group_event(FROZEN_TIME - timedelta(minutes=30), user_id="1")
+            self.store_group_event(FROZEN_TIME - timedelta(minutes=10), user_id="1")
+            self.store_group_event(FROZEN_TIME - timedelta(minutes=3), user_id="2")
+            return self.store_group_event(FROZEN_TIME, user_id="2")
+
+    def test_counts_events(self):
+        event = self.store_events()
+
+        with freeze_time(FROZEN_TIME):
+            for duration, count in ((5, 2), (15, 3), (60, 4)):
+                assert get_counts(
+                    FrequencyCounter.EVENTS,
+                    {event.group_id},
+                    FROZEN_TIME - timedelta(minutes=duration),
+                    FROZEN_TIME,
+                    None,
+                ) == {event.group_id: count}
+
+    def test_counts_unique_users(self):
+        event = self.store_events()
+
+        with freeze_time(FROZEN_TIME):
+            assert get_counts(
+                FrequencyCounter.USERS,
+                {event.group_id},
+                FROZEN_TIME - timedelta(minutes=15),
+                FROZEN_TIME,
+                event.get_environment().id,
+            ) == {event.group_id: 2}
+
+    def test_environment(self):
+        event = self.store_events()
+        environment = self.create_environment(project=self.project, name="staging")
+
+        with freeze_time(FROZEN_TIME):
+            assert get_counts(
+                FrequencyCounter.EVENTS,
+                {event.group_id},
+                FROZEN_TIME - timedelta(minutes=5),
+                FROZEN_TIME,
+                event.get_environment().id,
+            ) == {event.group_id: 2}
+            # The group has never been seen in the environment, so it's left to Snuba
+            assert (
+                get_counts(
+                    FrequencyCounter.EVENTS,
+                    {event.group_id},
+                    FROZEN_TIME - timedelta(minutes=5),
+                    FROZEN_TIME,
+                    environment.id,
+                )
+                == {}
+            )
+
+    def test_unsupported_windows(self):
+        event = self.store_events()
+
+        with freeze_time(FROZEN_TIME):
+            for start, end in (
+                (FROZEN_TIME - timedelta(minutes=1), FROZEN_TIME),
+                (FROZEN_TIME - timedelta(days=1), FROZEN_TIME),
+                (FROZEN_TIME - timedelta(hours=2), FROZEN_TIME - timedelta(hours=1)),
+            ):
+                counts = get_counts(FrequencyCounter.EVENTS, {event.group_id}, start, end, None)
+                assert counts is None
+
+    def test_omits_groups_counted_after_window_start(self):
+        event = self.store_events()
+        with freeze_time(FROZEN_TIME):
+            new_event = self.store_group_event(FROZEN_TIME, fingerprint="group-2")
+
+            assert get_counts(
+                FrequencyCounter.EVENTS,
+                {event.group_id, new_event.group_id, 0},
+                FROZEN_TIME - timedelta(minutes=5),
+                FROZEN_TIME,
+                None,
+            ) == {event.group_id: 2}
+
+    def test_condition_batch_query(self):
+        event = self.store_events()
+        with freeze_time(FROZEN_TIME):
+            new_event = self.store_group_event(FROZEN_TIME, fingerprint="group-2")
+            condition = EventFrequencyCondition(
+                project=self.project, data={"interval": "5m", "value": 1}
+            )
+
+            with (
+                override_options({"rules.frequency-counters.enabled": True}),
+                patch.object(
+                    EventFrequencyCondition,
+                    "batch_query_hook",
+                    return_value={new_event.group_id: 1},
+                ) as batch_query_hook,
+            ):
+                result = condition.batch_query(
+                    {event.group_id, new_event.group_id},
+                    FROZEN_TIME - timedelta(minutes=5),
+                    FROZEN_TIME,
+                    environment_id=None,
+                )
+
+        assert result == {event.group_id: 2, new_event.group_id: 1}
+        batch_query_hook.assert_called_once_with(
+            {new_event.group_id},
+            FROZEN_TIME - timedelta(minutes=5),
+            FROZEN_TIME,
+            None,
+        )
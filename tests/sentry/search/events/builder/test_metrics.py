@@ -34,6 +34,7 @@ from sentry.snuba.metrics.naming_layer.mri import TransactionMRI
 from sentry.testutils.cases import MetricsEnhancedPerformanceTestCase
 from sentry.testutils.helpers import Feature
 from sentry.testutils.helpers.discover import user_misery_formula
+from sentry.testutils.helpers.options import override_options
 
 pytestmark = pytest.mark.sentry_metrics
 
@@ -1541,6 +1542,34 @@ class MetricQueryBuilderTest(MetricBuilderBaseTest):
             ),
         )
 
+    def test_custom_measurements_cached(self):
+        custom_measurements = [
+            {
+                "name": "measurements.custom.measurement",
+                "type": "distribution",
+                "operations": ["avg", "p50"],
+                "unit": "millisecond",
+                "metric_id": 1,
+                "mri": "d:transactions/measurements.custom.measurement@millisecond",
+            }
+        ]
+        with (
+            override_options({"querybuilder.custom-measurements.cache-ttl": 300}),
+            mock.patch(
+                "sentry.snuba.metrics.datasource.get_custom_measurements",
+                return_value=custom_measurements,
+            ) as get_custom_measurements,
+        ):
+            for _ in range(2):
+                query = MetricsQueryBuilder(
+                    self.params,
+                    dataset=Dataset.PerformanceMetrics,
+                    selected_columns=["p50(transaction.duration)"],
+                )
+                assert query.custom_measurement_map == custom_measurements
+
+        get_custom_measurements.assert_called_once()
+
     def test_group_by_not_in_select(self):
         query = MetricsQueryBuilder(
             self.params,
@@ -197,6 +197,26 @@ class RedisScriptMinHashIndexBackendTestCase(TestCase):
             == [("4", [1.0, None]), ("1", [1.0, 0.0]), ("2", [1.0, 0.0]), ("3", [1.0, 0.0])]
         )
 
+    def test_record_many(self):
+        timestamp = int(time.time())
+        self.index.record_many(
+            "example",
+            [
+                ("1", [("index:a", "hello world"), ("index:b", "hello world")], timestamp),
+                ("2", [("index:a", "hello world"), ("index:b", "pizza world")], timestamp),
+                ("3", [("index:b", "hello world")], timestamp - 60),
+                ("4", [], timestamp),
+            ],
+        )
+        self.index.record("example", "5", [("index:a", "hello world")])
+
+        results = self.index.compare("example", "1", [("index:a", 0), ("index:b", 0)])
+        assert len(results) == 4
+        assert results[0] == ("1", [1.0, 1.0])
+        assert results[1][0] == "2"
+        assert results[1][1][0] == 1.0
+        assert results[2:] == [("3", [0.0, 1.0]), ("5", [1.0, 0.0])]
+
     def test_merge(self):
         self.index.record("example", "1", [("index", ["foo", "bar"])])
         self.index.record("example", "2", [("index", ["baz"])])
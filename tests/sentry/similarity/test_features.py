@@ -0,0 +1,56 @@
+from functools import cached_property
+
+from sentry.similarity import _make_index_backend
+from sentry.similarity.encoder import Encoder
+from sentry.similarity.features import FeatureSet, InterfaceDoesNotExist, MessageFeature
+from sentry.testutils.cases import TestCase
+from sentry.utils import redis
+from sentry.utils.datastructures import BidirectionalMapping
+from sentry.utils.iterators import shingle
+
+
+class FeatureSetTestCase(TestCase):
+    @cached_property
+    def features(self):
+        return FeatureSet(
+            _make_index_backend(
+                redis.clusters.get("default").get_local_client(0), namespace="sim:test"
+            ),
+            Encoder(),
+            BidirectionalMapping({"message:message:character-shingles": "a"}),
+            {
+                "message:message:character-shingles": MessageFeature(
+                    lambda message: ["".join(part) for part in shingle(5, message.formatted)]
+                ),
+            },
+            expected_extraction_errors=(InterfaceDoesNotExist,),
+            expected_encoding_errors=(),
+        )
+
+    def store_message(self, message, fingerprint):
+        return self.store_event(
+            data={"message": message, "fingerprint": [fingerprint]}, project_id=self.project.id
+        )
+
+    def test_record(self):
+        event = self.store_message("hello world", "group-1")
+
+        self.features.record([event])
+
+        assert self.features.classify([event]) == [
+            (event.group_id, {"message:message:character-shingles": 1.0})
+        ]
+
+    def test_record_many(self):
+        first = self.store_message("hello world", "group-1")
+        second = self.store_message("an unrelated message", "group-2")
+
+        self.features.record_many([first, second])
+
+        assert self.features.classify([first])[0][0] == first.group_id
+        assert self.features.classify([second])[0][0] == second.group_id
+
+    def test_classify_without_records(self):
+        event = self.store_message("hello world", "group-1")
+
+        assert self.features.classify([event]) == []
@@ -24,3 +24,21 @@ def test_signatures() -> None:
     estimation = results[True] / float(sum(results.values()))
 
     assert similarity == pytest.approx(estimation, 0.1)
+
+
+def test_build_many() -> None:
+    get_signature = MinHashSignatureBuilder(16, 0xFFFF)
+    feature_sets = [
+        "hello world",
+        {"foo", "bar", "baz"},
+        [b"\x00\x01", b"", "\u2603 snowman".encode(), b"a longer feature of several blocks"],
+        ["fo", "foo", "foo!", "foo!!"],
+    ]
+
+    assert get_signature.build_many(feature_sets) == [
+        get_signature(features) for features in feature_sets
+    ]
+    assert get_signature.build_many([]) == []
+
+    with pytest.raises(ValueError):
+        get_signature.build_many([["foo"], []])
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from unittest.mock import patch
 
 import pytest
@@ -11,10 +12,12 @@ from sentry.snuba.metrics.extraction import (
     are_specs_equal,
     cleanup_search_query,
     failure_tag_spec,
+    get_on_demand_metric_spec,
     query_tokens_to_string,
     should_use_on_demand_metrics,
     to_standard_metrics_query,
 )
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.utils.glob import glob_match
 
@@ -733,6 +736,28 @@ def test_spec_custom_tag() -> None:
     assert custom_tag_spec.condition == {"name": "event.tags.foo", "op": "eq", "value": "bar"}
 
 
+@django_db_all
+def test_get_on_demand_metric_spec_cached(default_project) -> None:
+    with override_options({"on_demand_metrics.spec_cache.enabled": True}):
+        spec = get_on_demand_metric_spec("count()", "foo:bar", environment="prod")
+        assert get_on_demand_metric_spec("count()", "foo:bar", environment="prod") is spec
+        assert get_on_demand_metric_spec("count()", "foo:baz", environment="prod") is not spec
+
+        expected = OnDemandMetricSpec("count()", "foo:bar", environment="prod")
+        assert spec.query_hash == expected.query_hash
+        assert spec.to_metric_spec(default_project) == expected.to_metric_spec(default_project)
+
+        # The derived hash and condition are reused from the shared cache by other processes
+        with (
+            patch("sentry.snuba.metrics.extraction._spec_cache", OrderedDict()),
+            patch.object(OnDemandMetricSpec, "_process_query") as process_query,
+        ):
+            spec = get_on_demand_metric_spec("count()", "foo:bar", environment="prod")
+            assert spec.condition == expected.condition
+            assert spec.query_hash == expected.query_hash
+        process_query.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "query",
     [
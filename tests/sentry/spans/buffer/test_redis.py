@@ -1,4 +1,11 @@
-from sentry.spans.buffer.redis import ProcessSegmentsContext, RedisSpansBuffer, SegmentKey
+from unittest import mock
+
+from sentry.spans.buffer.redis import (
+    BufferedSegment,
+    ProcessSegmentsContext,
+    RedisSpansBuffer,
+    SegmentKey,
+)
 from sentry.testutils.pytest.fixtures import django_db_all
 
 
@@ -148,3 +155,85 @@ class TestRedisSpansBuffer:
             b"1710280892",
             b"segment:segment_3:1:process-segment",
         ]
+
+    @django_db_all
+    def test_iter_and_expire_segments(self):
+        buffer = RedisSpansBuffer()
+        spans_map = {
+            SegmentKey("segment_1", 1, 1): [b"span data %d" % i for i in range(7)],
+            SegmentKey("segment_2", 1, 1): [b"span data"],
+            SegmentKey("segment_3", 1, 1): [b"x" * 100] * 5,
+        }
+        buffer.batch_write_and_check_processing(
+            spans_map=spans_map,
+            segment_first_seen_ts={key: 1710280889 for key in spans_map},
+            latest_ts_by_partition={1: 1710280889},
+        )
+
+        keys = [
+            "segment:segment_1:1:process-segment",
+            "segment:segment_2:1:process-segment",
+            "segment:segment_3:1:process-segment",
+            "segment:missing:1:process-segment",
+        ]
+        assert list(buffer.iter_and_expire_segments(keys, chunk_size=3, max_segment_bytes=250)) == [
+            BufferedSegment(key=keys[0], spans=[b"span data %d" % i for i in range(7)]),
+            BufferedSegment(key=keys[1], spans=[b"span data"]),
+            # Overflowing segments are not read to the end
+            BufferedSegment(key=keys[2], spans=[], overflow=True),
+            BufferedSegment(key=keys[3], spans=[]),
+        ]
+        for key in keys:
+            assert not buffer.client.exists(key)
+
+    @django_db_all
+    def test_iter_and_expire_segments_keeps_appended_spans(self):
+        buffer = RedisSpansBuffer()
+        spans_map = {
+            SegmentKey("segment_1", 1, 1): [b"span data"],
+            SegmentKey("segment_2", 1, 1): [b"span data %d" % i for i in range(5)],
+        }
+        buffer.batch_write_and_check_processing(
+            spans_map=spans_map,
+            segment_first_seen_ts={key: 1710280889 for key in spans_map},
+            latest_ts_by_partition={1: 1710280889},
+        )
+
+        keys = ["segment:segment_1:1:process-segment", "segment:segment_2:1:process-segment"]
+        segments = buffer.iter_and_expire_segments(keys, chunk_size=3, max_segment_bytes=1000)
+
+        assert next(segments) == BufferedSegment(key=keys[0], spans=[b"span data"])
+        # Spans arriving while the segments are read: the first segment has been read already, the
+        # second one is read after this
+        buffer.client.rpush(keys[0], b"late span")
+        buffer.client.rpush(keys[1], b"late span")
+
+        assert list(segments) == [
+            BufferedSegment(
+                key=keys[1], spans=[*(b"span data %d" % i for i in range(5)), b"late span"]
+            ),
+        ]
+        assert buffer.client.lrange(keys[0], 0, -1) == [b"late span"]
+        assert not buffer.client.exists(keys[1])
+
+    @django_db_all
+    def test_get_unprocessed_segments_incrementally(self):
+        buffer = RedisSpansBuffer()
+        spans_map = {SegmentKey(f"segment_{i}", 1, 1): [b"span data"] for i in range(5)}
+        buffer.batch_write_and_check_processing(
+            spans_map=spans_map,
+            segment_first_seen_ts={key: 1710280890 for key in spans_map},
+            latest_ts_by_partition={1: 1710280890},
+        )
+
+        with mock.patch("sentry.spans.buffer.redis.BUCKET_PAGE_SIZE", 2):
+            assert buffer.get_unprocessed_segments_and_prune_bucket(
+                1710281011, 1, max_segments=3
+            ) == [f"segment:segment_{i}:1:process-segment" for i in range(3)]
+            assert buffer.get_unprocessed_segments_and_prune_bucket(1710281011, 1) == [
+                f"segment:segment_{i}:1:process-segment" for i in range(3, 5)
+            ]
+        assert (
+            buffer.client.lrange("performance-issues:unprocessed-segments:partition-2:1", 0, -1)
+            == []
+        )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import abc
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from hashlib import md5
 from typing import Any
@@ -63,6 +65,7 @@ from sentry.tasks.post_process import (
     locks,
     post_process_group,
     process_event,
+    run_pipeline_concurrently,
     run_post_process_job,
 )
 from sentry.testutils.cases import BaseTestCase, PerformanceIssueTestCase, SnubaTestCase, TestCase
@@ -3040,3 +3043,91 @@ class PostProcessGroupFeedbackTest(
     @pytest.mark.skip(reason="those tests do not work with the given call_post_process_group impl")
     def test_processing_cache_cleared_with_commits(self):
         pass
+
+
+class RunPipelineConcurrentlyTest(TestCase):
+    def test_runs_steps_after_their_dependencies(self):
+        order = []
+
+        def process_snoozes(job):
+            time.sleep(0.05)
+            order.append("process_snoozes")
+
+        def process_similarity(job):
+            order.append("process_similarity")
+
+        def process_rules(job):
+            order.append("process_rules")
+
+        def unlisted_step(job):
+            order.append("unlisted_step")
+
+        pipeline = [process_snoozes, process_similarity, process_rules, unlisted_step]
+        run_pipeline_concurrently(pipeline, lambda step: step({}), step_timeout=5)
+
+        assert order == ["process_similarity", "process_snoozes", "process_rules", "unlisted_step"]
+
+    def test_step_timeout(self):
+        order = []
+        release = threading.Event()
+
+        def handle_owner_assignment(job):
+            release.wait(5)
+            order.append("handle_owner_assignment")
+
+        def handle_auto_assignment(job):
+            order.append("handle_auto_assignment")
+
+        with patch("sentry.tasks.post_process.metrics.incr") as mock_incr:
+            run_pipeline_concurrently(
+                [handle_owner_assignment, handle_auto_assignment],
+                lambda step: step({}),
+                step_timeout=0.05,
+            )
+        release.set()
+
+        assert order == ["handle_auto_assignment"]
+        mock_incr.assert_called_once_with(
+            "sentry.tasks.post_process.post_process_group.timeout",
+            tags={"pipeline": "handle_owner_assignment"},
+        )
+
+    def test_step_timeout_starts_when_step_runs(self):
+        order = []
+
+        def process_commits(job):
+            time.sleep(0.25)
+            order.append("process_commits")
+
+        def process_similarity(job):
+            time.sleep(0.25)
+            order.append("process_similarity")
+
+        # With a single worker the second step waits in the queue for longer than its timeout
+        with (
+            patch(
+                "sentry.tasks.post_process._pipeline_step_pool",
+                ThreadPoolExecutor(max_workers=1),
+            ),
+            patch("sentry.tasks.post_process.metrics.incr") as mock_incr,
+        ):
+            run_pipeline_concurrently(
+                [process_commits, process_similarity], lambda step: step({}), step_timeout=0.4
+            )
+
+        assert order == ["process_commits", "process_similarity"]
+        assert not mock_incr.called
+
+    @patch("sentry.tasks.post_process.connections")
+    def test_closes_connections_after_each_step(self, mock_connections):
+        def process_commits(job):
+            pass
+
+        def process_similarity(job):
+            pass
+
+        run_pipeline_concurrently(
+            [process_commits, process_similarity], lambda step: step({}), step_timeout=5
+        )
+
+        assert mock_connections.close_all.call_count == 2
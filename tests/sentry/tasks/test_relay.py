@@ -14,6 +14,7 @@ from sentry.relay.projectconfig_debounce_cache.redis import RedisProjectConfigDe
 from sentry.tasks.relay import (
     _schedule_invalidate_project_config,
     build_project_config,
+    compute_configs,
     invalidate_project_config,
     schedule_build_project_config,
     schedule_invalidate_project_config,
@@ -329,6 +330,33 @@ def test_projectkeys(
         assert not redis_cache.get(key.public_key)
 
 
+@django_db_all
+def test_compute_organization_configs(default_organization, default_project, factories):
+    other_project = factories.create_project(organization=default_organization)
+    ProjectKey.objects.filter(project_id__in=[default_project.id, other_project.id]).delete()
+
+    key = factories.create_project_key(default_project)
+    other_key = factories.create_project_key(other_project)
+    inactive_key = factories.create_project_key(other_project)
+    inactive_key.update(status=ProjectKeyStatus.INACTIVE)
+    uncached_key = factories.create_project_key(other_project)
+
+    cached = {k.public_key: {"dummy-key": "val"} for k in (key, other_key, inactive_key)}
+    with mock.patch(
+        "sentry.relay.projectconfig_cache.backend.get_many",
+        side_effect=lambda public_keys: {pk: cached.get(pk) for pk in public_keys},
+    ):
+        configs = compute_configs(organization_id=default_organization.id)
+
+    assert set(configs) == {key.public_key, other_key.public_key, inactive_key.public_key}
+    assert uncached_key.public_key not in configs
+    assert configs[inactive_key.public_key] == {"disabled": True}
+    for k in (key, other_key):
+        assert configs[k.public_key]["projectId"] == k.project_id
+        (public_key,) = configs[k.public_key]["publicKeys"]
+        assert public_key["publicKey"] == k.public_key
+
+
 @django_db_all(transaction=True)
 def test_db_transaction(
     default_project,
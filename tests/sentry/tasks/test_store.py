@@ -6,15 +6,21 @@ from django.test.utils import override_settings
 
 from sentry import options, quotas
 from sentry.event_manager import EventManager
+from sentry.eventstore import processing
 from sentry.exceptions import HashDiscarded
 from sentry.plugins.base.v2 import Plugin2
 from sentry.tasks.store import (
+    SaveEventTaskKind,
+    _do_save_event_batch,
+    _flush_save_event_batch,
     is_process_disabled,
     preprocess_event,
     process_event,
     save_event,
+    submit_save_event,
     time_synthetic_monitoring_event,
 )
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 
 EVENT_ID = "cc3e6c2bb6b6498097f336d1e6979f4b"
@@ -351,3 +357,107 @@ def test_killswitch():
     options.set("store.load-shed-process-event-projects-gradual", {1: 1.0})
     assert is_process_disabled(1, "asdasdasd", "null")
     options.set("store.load-shed-process-event-projects-gradual", {})
+
+
+@pytest.fixture
+def mock_save_event_batch():
+    with mock.patch("sentry.tasks.store.save_event_batch") as m:
+        yield m
+
+
+@django_db_all
+@override_options({"store.save-event-batch.enabled": True, "store.save-event-batch.size": 2})
+def test_submit_save_event_batches_events(default_project, mock_save_event, mock_save_event_batch):
+    cache_keys = [f"e:{event_id}:{default_project.id}" for event_id in ("a" * 32, "b" * 32)]
+
+    for i, cache_key in enumerate(cache_keys):
+        submit_save_event(
+            SaveEventTaskKind(),
+            project_id=default_project.id,
+            cache_key=cache_key,
+            event_id=None,
+            start_time=100.0 + i,
+            data=None,
+        )
+
+    # The first event schedules the batch, the second one fills it up
+    assert mock_save_event_batch.apply_async.call_count == 1
+    assert mock_save_event_batch.delay.call_count == 1
+    assert mock_save_event.delay.call_count == 0
+
+    # Events with attachments are never batched
+    submit_save_event(
+        SaveEventTaskKind(has_attachments=True),
+        project_id=default_project.id,
+        cache_key=f"e:{'c' * 32}:{default_project.id}",
+        event_id=None,
+        start_time=None,
+        data=None,
+    )
+
+    with mock.patch("sentry.tasks.store._do_save_event_batch") as do_save_event_batch:
+        _flush_save_event_batch(default_project.id)
+        _flush_save_event_batch(default_project.id)
+
+    do_save_event_batch.assert_called_once_with(cache_keys, default_project.id, 100.0)
+
+
+@django_db_all
+def test_save_event_batch_falls_back_to_save_event(default_project, mock_save_event):
+    datas = [
+        {
+            "project": default_project.id,
+            "platform": "python",
+            "event_id": event_id,
+            "timestamp": time(),
+        }
+        for event_id in ("a" * 32, "b" * 32)
+    ]
+    cache_keys = [processing.event_processing_store.store(data) for data in datas]
+
+    # A single bad event fails saving the whole batch
+    with (
+        mock.patch("sentry.event_manager.save_error_events_many", side_effect=ValueError("boom")),
+        mock.patch("sentry.tasks.store.reprocessing2.mark_event_reprocessed") as mark_reprocessed,
+    ):
+        _do_save_event_batch(cache_keys, default_project.id, 100.0)
+
+    # Each event is saved on its own instead, and leaves marking it reprocessed to `save_event`
+    assert mock_save_event.delay.call_args_list == [
+        mock.call(
+            cache_key=cache_key,
+            data=None,
+            start_time=100.0,
+            event_id=data["event_id"],
+            project_id=default_project.id,
+        )
+        for cache_key, data in zip(cache_keys, datas)
+    ]
+    assert mark_reprocessed.call_count == 0
+    for cache_key in cache_keys:
+        assert processing.event_processing_store.get(cache_key) is not None
+
+
+@django_db_all
+def test_save_event_batch_load_shed_per_platform(default_project):
+    datas = [
+        {"project": default_project.id, "platform": platform, "event_id": event_id}
+        for platform, event_id in (("python", "a" * 32), ("javascript", "b" * 32))
+    ]
+    cache_keys = [processing.event_processing_store.store(data) for data in datas]
+
+    with (
+        override_options(
+            {
+                "store.load-shed-save-event-projects": [
+                    {"project_id": str(default_project.id), "platform": "javascript"}
+                ]
+            }
+        ),
+        mock.patch("sentry.event_manager.save_error_events_many", return_value=[]) as save_many,
+    ):
+        _do_save_event_batch(cache_keys, default_project.id)
+
+    (saved_datas, _), _ = save_many.call_args
+    assert [data["event_id"] for data in saved_datas] == ["a" * 32]
+    assert processing.event_processing_store.get(cache_keys[1]) is None
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sentry.testutils.performance_issues.event_generators import EVENTS, get_event
+from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.utils.performance_issues.performance_detection import (
+    DETECTOR_CLASSES,
+    get_detection_settings,
+    get_span_columns,
+    run_detector_on_data,
+)
+
+SPAN_COUNT = 5000
+
+
+def benchmark_available() -> bool:
+    try:
+        __import__("pytest_benchmark")
+    except ModuleNotFoundError:
+        return False
+    else:
+        return True
+
+
+def get_large_event() -> dict[str, Any]:
+    """
+    A transaction with `SPAN_COUNT` spans, made by concatenating the spans of all recorded
+    fixtures.
+    """
+    spans = [span for name in sorted(EVENTS) for span in get_event(name).get("spans") or []]
+    event = get_event("n-plus-one-in-django-index-view")
+    event["spans"] = []
+    while len(event["spans"]) < SPAN_COUNT:
+        for span in spans[: SPAN_COUNT - len(event["spans"])]:
+            event["spans"].append({**span, "span_id": "%016x" % len(event["spans"])})
+    return event
+
+
+def detect(event: dict[str, Any], settings: dict[Any, Any], columnar: bool) -> dict[str, Any]:
+    columns = get_span_columns(event) if columnar else None
+    problems = {}
+    for detector_class in DETECTOR_CLASSES:
+        detector = detector_class(settings, event)
+        run_detector_on_data(detector, event, columns)
+        problems.update(detector.stored_problems)
+    return problems
+
+
+@pytest.mark.skipif(not benchmark_available(), reason="requires pytest-benchmark")
+@django_db_all
+@pytest.mark.parametrize("columnar", [False, True])
+def test_benchmark_detection(columnar, benchmark):
+    event = get_large_event()
+    settings = get_detection_settings()
+
+    problems = benchmark(detect, event, settings, columnar)
+
+    assert problems == detect(event, settings, columnar=not columnar)
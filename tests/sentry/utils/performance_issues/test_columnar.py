@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from sentry.testutils.performance_issues.event_generators import (
+    EVENTS,
+    create_event,
+    create_span,
+    get_event,
+)
+from sentry.testutils.pytest.fixtures import django_db_all
+from sentry.utils.performance_issues.base import PerformanceDetector
+from sentry.utils.performance_issues.columnar import SpanColumns
+from sentry.utils.performance_issues.performance_detection import (
+    DETECTOR_CLASSES,
+    get_detection_settings,
+    get_span_columns,
+    run_detector_on_data,
+)
+
+
+def run_detectors(event: dict[str, Any], columnar: bool) -> list[PerformanceDetector]:
+    settings = get_detection_settings()
+    columns = get_span_columns(event) if columnar else None
+    detectors = [detector_class(settings, event) for detector_class in DETECTOR_CLASSES]
+    for detector in detectors:
+        run_detector_on_data(detector, event, columns)
+    return detectors
+
+
+def test_from_spans():
+    event = create_event(
+        [
+            create_span("db", 100.0, "SELECT 1"),
+            create_span("http.client", 250.0, "GET /"),
+            create_span("db", 50.0, "SELECT 1"),
+            {"span_id": "c" * 16},
+        ]
+    )
+    root, child, grandchild, orphan = event["spans"]
+    root["span_id"] = "a" * 16
+    root["parent_span_id"] = "e" * 16
+    child["span_id"] = "b" * 16
+    child["parent_span_id"] = root["span_id"]
+    grandchild["span_id"] = "f" * 16
+    grandchild["parent_span_id"] = child["span_id"]
+    orphan["parent_span_id"] = "d" * 16
+
+    columns = SpanColumns.from_spans(event["spans"])
+
+    assert len(columns) == 4
+    assert list(columns.duration_ms) == pytest.approx([100.0, 250.0, 50.0, 0.0])
+    assert columns.ops == ["db", "http.client", ""]
+    assert list(columns.op_codes) == [0, 1, 0, 2]
+    assert columns.description_hashes[0] == columns.description_hashes[2]
+    assert columns.description_hashes[0] != columns.description_hashes[1]
+    assert list(columns.parent_indexes) == [-1, 0, 1, -1]
+
+    mask = columns.op_mask(lambda op: op.startswith("db")) & columns.min_duration_mask(100.0)
+    assert list(columns.iter_spans(mask)) == [root]
+
+
+def test_malformed_timestamps():
+    event = create_event([create_span("db", 100.0)])
+    event["spans"][0]["timestamp"] = None
+
+    assert get_span_columns(event) is None
+
+
+@django_db_all
+@pytest.mark.parametrize("event_name", sorted(EVENTS))
+def test_parity_with_span_walk(event_name):
+    expected = run_detectors(get_event(event_name), columnar=False)
+    actual = run_detectors(get_event(event_name), columnar=True)
+
+    for expected_detector, actual_detector in zip(expected, actual):
+        assert actual_detector.stored_problems == expected_detector.stored_problems
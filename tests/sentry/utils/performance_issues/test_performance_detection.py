@@ -492,6 +492,36 @@ class PerformanceDetectionTest(TestCase):
         pre_checked_keys = ["sdk_name", "is_early_adopter", "browser_name", "uncompressed_assets"]
         assert not any([v for k, v in tags.items() if k not in pre_checked_keys])
 
+    @patch("sentry.utils.metrics.timing")
+    @patch(
+        "sentry.utils.performance_issues.performance_detection.DETECTOR_DURATION_SAMPLE_RATE", 1.0
+    )
+    def test_reports_detector_durations(self, timing_mock):
+        event = get_event("n-plus-one-in-django-index-view")
+        _detect_performance_problems(event, Mock(), self.project)
+
+        timed_detectors = {
+            call.kwargs["tags"]["detector"]
+            for call in timing_mock.mock_calls
+            if call.args[0] == "performance.performance_issue.detector_duration"
+        }
+        assert DetectorType.N_PLUS_ONE_DB_QUERIES.value in timed_detectors
+        assert DetectorType.SLOW_DB_QUERY.value in timed_detectors
+
+    @patch("sentry.utils.metrics.timing")
+    @patch(
+        "sentry.utils.performance_issues.performance_detection.DETECTOR_DURATION_SAMPLE_RATE", 0.0
+    )
+    def test_skips_detector_durations_when_not_sampled(self, timing_mock):
+        event = get_event("n-plus-one-in-django-index-view")
+        _detect_performance_problems(event, Mock(), self.project)
+
+        assert not [
+            call
+            for call in timing_mock.mock_calls
+            if call.args[0] == "performance.performance_issue.detector_duration"
+        ]
+
 
 @no_silo_test
 class DetectorTypeToGroupTypeTest(unittest.TestCase):
@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+from sentry.testutils.performance_issues.event_generators import create_span, get_event
+from sentry.utils.performance_issues.base import fingerprint_span
+from sentry.utils.performance_issues.performance_detection import (
+    DETECTOR_CLASSES,
+    get_detection_settings,
+    run_detectors_on_data,
+)
+from sentry.utils.performance_issues.span_features import SpanFeatureCache
+
+
+def test_features():
+    span = create_span("db", 250.0, "  select * from users  ")
+    cache = SpanFeatureCache([span])
+    features = cache.get(span)
+
+    assert features is cache.get(span)
+    assert features.duration == timedelta(milliseconds=250)
+    assert features.duration_ms == 250.0
+    assert features.fingerprint == fingerprint_span(span)
+    assert features.normalized_description == "select * from users"
+    assert features.is_select_query
+
+
+def test_features_are_per_span():
+    spans = [create_span("db", 100.0), create_span("db", 100.0)]
+    cache = SpanFeatureCache(spans)
+
+    assert cache.get(spans[0]) is not cache.get(spans[1])
+
+
+def test_detectors_share_features():
+    event = get_event("n-plus-one-in-django-index-view")
+    settings = get_detection_settings()
+    detectors = [detector_class(settings, event) for detector_class in DETECTOR_CLASSES]
+
+    run_detectors_on_data(detectors, event)
+
+    eligible = [detector for detector in detectors if detector.is_event_eligible(event)]
+    assert len({id(detector.span_features) for detector in eligible}) == 1